@@ -0,0 +1,100 @@
+# built-in dependencies
+import sys
+import json
+import argparse
+from typing import List, Optional
+
+# project dependencies
+from benchmarks import suite
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="benchmarks/cli.py")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark key generation, encryption, homomorphic operations "
+        "and decryption of LightPHE algorithms",
+    )
+    parser.add_argument(
+        "--algorithms",
+        nargs="+",
+        choices=suite.ALGORITHMS,
+        help="algorithms to benchmark. Default is all algorithms.",
+    )
+    parser.add_argument(
+        "--key-sizes",
+        nargs="+",
+        type=int,
+        help="key sizes in bits. Default is a set of sizes per algorithm.",
+    )
+    parser.add_argument(
+        "--operations",
+        nargs="+",
+        choices=suite.OPERATIONS,
+        help="operations to benchmark. Default is all operations.",
+    )
+    parser.add_argument("--iterations", type=int, default=20, help="runs per operation")
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip measuring peak memory with tracemalloc",
+    )
+    parser.add_argument("--output", help="write the report into this json file")
+    parser.add_argument(
+        "--baseline", help="json report of a former run to compare with"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="tolerated relative slow down of p50 latency against baseline",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run benchmarks, store the report and compare it with a baseline
+    Returns:
+        exit code (int): 1 if there is any regression against baseline, 0 otherwise
+    """
+    args = parse_args(argv)
+
+    report = suite.run(
+        algorithms=args.algorithms,
+        key_sizes=args.key_sizes,
+        operations=args.operations,
+        iterations=args.iterations,
+        memory=not args.no_memory,
+    )
+
+    if args.output is not None:
+        with open(args.output, "w", encoding="UTF-8") as file:
+            json.dump(report, file, indent=2)
+        logger.info(f"report is stored in {args.output}")
+
+    if args.baseline is None:
+        return 0
+
+    with open(args.baseline, "r", encoding="UTF-8") as file:
+        baseline = json.load(file)
+
+    regressions = suite.compare(report, baseline, threshold=args.threshold)
+    for result, base, slow_down in regressions:
+        logger.error(
+            f"{result['algorithm']} ({result['key_size']} bits) {result['operation']}"
+            f" is {slow_down:.0%} slower: p50 {base['p50_ms']:.3f} ms"
+            f" -> {result['p50_ms']:.3f} ms"
+        )
+
+    if regressions:
+        return 1
+
+    logger.info("no regression against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,271 @@
+# built-in dependencies
+import os
+import sys
+import time
+import random
+import platform
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+# project dependencies
+from lightphe import LightPHE
+from lightphe.models.Algorithm import Algorithm
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="benchmarks/suite.py")
+
+# key sizes benchmarked by default. key size is discarded for elliptic curve
+# elgamal, its curve determines the key. boneh-goh-nissim and naccache-stern
+# decryption solve discrete logarithms, so they are kept small.
+DEFAULT_KEY_SIZES: Dict[str, List[Optional[int]]] = {
+    Algorithm.RSA: [1024, 2048],
+    Algorithm.ElGamal: [1024, 2048],
+    Algorithm.ExponentialElGamal: [1024, 2048],
+    Algorithm.EllipticCurveElGamal: [None],
+    Algorithm.Paillier: [1024, 2048],
+    Algorithm.DamgardJurik: [1024, 2048],
+    Algorithm.OkamotoUchiyama: [1024, 2048],
+    Algorithm.Benaloh: [1024, 2048],
+    Algorithm.NaccacheStern: [1024],
+    Algorithm.GoldwasserMicali: [1024, 2048],
+    Algorithm.SanderYoungYung: [1024],
+    Algorithm.BonehGohNissim: [64],
+}
+
+ALGORITHMS: List[str] = list(DEFAULT_KEY_SIZES.keys())
+
+OPERATIONS = [
+    "keygen",
+    "encrypt",
+    "decrypt",
+    "add",
+    "multiply",
+    "xor",
+    "and",
+    "scalar_multiply",
+    "reencrypt",
+    "tensor_encrypt",
+    "tensor_dot",
+]
+
+# key generation is slow for large keys, it is repeated less
+KEYGEN_ITERATIONS = 3
+
+TENSOR_SIZE = 16
+
+# small plaintexts are valid for every algorithm
+M1, M2, CONSTANT = 17, 23, 3
+
+
+def run(
+    algorithms: Optional[List[str]] = None,
+    key_sizes: Optional[List[int]] = None,
+    operations: Optional[List[str]] = None,
+    iterations: int = 20,
+    memory: bool = True,
+) -> dict:
+    """
+    Run benchmarks for algorithms, key sizes and operations
+    Args:
+        algorithms (list): algorithm names. Default is all algorithms.
+        key_sizes (list): key sizes in bits. Default is DEFAULT_KEY_SIZES.
+        operations (list): operations in OPERATIONS. Default is all operations.
+        iterations (int): number of times each operation is run
+        memory (bool): measure peak memory of operations with tracemalloc
+    Returns:
+        report (dict): metadata of the environment and results
+    """
+    results = []
+    for algorithm_name in algorithms or ALGORITHMS:
+        if algorithm_name not in DEFAULT_KEY_SIZES:
+            raise ValueError(f"unimplemented algorithm - {algorithm_name}")
+
+        sizes = DEFAULT_KEY_SIZES[algorithm_name]
+        if key_sizes is not None and sizes != [None]:
+            sizes = key_sizes
+
+        for key_size in sizes:
+            results += run_algorithm(
+                algorithm_name=algorithm_name,
+                key_size=key_size,
+                operations=operations or OPERATIONS,
+                iterations=iterations,
+                memory=memory,
+            )
+
+    return {"meta": environment(), "results": results}
+
+
+def run_algorithm(
+    algorithm_name: str,
+    key_size: Optional[int],
+    operations: List[str],
+    iterations: int,
+    memory: bool = True,
+) -> List[dict]:
+    """
+    Run benchmarks of an algorithm for a key size. Operations the algorithm is
+    not homomorphic for are skipped.
+    Returns:
+        results (list): one result per operation
+    """
+    cs = LightPHE(algorithm_name=algorithm_name, key_size=key_size, precision=2)
+    scenarios = _scenarios(cs, algorithm_name, key_size)
+
+    results = []
+    for operation in operations:
+        if operation not in scenarios:
+            raise ValueError(f"unknown operation - {operation}")
+
+        func = scenarios[operation]
+        try:
+            # warm up and detect unsupported operations
+            func()
+        except ValueError as err:
+            logger.debug(f"{algorithm_name} skips {operation}: {err}")
+            continue
+
+        n = min(iterations, KEYGEN_ITERATIONS) if operation == "keygen" else iterations
+        latencies = measure(func, n)
+        result = {
+            "algorithm": algorithm_name,
+            "key_size": key_size,
+            "operation": operation,
+            "iterations": n,
+            **summarize(latencies),
+            "peak_memory_kb": measure_memory(func) if memory else None,
+        }
+        logger.info(
+            f"{algorithm_name} ({key_size} bits) {operation}: "
+            f"{result['ops_per_sec']:.2f} ops/sec, p50 {result['p50_ms']:.3f} ms, "
+            f"p99 {result['p99_ms']:.3f} ms"
+        )
+        results.append(result)
+
+    return results
+
+
+def _scenarios(
+    cs: LightPHE, algorithm_name: str, key_size: Optional[int]
+) -> Dict[str, Callable[[], object]]:
+    # bitwise cryptosystems encrypt bits
+    m1, m2 = (
+        (1, 0)
+        if algorithm_name in [Algorithm.GoldwasserMicali, Algorithm.SanderYoungYung]
+        else (M1, M2)
+    )
+    c1, c2 = cs.encrypt(m1), cs.encrypt(m2)
+    tensor = [random.uniform(0, 10) for _ in range(TENSOR_SIZE)]
+    weights = [random.uniform(0, 10) for _ in range(TENSOR_SIZE)]
+    state: dict = {}
+
+    def encrypted_tensor():
+        # created lazily, encrypting tensor is a benchmark on its own
+        if "value" not in state:
+            state["value"] = cs.encrypt(tensor, silent=True)
+        return state["value"]
+
+    return {
+        "keygen": lambda: LightPHE(algorithm_name=algorithm_name, key_size=key_size),
+        "encrypt": lambda: cs.encrypt(m1),
+        "decrypt": lambda: cs.decrypt(c1),
+        "add": lambda: c1 + c2,
+        "multiply": lambda: c1 * c2,
+        "xor": lambda: c1 ^ c2,
+        "and": lambda: c1 & c2,
+        "scalar_multiply": lambda: c1 * CONSTANT,
+        "reencrypt": lambda: cs.regenerate_ciphertext(c1),
+        "tensor_encrypt": lambda: cs.encrypt(tensor, silent=True),
+        "tensor_dot": lambda: encrypted_tensor() @ weights,
+    }
+
+
+def measure(func: Callable[[], object], iterations: int) -> List[float]:
+    """
+    Run a function and return its latencies in seconds
+    """
+    latencies = []
+    for _ in range(iterations):
+        tic = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - tic)
+    return latencies
+
+
+def measure_memory(func: Callable[[], object]) -> float:
+    """
+    Peak memory allocated by a run of function in KB. Measured apart from
+    latencies because tracing memory slows the function down.
+    """
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def summarize(latencies: List[float]) -> dict:
+    """
+    Throughput and latency percentiles of measured latencies
+    """
+    ordered = sorted(latencies)
+    return {
+        "ops_per_sec": len(ordered) / sum(ordered) if sum(ordered) > 0 else 0.0,
+        "p50_ms": percentile(ordered, 50) * 1000,
+        "p99_ms": percentile(ordered, 99) * 1000,
+    }
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    """
+    Percentile of sorted values with linear interpolation
+    """
+    if not ordered:
+        raise ValueError("percentile of empty list cannot be calculated")
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def compare(
+    report: dict, baseline: dict, threshold: float = 0.2
+) -> List[Tuple[dict, dict, float]]:
+    """
+    Find operations slower than baseline
+    Args:
+        report (dict): current run
+        baseline (dict): former run to compare with
+        threshold (float): tolerated relative slow down of p50 latency
+    Returns:
+        regressions (list): (current result, baseline result, relative slow down)
+    """
+    former = {
+        (r["algorithm"], r["key_size"], r["operation"]): r for r in baseline["results"]
+    }
+
+    regressions = []
+    for result in report["results"]:
+        key = (result["algorithm"], result["key_size"], result["operation"])
+        base = former.get(key)
+        if base is None or base["p50_ms"] <= 0:
+            continue
+        slow_down = result["p50_ms"] / base["p50_ms"] - 1
+        if slow_down > threshold:
+            regressions.append((result, base, slow_down))
+    return regressions
+
+
+def environment() -> dict:
+    """
+    Metadata to tell apart reports of different machines and versions
+    """
+    return {
+        "lightphe": LightPHE.__version__,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
@@ -1,38 +1,28 @@
 # built-in dependencies
 import time
-import json
-from typing import Optional, Union, List
-import multiprocessing
-from contextlib import closing
+from typing import Any, Optional, Union, List, Iterable, Iterator, Tuple
 import traceback
 import copy
 
-# 3rd party dependencies
-from tqdm import tqdm
-
 # project dependencies
 from lightphe.models.Homomorphic import Homomorphic
 from lightphe.models.Ciphertext import Ciphertext
 from lightphe.models.Algorithm import Algorithm
-from lightphe.models.Tensor import Fraction, EncryptedTensor
+from lightphe.models.Tensor import Fraction, EncryptedTensor, chunkify
+from lightphe.models.EncryptedArray import EncryptedArray
+from lightphe.models.EncryptedBitset import EncryptedBitset
+from lightphe.models.KeyPool import KeyPool
+from lightphe.models.FixedPointEncoder import FixedPointEncoder
 from lightphe.commons import phe_utils
+from lightphe.commons import key_store
+from lightphe.commons import registry
+from lightphe.commons import instrumentation
+from lightphe.commons import streams
+from lightphe.commons.instrumentation import Metrics
 from lightphe.commons.key_validator import validate_keys
 from lightphe.commons.logger import Logger
 
-# cryptosystems
-from lightphe.cryptosystems.RSA import RSA
-from lightphe.cryptosystems.ElGamal import ElGamal
-from lightphe.cryptosystems.Paillier import Paillier
-from lightphe.cryptosystems.DamgardJurik import DamgardJurik
-from lightphe.cryptosystems.OkamotoUchiyama import OkamotoUchiyama
-from lightphe.cryptosystems.Benaloh import Benaloh
-from lightphe.cryptosystems.NaccacheStern import NaccacheStern
-from lightphe.cryptosystems.GoldwasserMicali import GoldwasserMicali
-from lightphe.cryptosystems.EllipticCurveElGamal import EllipticCurveElGamal
-from lightphe.cryptosystems.SanderYoungYung import SanderYoungYung
-from lightphe.cryptosystems.BonehGohNissim import BonehGohNissim
-
-# pylint: disable=eval-used, simplifiable-if-expression, too-few-public-methods
+# pylint: disable=simplifiable-if-expression, too-few-public-methods, too-many-instance-attributes
 
 logger = Logger(module="lightphe/__init__.py")
 
@@ -52,7 +42,12 @@ class LightPHE:
         form: Optional[str] = None,
         curve: Optional[str] = None,
         plaintext_limit: Optional[int] = None,
+        group: Optional[str] = None,
         max_tries: int = 10000,
+        key_source: Optional[KeyPool] = None,
+        metrics: Optional[Metrics] = None,
+        signed: bool = False,
+        workers: Optional[int] = None,
     ):
         """
         Build LightPHE class
@@ -77,18 +72,45 @@ class LightPHE:
                 This parameter is only used if `algorithm_name` is 'EllipticCurve-ElGamal'.
             plaintext_limit (int, optional): Upper bound for plaintext values.
                 This parameter is only used if `algorithm_name` is 'Benaloh'.
+            group (str, optional): work in a prime order subgroup with short exponents.
+                Options: 'safe-prime' to generate a modulus of key_size bits, or a
+                well-known group such as 'modp2048' (RFC 3526) or 'ffdhe2048' (RFC 7919).
+                Plaintexts of 'ElGamal' must be in [1, q] for subgroup order q then.
+                This parameter is only used if `algorithm_name` is 'ElGamal' or
+                'Exponential-ElGamal'.
             max_tries (int): maximum attempts to generate keys. Default is 10000.
                 RSA, Benaloh, Naccache-Stern and Goldwasser-Micali algorithms
                 need multiple attempts to generate valid keys. Will be discarded
                 for other algorithms.
+            key_source (KeyPool): pool of pre-generated keys to draw keys from
+                instead of generating them if neither keys nor key_file is given
+            metrics (Metrics): record counters and timings of operations run with
+                this instance and its ciphertexts
+            signed (bool): encode negative tensor items into the upper half of the
+                plaintext space instead of encrypting their absolute values as well.
+                Then, negative items cost one ciphertext and sums of items having
+                different signs are restored correctly.
+            workers (int): number of processes searching primes while generating keys.
+                Default is 1, primes are searched in the current process. Will be
+                discarded for EllipticCurve-ElGamal and well-known ElGamal groups.
         """
         self.algorithm_name = algorithm_name
         self.precision = precision
         self.form = form
         self.curve = curve
 
+        precomputations = {}
         if key_file is not None:
-            keys = self.restore_keys(target_file=key_file)
+            keys, precomputations = self.__restore(target_file=key_file)
+        elif keys is None and key_source is not None:
+            keys = key_source.acquire(
+                algorithm_name=algorithm_name,
+                key_size=key_size,
+                form=form,
+                curve=curve,
+                plaintext_limit=plaintext_limit,
+                group=group,
+            )
 
         if keys is not None:
             validate_keys(algorithm_name=algorithm_name, keys=keys)
@@ -100,9 +122,19 @@ class LightPHE:
             form=form,
             curve=curve,
             plaintext_limit=plaintext_limit,
+            group=group,
             max_tries=max_tries,
+            workers=workers,
         )
 
+        if precomputations:
+            self.cs.set_precomputations(precomputations)
+
+        self.metrics = metrics
+        self.cs.metrics = metrics
+        self.signed = signed
+        self.__public_cs: Optional[Homomorphic] = None
+
     def __build_cryptosystem(
         self,
         algorithm_name: str = "Paillier",
@@ -111,19 +143,10 @@ class LightPHE:
         form: Optional[str] = None,
         curve: Optional[str] = None,
         plaintext_limit: Optional[int] = None,
+        group: Optional[str] = None,
         max_tries: int = 10000,
-    ) -> Union[
-        RSA,
-        ElGamal,
-        Paillier,
-        DamgardJurik,
-        OkamotoUchiyama,
-        Benaloh,
-        NaccacheStern,
-        EllipticCurveElGamal,
-        SanderYoungYung,
-        BonehGohNissim,
-    ]:
+        workers: Optional[int] = None,
+    ) -> Homomorphic:
         """
         Build a cryptosystem among partially homomorphic algorithms
         Args:
@@ -144,58 +167,39 @@ class LightPHE:
                 This parameter is only used if `algorithm_name` is 'EllipticCurve-ElGamal'.
             plaintext_limit (int, optional): Upper bound for plaintext values.
                 This parameter is only used if `algorithm_name` is 'Benaloh'.
+            group (str, optional): prime order subgroup of ElGamal.
+                This parameter is only used if `algorithm_name` is 'ElGamal' or
+                'Exponential-ElGamal'.
             max_tries (int): maximum attempts to generate keys. Default is 10000.
                 RSA, Benaloh, Naccache-Stern and Goldwasser-Micali algorithms
                 need multiple attempts to generate valid keys. Will be discarded
                 for other algorithms.
+            workers (int): number of processes searching primes while generating keys.
+                Default is 1.
         Returns
             cryptosystem
         """
-        # build cryptosystem
-        if algorithm_name == Algorithm.RSA:
-            cs = RSA(keys=keys, key_size=key_size, max_tries=max_tries)
-        elif algorithm_name == Algorithm.ElGamal:
-            cs = ElGamal(keys=keys, key_size=key_size)
-        elif algorithm_name == Algorithm.ExponentialElGamal:
-            cs = ElGamal(keys=keys, key_size=key_size, exponential=True)
-        elif algorithm_name == Algorithm.EllipticCurveElGamal:
-            cs = EllipticCurveElGamal(
-                keys=keys, key_size=key_size, form=form, curve=curve
-            )
-        elif algorithm_name == Algorithm.Paillier:
-            cs = Paillier(keys=keys, key_size=key_size)
-        elif algorithm_name == Algorithm.DamgardJurik:
-            cs = DamgardJurik(keys=keys, key_size=key_size)
-        elif algorithm_name == Algorithm.OkamotoUchiyama:
-            cs = OkamotoUchiyama(keys=keys, key_size=key_size)
-        elif algorithm_name == Algorithm.Benaloh:
-            cs = Benaloh(
-                keys=keys,
-                key_size=key_size,
-                plaintext_limit=plaintext_limit,
-                max_tries=max_tries,
-            )
-        elif algorithm_name == Algorithm.NaccacheStern:
-            cs = NaccacheStern(keys=keys, key_size=key_size, max_tries=max_tries)
-        elif algorithm_name == Algorithm.GoldwasserMicali:
-            cs = GoldwasserMicali(keys=keys, key_size=key_size, max_tries=max_tries)
-        elif algorithm_name == Algorithm.SanderYoungYung:
-            cs = SanderYoungYung(
-                keys=keys, key_size=key_size, plaintext_limit=plaintext_limit
-            )
-        elif algorithm_name == Algorithm.BonehGohNissim:
-            cs = BonehGohNissim(keys=keys, key_size=key_size, max_tries=max_tries)
-        else:
-            raise ValueError(f"unimplemented algorithm - {algorithm_name}")
-        return cs
+        # build cryptosystem, its module is imported on first use
+        return registry.build_cryptosystem(
+            algorithm_name=algorithm_name,
+            keys=keys,
+            key_size=key_size,
+            form=form,
+            curve=curve,
+            plaintext_limit=plaintext_limit,
+            group=group,
+            max_tries=max_tries,
+            workers=workers,
+        )
 
     def encrypt(
-        self, plaintext: Union[int, float, list], silent: bool = False
+        self, plaintext: Union[int, float, list, Any], silent: bool = False
     ) -> Union[Ciphertext, EncryptedTensor]:
         """
         Encrypt a plaintext with a built cryptosystem
         Args:
-            plaintext (int, float or tensor): message
+            plaintext (int, float, list or numpy array): message. numpy arrays are
+                encrypted into encrypted tensors having the same shape.
             silent (bool): set this to True if you do not want to see progress bar
         Returns
             ciphertext (from lightphe.models.Ciphertext import Ciphertext): encrypted message
@@ -203,9 +207,21 @@ class LightPHE:
         if self.cs.keys.get("public_key") is None:
             raise ValueError("You must have public key to perform encryption")
 
+        tic = instrumentation.start(self.metrics)
+
+        if phe_utils.is_array(plaintext):
+            encrypted_tensor = self.__encrypt_array(array=plaintext)
+            instrumentation.stop("tensor_encrypt", tic, self.metrics)
+            return encrypted_tensor
+
         if isinstance(plaintext, list):
             # then encrypt tensors
-            return self.__encrypt_tensors(tensor=plaintext, silent=silent)
+            encrypted_tensor = self.__encrypt_tensors(tensor=plaintext, silent=silent)
+            instrumentation.stop("tensor_encrypt", tic, self.metrics)
+            return encrypted_tensor
+
+        # numpy scalars
+        plaintext = phe_utils.to_builtin(plaintext)
 
         ciphertext = self.cs.encrypt(
             plaintext=phe_utils.normalize_input(
@@ -213,27 +229,28 @@ class LightPHE:
             )
         )
 
-        public_keys = self.cs.keys.copy()
-        if public_keys.get("private_key") is not None:
-            del public_keys["private_key"]
+        instrumentation.stop("encrypt", tic, self.metrics)
 
         return Ciphertext(
             algorithm_name=self.algorithm_name,
-            keys=public_keys,
             value=ciphertext,
-            form=self.form,
-            curve=self.curve,
+            cs=self.__public_cryptosystem(),
         )
 
     def decrypt(
-        self, ciphertext: Union[Ciphertext, EncryptedTensor]
-    ) -> Union[int, List[int], List[float]]:
+        self,
+        ciphertext: Union[Ciphertext, EncryptedTensor, EncryptedBitset],
+        as_numpy: bool = False,
+    ) -> Union[int, float, List[int], List[float], Any]:
         """
         Decrypt a ciphertext with a buit cryptosystem
         Args:
             ciphertext (from lightphe.models.Ciphertext import Ciphertext): encrypted message
+            as_numpy (bool): restore encrypted tensors and bitsets into numpy arrays
         Returns:
-            plaintext (int): restored message
+            plaintext (int): restored message. encrypted tensors are restored into
+                lists nested as their shapes (flat list for 1-d tensors) or into
+                numpy arrays. encrypted bitsets are restored into lists of integers.
         """
         if self.cs.keys.get("private_key") is None:
             raise ValueError("You must have private key to perform decryption")
@@ -241,11 +258,207 @@ class LightPHE:
         if self.cs.keys.get("public_key") is None:
             raise ValueError("You must have public key to perform decryption")
 
+        tic = instrumentation.start(self.metrics)
+
         if isinstance(ciphertext, EncryptedTensor):
             # then this is encrypted tensor
-            return self.__decrypt_tensors(encrypted_tensor=ciphertext)
+            plain_tensor = self.__decrypt_tensors(
+                encrypted_tensor=ciphertext, as_numpy=as_numpy
+            )
+            instrumentation.stop("tensor_decrypt", tic, self.metrics)
+            return plain_tensor
+
+        if isinstance(ciphertext, EncryptedBitset):
+            values = ciphertext.decrypt(cs=self.cs, as_numpy=as_numpy)
+            instrumentation.stop("bitset_decrypt", tic, self.metrics)
+            return values
+
+        plaintext = self.cs.decrypt(ciphertext=ciphertext.value)
+        instrumentation.stop("decrypt", tic, self.metrics)
+        return plaintext
+
+    def encrypt_to_file(
+        self, plaintexts: Iterable[int], target_file: str
+    ) -> EncryptedArray:
+        """
+        Encrypt many plaintexts straight into a memory-mapped encrypted array file
+        Args:
+            plaintexts (iterable of int): messages. consumed lazily, so generators are welcome.
+            target_file (str): file to store ciphertexts
+        Returns:
+            encrypted array (EncryptedArray): on-disk ciphertexts supporting
+                slicing, lazy iteration and streaming sum / weighted sum
+        """
+        if self.cs.keys.get("public_key") is None:
+            raise ValueError("You must have public key to perform encryption")
+
+        ciphertexts = (
+            self.cs.encrypt(
+                plaintext=phe_utils.normalize_input(
+                    value=plaintext, modulo=self.cs.plaintext_modulo
+                )
+            )
+            for plaintext in plaintexts
+        )
+
+        return EncryptedArray.create(
+            target_file=target_file,
+            cs=self.__public_cryptosystem(),
+            ciphertexts=ciphertexts,
+            algorithm_name=self.algorithm_name,
+        )
+
+    def encrypt_stream(
+        self,
+        source: Any,
+        chunk_size: int = 1000,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+    ) -> Iterator[EncryptedTensor]:
+        """
+        Encrypt a stream of plaintexts chunk by chunk. Only a bounded number of
+            chunks is read ahead of the consumer, so sources larger than memory
+            can be encrypted straight to disk or a socket.
+        Args:
+            source: iterable of int or float (e.g. a generator), numpy array,
+                or path of a .csv or .npy file. read in row-major order.
+            chunk_size (int): number of plaintexts per encrypted chunk
+            workers (int): number of processes. default is number of cpus.
+                Chunks are encrypted in the current process if it is 1.
+            max_pending (int): maximum number of chunks being encrypted while
+                the consumer has not taken former ones. default is 2 * workers.
+        Returns:
+            encrypted chunks (iterator of EncryptedTensor): in order of the source
+        """
+        if self.cs.keys.get("public_key") is None:
+            raise ValueError("You must have public key to perform encryption")
+
+        # pylint: disable=import-outside-toplevel
+        import multiprocessing
+
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be positive but it is {chunk_size}")
+
+        workers = workers or multiprocessing.cpu_count()
+        max_pending = max_pending or 2 * workers
+
+        chunks = streams.chunked(streams.read_plaintexts(source), chunk_size)
+
+        return self.__encrypt_chunks(
+            chunks=chunks, workers=workers, max_pending=max_pending
+        )
+
+    def __encrypt_chunks(
+        self, chunks: Iterator[list], workers: int, max_pending: int
+    ) -> Iterator[EncryptedTensor]:
+        # pylint: disable=import-outside-toplevel
+        import multiprocessing
+        from collections import deque
+
+        public_cs = self.__public_cryptosystem()
+        encrypted_zero = public_cs.encrypt(plaintext=0)
+        divisor_encrypted = public_cs.encrypt(plaintext=10**self.precision)
+        args = (
+            divisor_encrypted,
+            public_cs,
+            self.precision,
+            encrypted_zero,
+            self.signed,
+        )
+
+        def to_tensor(fractions: List[Fraction]) -> EncryptedTensor:
+            return EncryptedTensor(
+                fractions=fractions,
+                cs=public_cs,
+                precision=self.precision,
+                signed=self.signed,
+            )
 
-        return self.cs.decrypt(ciphertext=ciphertext.value)
+        if workers == 1:
+            for chunk in chunks:
+                tic = instrumentation.start(self.metrics)
+                fractions = encrypt_floats(chunk, *args)
+                instrumentation.stop("stream_chunk", tic, self.metrics)
+                yield to_tensor(fractions)
+            return
+
+        # pool is terminated when the consumer stops early as well
+        with multiprocessing.Pool(workers) as pool:
+            pending: deque = deque()
+            for chunk in chunks:
+                pending.append(pool.apply_async(encrypt_floats, (chunk, *args)))
+                instrumentation.count("pool_tasks", 1, self.metrics)
+                if len(pending) >= max_pending:
+                    # back-pressure: wait for the oldest chunk to be consumed
+                    yield to_tensor(pending.popleft().get())
+
+            while pending:
+                yield to_tensor(pending.popleft().get())
+
+    def __public_cryptosystem(self) -> Homomorphic:
+        """
+        Copy of the cryptosystem having public key only shared by ciphertexts
+            and encrypted tensors. It is built once.
+        """
+        if self.__public_cs is None:
+            # private key and values derived from it are never copied, whereas
+            # metrics and randomness pools are still shared with the cryptosystem
+            public_cs = copy.copy(self.cs)
+            public_cs.keys = {
+                key: value
+                for key, value in self.cs.keys.items()
+                if key != "private_key"
+            }
+            public_cs.clear_precomputations()
+            self.__public_cs = public_cs
+        return self.__public_cs
+
+    def __encrypt_array(self, array: Any) -> EncryptedTensor:
+        """
+        Encrypt a numpy array. Values are encoded in numpy at once, then
+            encoded values are encrypted in parallel.
+        Args:
+            array (numpy.ndarray): int or float values
+        Returns
+            encrypted tensor having the shape of the array
+        """
+        # pylint: disable=import-outside-toplevel
+        import multiprocessing
+        from contextlib import closing
+
+        encoder = FixedPointEncoder(
+            modulo=self.cs.plaintext_modulo, precision=self.precision
+        )
+        dividends, abs_dividends, signs = encoder.encode_batch(array)
+        encoded = list(zip(dividends, abs_dividends, signs))
+
+        public_cs = self.__public_cryptosystem()
+        encrypted_zero = public_cs.encrypt(plaintext=0)
+        divisor_encrypted = public_cs.encrypt(plaintext=10**self.precision)
+
+        num_workers = max(1, min(len(encoded), multiprocessing.cpu_count()))
+        chunks = chunkify(encoded, num_workers)
+        args = [
+            (chunk, divisor_encrypted, public_cs, encrypted_zero, self.signed)
+            for chunk in chunks
+        ]
+
+        if num_workers == 1:
+            results = [encrypt_encoded(*arg) for arg in args]
+        else:
+            pool_tic = instrumentation.start(self.metrics)
+            with closing(multiprocessing.Pool(num_workers)) as pool:
+                results = pool.starmap(encrypt_encoded, args)
+            instrumentation.stop("pool_dispatch", pool_tic, self.metrics)
+            instrumentation.count("pool_tasks", len(args), self.metrics)
+
+        return EncryptedTensor(
+            fractions=[fraction for result in results for fraction in result],
+            cs=public_cs,
+            precision=self.precision,
+            shape=array.shape,
+            signed=self.signed,
+        )
 
     def __encrypt_tensors(self, tensor: list, silent: bool = False) -> EncryptedTensor:
         """
@@ -258,12 +471,21 @@ class LightPHE:
         """
         encrypted_tensor: List[Fraction] = []
 
+        # pylint: disable=import-outside-toplevel
+        import multiprocessing
+        from contextlib import closing
+        from tqdm import tqdm
+
         encrypted_zero = self.cs.encrypt(plaintext=0)
         divisor_encrypted = self.cs.encrypt(plaintext=10**self.precision)
+        encoder = FixedPointEncoder(
+            modulo=self.cs.plaintext_modulo, precision=self.precision
+        )
 
         num_workers = min(len(tensor), 2 * multiprocessing.cpu_count())
-        logger.debug(f"encrypting tensors in {num_workers} parallel")
+        logger.debug("encrypting tensors in %s parallel", num_workers)
 
+        pool_tic = instrumentation.start(self.metrics)
         with closing(multiprocessing.Pool(num_workers)) as pool:
             funclist = []
 
@@ -276,6 +498,8 @@ class LightPHE:
                         self.cs,
                         self.precision,
                         encrypted_zero,
+                        encoder,
+                        self.signed,
                     ),
                 )
                 funclist.append(f)
@@ -290,46 +514,154 @@ class LightPHE:
                 result = f.get(timeout=10)
                 encrypted_tensor.append(result)
 
-            toc = time.time()
-            logger.debug(f"encryption took {toc - tic} seconds")
+            instrumentation.stop("pool_dispatch", pool_tic, self.metrics)
+            instrumentation.count("pool_tasks", len(funclist), self.metrics)
 
-            public_cs = copy.deepcopy(self.cs)
-            if public_cs.keys.get("private_key") is not None:
-                del public_cs.keys["private_key"]
+            toc = time.time()
+            logger.debug("encryption took %s seconds", toc - tic)
 
             return EncryptedTensor(
                 fractions=encrypted_tensor,
-                cs=public_cs,
+                cs=self.__public_cryptosystem(),
                 precision=self.precision,
+                signed=self.signed,
             )
 
     def __decrypt_tensors(
-        self, encrypted_tensor: EncryptedTensor
-    ) -> Union[List[int], List[float]]:
+        self, encrypted_tensor: EncryptedTensor, as_numpy: bool = False
+    ) -> Union[float, List[Any], Any]:
         """
         Decrypt a given encrypted tensor
         Args:
             encrypted_tensor (list of encrypted tensor)
+            as_numpy (bool): restore into a numpy array
         Returns:
-            List of plain tensors
+            List of plain tensors nested as tensor shape or numpy array
         """
-        plain_tensor = []
+        encoder = FixedPointEncoder(
+            modulo=self.cs.plaintext_modulo, precision=encrypted_tensor.precision
+        )
+        abs_dividends = []
+        divisors = []
+        signs = []
+        # tensor items mostly share the encrypted divisor, decrypt it once
+        decrypted_divisors: dict = {}
         for c in encrypted_tensor.fractions:
             if isinstance(c, Fraction) is False:
                 raise ValueError("Ciphertext items must be type of Fraction")
 
-            sign = c.sign
-            abs_dividend = self.cs.decrypt(ciphertext=c.abs_dividend)
+            if encrypted_tensor.signed:
+                # sign is restored from the upper half of plaintext space
+                value = encoder.to_signed(self.cs.decrypt(ciphertext=c.dividend))
+                abs_dividends.append(abs(value))
+                signs.append(-1 if value < 0 else c.sign)
+            else:
+                abs_dividends.append(self.cs.decrypt(ciphertext=c.abs_dividend))
+                signs.append(c.sign)
             # dividend = self.cs.decrypt(ciphertext=c.dividend)
 
             # TODO: do I really need encrypted divisor? cannot I store current_precision
-            divisor = self.cs.decrypt(ciphertext=c.divisor)
+            key = c.divisor if isinstance(c.divisor, int) else None
+            divisor = decrypted_divisors.get(key) if key is not None else None
+            if divisor is None:
+                divisor = self.cs.decrypt(ciphertext=c.divisor)
+                if key is not None:
+                    decrypted_divisors[key] = divisor
+            divisors.append(divisor)
+
+        plain_tensor = encoder.decode_batch(
+            magnitudes=abs_dividends,
+            signs=signs,
+            divisors=divisors,
+            as_numpy=as_numpy,
+            shape=encrypted_tensor.shape,
+        )
 
-            m = sign * abs_dividend / divisor
+        if as_numpy:
+            return plain_tensor
 
-            plain_tensor.append(m)
+        if encrypted_tensor.ndim == 0:
+            return plain_tensor[0]
+
+        # nest items of multi dimensional tensors
+        for dimension in reversed(encrypted_tensor.shape[1:]):
+            plain_tensor = [
+                plain_tensor[i : i + dimension]
+                for i in range(0, len(plain_tensor), dimension)
+            ]
         return plain_tensor
 
+    def product(
+        self, ciphertexts: Iterable[Ciphertext], workers: Optional[int] = None
+    ) -> Ciphertext:
+        """
+        Homomorphic product of many ciphertexts, e.g. multiplicative aggregation
+            with RSA or ElGamal. A balanced product tree is used instead of
+            multiplying ciphertext objects one by one.
+        Args:
+            ciphertexts (iterable of Ciphertext): encrypted messages
+            workers (int): number of processes calculating subtrees in parallel.
+                Default is 1.
+        Returns:
+            ciphertext (Ciphertext): encrypted product
+        """
+        if self.cs.keys.get("public_key") is None:
+            raise ValueError("You must have public key to perform homomorphic product")
+
+        values = [ciphertext.value for ciphertext in ciphertexts]
+        if len(values) == 0:
+            raise ValueError("Product of no ciphertexts cannot be calculated")
+
+        tic = instrumentation.start(self.metrics)
+        public_cs = self.__public_cryptosystem()
+
+        workers = min(workers or 1, len(values))
+        if workers > 1:
+            # pylint: disable=import-outside-toplevel
+            import multiprocessing
+            from contextlib import closing
+
+            with closing(multiprocessing.Pool(workers)) as pool:
+                values = pool.map(public_cs.multiply_many, chunkify(values, workers))
+
+        result = public_cs.multiply_many(values)
+        instrumentation.stop("product", tic, self.metrics)
+
+        return Ciphertext(
+            algorithm_name=self.algorithm_name, value=result, cs=public_cs
+        )
+
+    def encrypt_bitset(
+        self,
+        values: Union[List[int], Any],
+        bit_width: Optional[int] = None,
+        workers: Optional[int] = None,
+    ) -> EncryptedBitset:
+        """
+        Encrypt unsigned integers bit by bit into fixed width lanes. Bitsets of
+            Goldwasser-Micali support element-wise xor, bitsets of Sander-Young-Yung
+            support element-wise and.
+        Args:
+            values (list of int or numpy array): unsigned integers
+            bit_width (int): number of bits per item. Default is bit length of the largest one.
+            workers (int): number of processes encrypting, combining and decrypting
+                items. Default is 1.
+        Returns:
+            encrypted bitset (EncryptedBitset)
+        """
+        if self.cs.keys.get("public_key") is None:
+            raise ValueError("You must have public key to perform encryption")
+
+        tic = instrumentation.start(self.metrics)
+        bitset = EncryptedBitset.encrypt(
+            values=values,
+            cs=self.__public_cryptosystem(),
+            bit_width=bit_width,
+            workers=workers,
+        )
+        instrumentation.stop("bitset_encrypt", tic, self.metrics)
+        return bitset
+
     def regenerate_ciphertext(self, ciphertext: Ciphertext) -> Ciphertext:
         """
         Generate a different ciphertext belonging to same plaintext
@@ -341,24 +673,81 @@ class LightPHE:
         if self.cs.keys.get("public_key") is None:
             raise ValueError("You must have public key to perform decryption")
 
-        ciphertext_new = self.cs.reencrypt(ciphertext=ciphertext.value)
+        tic = instrumentation.start(self.metrics)
+        public_cs = self.__public_cryptosystem()
+        ciphertext_new = public_cs.reencrypt(ciphertext=ciphertext.value)
+        instrumentation.stop("reencrypt", tic, self.metrics)
         return Ciphertext(
-            algorithm_name=self.algorithm_name, keys=self.cs.keys, value=ciphertext_new
+            algorithm_name=self.algorithm_name, value=ciphertext_new, cs=public_cs
         )
 
-    def export_keys(self, target_file: str, public: bool = False) -> None:
+    def regenerate_many(
+        self, ciphertexts: Iterable[Ciphertext], workers: Optional[int] = None
+    ) -> List[Ciphertext]:
+        """
+        Generate different ciphertexts belonging to same plaintexts, e.g. to refresh
+            ciphertexts in a shuffle. Cryptosystems share precomputations across the
+            batch, e.g. fixed base tables in ElGamal or randomness pools in
+            Goldwasser-Micali and Sander-Young-Yung.
+        Args:
+            ciphertexts (iterable of Ciphertext): encrypted messages
+            workers (int): number of processes re-encrypting chunks in parallel.
+                Default is 1.
+        Returns:
+            ciphertexts (list of Ciphertext): in order of the given ones
+        """
+        if self.cs.keys.get("public_key") is None:
+            raise ValueError("You must have public key to perform re-encryption")
+
+        values = [ciphertext.value for ciphertext in ciphertexts]
+        if len(values) == 0:
+            return []
+
+        tic = instrumentation.start(self.metrics)
+        public_cs = self.__public_cryptosystem()
+
+        workers = min(workers or 1, len(values))
+        if workers > 1:
+            # pylint: disable=import-outside-toplevel
+            import multiprocessing
+            from contextlib import closing
+
+            with closing(multiprocessing.Pool(workers)) as pool:
+                chunks = pool.map(public_cs.reencrypt_many, chunkify(values, workers))
+            values = [value for chunk in chunks for value in chunk]
+        else:
+            values = public_cs.reencrypt_many(values)
+        instrumentation.stop("reencrypt_many", tic, self.metrics)
+
+        return [
+            Ciphertext(algorithm_name=self.algorithm_name, value=value, cs=public_cs)
+            for value in values
+        ]
+
+    def export_keys(
+        self,
+        target_file: str,
+        public: bool = False,
+        binary: bool = False,
+        precomputations: bool = False,
+    ) -> None:
         """
         Export keys to a file
         Args:
             target_file (str): target file name
             public (bool): set this to True if you will publish this
                 to publicly.
+            binary (bool): set this to True to store keys in binary form.
+                Tables in precomputations are memory-mapped when binary keys are restored.
+            precomputations (bool): set this to True to export values derived from
+                private key (e.g. modular inverses, DLP tables) as well. Then, they will
+                not be calculated again when keys are restored. Discarded if public is True.
         """
-        keys = self.cs.keys
-        private_key = None
-        if public is True and keys.get("private_key") is not None:
-            private_key = keys["private_key"]
-            del keys["private_key"]
+        keys = {
+            kind: value
+            for kind, value in self.cs.keys.items()
+            if public is False or kind != "private_key"
+        }
 
         if public is False:
             logger.warn(
@@ -366,12 +755,17 @@ class LightPHE:
                 "Do not share this to anyone"
             )
 
-        with open(target_file, "w", encoding="UTF-8") as file:
-            file.write(json.dumps(keys))
-
-        # restore private key if you dropped
-        if private_key is not None:
-            self.cs.keys["private_key"] = private_key
+        key_store.dump(
+            target_file=target_file,
+            keys=keys,
+            algorithm_name=self.algorithm_name,
+            precomputations=(
+                self.cs.get_precomputations()
+                if precomputations is True and public is False
+                else None
+            ),
+            binary=binary,
+        )
 
     def restore_keys(self, target_file: str) -> dict:
         """
@@ -381,13 +775,24 @@ class LightPHE:
         Returns:
             keys (dict): private public key pair
         """
-        with open(target_file, "r", encoding="UTF-8") as file:
-            dict_str = file.read()
+        keys, _ = self.__restore(target_file=target_file)
+        return keys
+
+    def __restore(self, target_file: str) -> Tuple[dict, dict]:
+        """
+        Restore keys and precomputations from a file
+        Args:
+            target_file (str): target file name
+        Returns:
+            keys (dict): private public key pair
+            precomputations (dict): values derived from private key
+        """
+        keys, precomputations, algorithm_name = key_store.load(target_file)
 
-        keys = eval(dict_str)
-        if not isinstance(keys, dict):
-            raise ValueError(
-                f"The content of the file {target_file} does not represent a valid dictionary."
+        if algorithm_name is not None and algorithm_name != self.algorithm_name:
+            logger.warn(
+                f"Keys in {target_file} were exported for {algorithm_name}"
+                f" but they are restored for {self.algorithm_name}"
             )
 
         if "private_key" in keys.keys():
@@ -396,7 +801,7 @@ class LightPHE:
             logger.info(f"public key is restored from {target_file}")
         else:
             raise ValueError(f"File {target_file} must have public_key key")
-        return keys
+        return keys, precomputations
 
     def create_ciphertext_obj(self, ciphertext: Union[int, tuple, list]) -> Ciphertext:
         """
@@ -408,7 +813,7 @@ class LightPHE:
             Ciphertext
         """
         return Ciphertext(
-            algorithm_name=self.algorithm_name, keys=self.cs.keys, value=ciphertext
+            algorithm_name=self.algorithm_name, value=ciphertext, cs=self.cs
         )
 
 
@@ -418,6 +823,8 @@ def encrypt_float(
     cs: Homomorphic,
     precision: int,
     encrypted_zero: int,
+    encoder: Optional[FixedPointEncoder] = None,
+    signed: bool = False,
 ) -> Fraction:
     """
     Encrypt a float value
@@ -427,73 +834,101 @@ def encrypt_float(
         cs (Homomorphic): cryptosystem itself
         precision (int): define how many digits after dot
         encrypted_zero (int): pre-calculated encrypted value of 0
+        encoder (FixedPointEncoder): pre-built encoder for precision
+        signed (bool): encrypt negative values once in signed encoding
     Returns:
         result (Fraction): encrypted float value
     """
     try:
-        if m == 0:
-            # this is very common in VGG-Face embeddings
-            c = Fraction(
-                dividend=encrypted_zero,
-                divisor=divisor_encrypted,
-                abs_dividend=encrypted_zero,
-                sign=1,
-            )
-        elif isinstance(m, int):
-            dividend_encrypted = cs.encrypt(
-                plaintext=(m % cs.plaintext_modulo) * pow(10, precision)
-            )
-            abs_dividend_encrypted = (
-                dividend_encrypted
-                if m > 0
-                else cs.encrypt(
-                    plaintext=(abs(m) % cs.plaintext_modulo) * pow(10, precision)
-                )
-            )
-            # divisor_encrypted = self.cs.encrypt(plaintext=pow(10, self.precision))
-            c = Fraction(
-                dividend=dividend_encrypted,
-                divisor=divisor_encrypted,
-                abs_dividend=abs_dividend_encrypted,
-                sign=1 if m >= 0 else -1,
-            )
-        elif isinstance(m, float):
-            # got `int too large to convert float` while m mod plaintext modulo
-            # when security level is set to 128
-            dividend, _ = phe_utils.fractionize(
-                value=(m % cs.plaintext_modulo if m > cs.plaintext_modulo else m),
-                modulo=cs.plaintext_modulo,
-                precision=precision,
-            )
-            abs_dividend = (
-                dividend
-                if m > 0
-                else phe_utils.fractionize(
-                    value=(
-                        abs(m) % cs.plaintext_modulo
-                        if abs(m) > cs.plaintext_modulo
-                        else abs(m)
-                    ),
-                    modulo=cs.plaintext_modulo,
-                    precision=precision,
-                )[0]
-            )
-            dividend_encrypted = cs.encrypt(plaintext=dividend)
-            abs_dividend_encrypted = (
-                dividend_encrypted if m > 0 else cs.encrypt(plaintext=abs_dividend)
-            )
-            # divisor_encrypted = self.cs.encrypt(plaintext=_divisor)
-            c = Fraction(
-                dividend=dividend_encrypted,
-                divisor=divisor_encrypted,
-                abs_dividend=abs_dividend_encrypted,
-                sign=1 if m >= 0 else -1,
-            )
-        else:
+        if not isinstance(m, (int, float)):
             raise ValueError(f"unimplemented type - {type(m)}")
 
-        return c
+        encoder = encoder or FixedPointEncoder(
+            modulo=cs.plaintext_modulo, precision=precision
+        )
+        encoded = (encoder.encode(m), encoder.encode_magnitude(m), -1 if m < 0 else 1)
+        return encrypt_encoded(
+            [encoded], divisor_encrypted, cs, encrypted_zero, signed
+        )[0]
     except Exception as err:
         logger.error(f"Exception while running encrypt_float: {str(err)}")
         logger.error(traceback.format_exc())
         raise err
+
+
+def encrypt_floats(
+    ms: List[Union[int, float]],
+    divisor_encrypted: int,
+    cs: Homomorphic,
+    precision: int,
+    encrypted_zero: int,
+    signed: bool = False,
+) -> List[Fraction]:
+    """
+    Encrypt a chunk of int or float values
+    Args:
+        ms (list of int or float): messages to encrypt
+        divisor_encrypted (int): pre-calculated encrypted divisor
+        cs (Homomorphic): cryptosystem itself
+        precision (int): define how many digits after dot
+        encrypted_zero (int): pre-calculated encrypted value of 0
+        signed (bool): encrypt negative values once in signed encoding
+    Returns:
+        result (list of Fraction): encrypted values
+    """
+    encoder = FixedPointEncoder(modulo=cs.plaintext_modulo, precision=precision)
+    return [
+        encrypt_float(
+            m, divisor_encrypted, cs, precision, encrypted_zero, encoder, signed
+        )
+        for m in ms
+    ]
+
+
+def encrypt_encoded(
+    encoded: List[Tuple[int, int, int]],
+    divisor_encrypted: int,
+    cs: Homomorphic,
+    encrypted_zero: int,
+    signed: bool = False,
+) -> List[Fraction]:
+    """
+    Encrypt values encoded with FixedPointEncoder
+    Args:
+        encoded (list of tuple): dividend, absolute dividend and sign of values
+        divisor_encrypted (int): pre-calculated encrypted divisor
+        cs (Homomorphic): cryptosystem itself
+        encrypted_zero (int): pre-calculated encrypted value of 0
+        signed (bool): encrypt dividends only, their upper half carries negatives
+    Returns:
+        result (list of Fraction): encrypted values
+    """
+    fractions = []
+    for dividend, abs_dividend, sign in encoded:
+        if abs_dividend == 0:
+            abs_dividend_encrypted = dividend_encrypted = encrypted_zero
+        elif signed:
+            abs_dividend_encrypted = dividend_encrypted = cs.encrypt(plaintext=dividend)
+            sign = 1
+        else:
+            abs_dividend_encrypted = cs.encrypt(plaintext=abs_dividend)
+            dividend_encrypted = (
+                abs_dividend_encrypted if sign > 0 else cs.encrypt(plaintext=dividend)
+            )
+        fractions.append(
+            Fraction(
+                dividend=dividend_encrypted,
+                divisor=divisor_encrypted,
+                abs_dividend=abs_dividend_encrypted,
+                sign=sign,
+            )
+        )
+    return fractions
+
+
+def __getattr__(name: str) -> Any:
+    # cryptosystem classes (e.g. lightphe.Paillier) are imported on first access
+    cls = registry.find_class(name)
+    if cls is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return cls
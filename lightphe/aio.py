@@ -0,0 +1,269 @@
+# built-in dependencies
+import os
+import asyncio
+import functools
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
+
+# project dependencies
+from lightphe import LightPHE
+from lightphe.models.Ciphertext import Ciphertext
+
+# cryptosystem installed into processes of the pool owned by AsyncLightPHE,
+# so it is not sent to workers with every task
+_WORKER = {"cs": None}
+
+
+class AsyncLightPHE:
+    """
+    Asyncio facade of LightPHE. Encryption, decryption and homomorphic
+    aggregation run in an executor, so they do not block the event loop.
+    """
+
+    def __init__(
+        self,
+        cs: LightPHE,
+        executor: Optional[Executor] = None,
+        processes: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ):
+        """
+        Args:
+            cs (LightPHE): built cryptosystem
+            executor (Executor): executor to run operations in. Default is the
+                default executor of the event loop (threads).
+            processes (int): run operations in a process pool of this size owned by
+                this object instead. Cryptosystem is sent to each process once.
+                Close the object with aclose or async with to shut the pool down.
+            max_concurrency (int): maximum number of operations running at once.
+                Default is number of processes or cpus.
+        """
+        if executor is not None and processes is not None:
+            raise ValueError("Either executor or processes can be set, not both")
+
+        self.cs = cs
+        self.__owned_executor: Optional[ProcessPoolExecutor] = None
+        if processes is not None:
+            executor = self.__owned_executor = ProcessPoolExecutor(
+                max_workers=processes, initializer=_install, initargs=(cs,)
+            )
+        self.executor = executor
+
+        self.max_concurrency = max_concurrency or processes or os.cpu_count() or 1
+        if self.max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be positive but it is {self.max_concurrency}"
+            )
+        # created in the running event loop on first use
+        self.__semaphore: Optional[asyncio.Semaphore] = None
+
+    @classmethod
+    async def create(
+        cls,
+        algorithm_name: str,
+        executor: Optional[Executor] = None,
+        processes: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        **kwargs: Any,
+    ) -> "AsyncLightPHE":
+        """
+        Build cryptosystem in an executor, key generation may take seconds
+        Args:
+            algorithm_name (str): algorithm name as in LightPHE
+            executor, processes, max_concurrency: as in AsyncLightPHE
+            kwargs: other arguments of LightPHE such as key_size or keys
+        Returns:
+            async cryptosystem (AsyncLightPHE)
+        """
+        loop = asyncio.get_running_loop()
+        cs = await loop.run_in_executor(
+            executor,
+            functools.partial(LightPHE, algorithm_name=algorithm_name, **kwargs),
+        )
+        return cls(
+            cs=cs,
+            executor=executor,
+            processes=processes,
+            max_concurrency=max_concurrency,
+        )
+
+    async def encrypt(self, plaintext: Any, **kwargs: Any) -> Any:
+        """
+        Encrypt a plaintext in executor, see LightPHE.encrypt
+        """
+        return await self.__call("encrypt", plaintext, **kwargs)
+
+    async def decrypt(self, ciphertext: Any, **kwargs: Any) -> Any:
+        """
+        Decrypt a ciphertext in executor, see LightPHE.decrypt
+        """
+        return await self.__call("decrypt", ciphertext, **kwargs)
+
+    async def regenerate_ciphertext(self, ciphertext: Ciphertext) -> Ciphertext:
+        """
+        Regenerate a ciphertext in executor, see LightPHE.regenerate_ciphertext
+        """
+        return await self.__call("regenerate_ciphertext", ciphertext)
+
+    async def encrypt_many(self, plaintexts: Iterable[Any]) -> List[Any]:
+        """
+        Encrypt plaintexts concurrently
+        Args:
+            plaintexts (iterable): messages
+        Returns:
+            ciphertexts (list): in order of plaintexts
+        """
+        return list(
+            await asyncio.gather(*(self.encrypt(plaintext) for plaintext in plaintexts))
+        )
+
+    async def decrypt_many(self, ciphertexts: Iterable[Any]) -> List[Any]:
+        """
+        Decrypt ciphertexts concurrently
+        Args:
+            ciphertexts (iterable): encrypted messages
+        Returns:
+            plaintexts (list): in order of ciphertexts
+        """
+        return list(
+            await asyncio.gather(
+                *(self.decrypt(ciphertext) for ciphertext in ciphertexts)
+            )
+        )
+
+    async def encrypt_stream(
+        self, plaintexts: Union[Iterable[Any], AsyncIterable[Any]]
+    ) -> AsyncIterator[Any]:
+        """
+        Encrypt a stream of plaintexts. At most max_concurrency plaintexts are
+            read ahead of the consumer.
+        Args:
+            plaintexts (iterable or async iterable): messages
+        Returns:
+            ciphertexts (async iterator): in order of plaintexts
+        """
+        async for ciphertext in self.__map("encrypt", plaintexts):
+            yield ciphertext
+
+    async def decrypt_stream(
+        self, ciphertexts: Union[Iterable[Any], AsyncIterable[Any]]
+    ) -> AsyncIterator[Any]:
+        """
+        Decrypt a stream of ciphertexts. At most max_concurrency ciphertexts are
+            read ahead of the consumer.
+        Args:
+            ciphertexts (iterable or async iterable): encrypted messages
+        Returns:
+            plaintexts (async iterator): in order of ciphertexts
+        """
+        async for plaintext in self.__map("decrypt", ciphertexts):
+            yield plaintext
+
+    async def aggregate(self, ciphertexts: Iterable[Ciphertext]) -> Ciphertext:
+        """
+        Homomorphic sum of ciphertexts. Partial sums are calculated concurrently.
+        Args:
+            ciphertexts (iterable of Ciphertext): encrypted messages
+        Returns:
+            ciphertext (Ciphertext): encrypted sum
+        """
+        items = list(ciphertexts)
+        if not items:
+            raise ValueError("Sum of no ciphertexts cannot be calculated")
+
+        size = -(-len(items) // self.max_concurrency)
+        chunks = [items[i : i + size] for i in range(0, len(items), size)]
+        partials = await asyncio.gather(
+            *(self.__run(_sum_ciphertexts, chunk) for chunk in chunks)
+        )
+        if len(partials) == 1:
+            return partials[0]
+        return await self.__run(_sum_ciphertexts, partials)
+
+    async def aclose(self) -> None:
+        """
+        Shut down the process pool owned by this object
+        """
+        if self.__owned_executor is None:
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.__owned_executor.shutdown)
+        self.__owned_executor = None
+
+    async def __aenter__(self) -> "AsyncLightPHE":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def __map(
+        self, method: str, items: Union[Iterable[Any], AsyncIterable[Any]]
+    ) -> AsyncIterator[Any]:
+        pending: Deque[asyncio.Future] = deque()
+        try:
+            async for item in _iterate(items):
+                pending.append(asyncio.ensure_future(self.__call(method, item)))
+                if len(pending) >= self.max_concurrency:
+                    # back-pressure: wait for the oldest result to be consumed
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            # consumer stopped early
+            for future in pending:
+                future.cancel()
+
+    async def __call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        # workers of the owned pool have the cryptosystem installed already
+        cs = None if self.__owned_executor is not None else self.cs
+        return await self.__run(_call, cs, method, *args, **kwargs)
+
+    async def __run(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        if self.__semaphore is None:
+            self.__semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self.__semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor, functools.partial(func, *args, **kwargs)
+            )
+
+
+async def _iterate(
+    items: Union[Iterable[Any], AsyncIterable[Any]],
+) -> AsyncIterator[Any]:
+    if hasattr(items, "__aiter__"):
+        async for item in items:  # type: ignore[union-attr]
+            yield item
+    else:
+        for item in items:  # type: ignore[union-attr]
+            yield item
+
+
+def _install(cs: LightPHE) -> None:
+    _WORKER["cs"] = cs
+
+
+def _call(cs: Optional[LightPHE], method: str, *args: Any, **kwargs: Any) -> Any:
+    cs = cs if cs is not None else _WORKER["cs"]
+    if cs is None:
+        raise ValueError("Cryptosystem is not installed into this worker")
+    return getattr(cs, method)(*args, **kwargs)
+
+
+def _sum_ciphertexts(ciphertexts: List[Ciphertext]) -> Ciphertext:
+    total = ciphertexts[0]
+    for ciphertext in ciphertexts[1:]:
+        total = total + ciphertext
+    return total
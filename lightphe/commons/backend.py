@@ -0,0 +1,202 @@
+# built-in dependencies
+import math
+from typing import Optional
+
+# project dependencies
+from lightphe.commons import number_theory
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="lightphe/commons/backend.py")
+
+# Big integer arithmetic of cryptosystems. Operations are routed to gmpy2 (GMP)
+# if it is installed, which is much faster for large keys, and to pure python
+# otherwise. Results are always python integers, so ciphertexts and keys do not
+# depend on the backend.
+
+# pylint: disable=import-outside-toplevel, c-extension-no-member
+
+
+class PythonBackend:
+    """
+    Builtin pow and math.gcd, primality tests of sympy
+    """
+
+    name = "python"
+
+    @staticmethod
+    def powmod(base: int, exponent: int, modulus: int) -> int:
+        return pow(base, exponent, modulus)
+
+    @staticmethod
+    def invert(a: int, modulus: int) -> int:
+        return pow(a, -1, modulus)
+
+    @staticmethod
+    def gcd(a: int, b: int) -> int:
+        return math.gcd(a, b)
+
+    @staticmethod
+    def is_prime(n: int) -> bool:
+        from sympy import isprime
+
+        return bool(isprime(n))
+
+    @staticmethod
+    def next_prime(n: int) -> int:
+        from sympy import nextprime
+
+        return int(nextprime(n))
+
+    @staticmethod
+    def jacobi(a: int, n: int) -> int:
+        return number_theory.jacobi(a, n)
+
+
+class Gmpy2Backend:
+    """
+    GMP routines of gmpy2
+    """
+
+    name = "gmpy2"
+
+    def __init__(self):
+        import gmpy2
+
+        self.gmpy2 = gmpy2
+
+    def powmod(self, base: int, exponent: int, modulus: int) -> int:
+        return int(self.gmpy2.powmod(base, exponent, modulus))
+
+    def invert(self, a: int, modulus: int) -> int:
+        try:
+            return int(self.gmpy2.invert(a, modulus))
+        except ZeroDivisionError as err:
+            # same as builtin pow
+            raise ValueError("base is not invertible for the given modulus") from err
+
+    def gcd(self, a: int, b: int) -> int:
+        return int(self.gmpy2.gcd(a, b))
+
+    def is_prime(self, n: int) -> bool:
+        return bool(self.gmpy2.is_prime(n))
+
+    def next_prime(self, n: int) -> int:
+        return int(self.gmpy2.next_prime(n))
+
+    def jacobi(self, a: int, n: int) -> int:
+        if n <= 0 or n % 2 == 0:
+            raise ValueError(
+                f"Jacobi symbol requires an odd positive modulo but got {n}"
+            )
+        return int(self.gmpy2.jacobi(a, n))
+
+
+_active = {"backend": PythonBackend()}
+
+
+def set_backend(name: Optional[str] = None) -> str:
+    """
+    Select big integer backend of cryptosystems
+    Args:
+        name (str): gmpy2 or python. Default is gmpy2 if it is installed.
+    Returns:
+        name (str): selected backend
+    """
+    if name not in (None, "gmpy2", "python"):
+        raise ValueError(f"Unknown backend {name}. Options are gmpy2 and python.")
+
+    if name in (None, "gmpy2"):
+        try:
+            _active["backend"] = Gmpy2Backend()
+            return Gmpy2Backend.name
+        except ImportError as err:
+            if name == "gmpy2":
+                raise ValueError(
+                    "gmpy2 backend requires gmpy2, install it with pip install gmpy2"
+                ) from err
+
+    _active["backend"] = PythonBackend()
+    return PythonBackend.name
+
+
+def get_backend() -> str:
+    """
+    Name of the selected backend
+    Returns:
+        name (str): gmpy2 or python
+    """
+    return _active["backend"].name
+
+
+def powmod(base: int, exponent: int, modulus: int) -> int:
+    """
+    Calculate base^exponent mod modulus
+    Args:
+        base (int): base
+        exponent (int): exponent, negative ones are powers of the inverse
+        modulus (int): modulus
+    Returns:
+        power (int)
+    """
+    return _active["backend"].powmod(base, exponent, modulus)
+
+
+def invert(a: int, modulus: int) -> int:
+    """
+    Calculate modular inverse
+    Args:
+        a (int): integer coprime to modulus
+        modulus (int): modulus
+    Returns:
+        inverse (int): a^-1 mod modulus
+    """
+    return _active["backend"].invert(a, modulus)
+
+
+def gcd(a: int, b: int) -> int:
+    """
+    Calculate greatest common divisor
+    Args:
+        a (int): integer
+        b (int): integer
+    Returns:
+        divisor (int)
+    """
+    return _active["backend"].gcd(a, b)
+
+
+def is_prime(n: int) -> bool:
+    """
+    Check primality
+    Args:
+        n (int): integer
+    Returns:
+        result (bool): True if n is (probably) prime
+    """
+    return _active["backend"].is_prime(n)
+
+
+def next_prime(n: int) -> int:
+    """
+    Find the smallest prime greater than an integer
+    Args:
+        n (int): integer
+    Returns:
+        prime (int)
+    """
+    return _active["backend"].next_prime(n)
+
+
+def jacobi(a: int, n: int) -> int:
+    """
+    Calculate Jacobi symbol (a / n)
+    Args:
+        a (int): integer
+        n (int): odd positive integer
+    Returns:
+        symbol (int): -1, 0 or 1
+    """
+    return _active["backend"].jacobi(a, n)
+
+
+set_backend()
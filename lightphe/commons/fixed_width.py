@@ -0,0 +1,125 @@
+# built-in dependencies
+import mmap
+from collections.abc import Sequence
+from typing import Iterator, List, Union
+
+# pylint: disable=consider-using-enumerate
+
+BYTE_ORDER = "big"
+
+
+def byte_width(modulo: int) -> int:
+    """
+    Find how many bytes are required to store any residue of a given modulo
+    Args:
+        modulo (int): ciphertext or plaintext modulo
+    Returns:
+        width (int): number of bytes
+    """
+    if not isinstance(modulo, int) or modulo < 2:
+        raise ValueError(
+            f"Fixed width encoding requires an integer modulo but got {modulo}"
+        )
+    return ((modulo - 1).bit_length() + 7) // 8
+
+
+def encode(value: int, width: int) -> bytes:
+    """
+    Encode a non-negative integer into a fixed width big-endian byte string
+    Args:
+        value (int): integer to encode
+        width (int): number of bytes
+    Returns:
+        encoded value (bytes)
+    """
+    if not isinstance(value, int):
+        raise ValueError(
+            f"Fixed width encoding is available for integer ciphertexts only but got {type(value)}"
+        )
+    return value.to_bytes(width, BYTE_ORDER)
+
+
+def decode(buffer: Union[bytes, bytearray, memoryview]) -> int:
+    """
+    Decode a fixed width big-endian byte string into an integer
+    Args:
+        buffer (bytes-like): encoded value
+    Returns:
+        value (int): decoded integer
+    """
+    return int.from_bytes(buffer, BYTE_ORDER)
+
+
+def encode_many(values: List[int], width: int) -> bytes:
+    """
+    Encode many integers into a single contiguous buffer
+    Args:
+        values (list of int): integers to encode
+        width (int): number of bytes per integer
+    Returns:
+        encoded values (bytes)
+    """
+    return b"".join(encode(value, width) for value in values)
+
+
+def iter_decode(
+    buffer: Union[bytes, bytearray, memoryview], width: int
+) -> Iterator[int]:
+    """
+    Lazily decode a contiguous buffer of fixed width integers
+    Args:
+        buffer (bytes-like): contiguous buffer
+        width (int): number of bytes per integer
+    Yields:
+        value (int): decoded integer
+    """
+    view = memoryview(buffer)
+    for start in range(0, len(view) - len(view) % width, width):
+        yield int.from_bytes(view[start : start + width], BYTE_ORDER)
+
+
+class FixedWidthArray(Sequence):
+    """
+    Read-only sequence of integers stored contiguously in a fixed width buffer.
+    Integers are decoded on access, so the buffer can be a memory map.
+    """
+
+    def __init__(
+        self,
+        buffer: Union[bytes, bytearray, memoryview, mmap.mmap],
+        width: int,
+        count: int,
+        offset: int = 0,
+    ):
+        """
+        Args:
+            buffer (bytes-like or mmap): underlying storage
+            width (int): number of bytes per integer
+            count (int): number of integers
+            offset (int): position of the first integer in buffer
+        """
+        if offset + width * count > len(buffer):
+            raise ValueError("Buffer is too short for the fixed width array")
+        self.buffer = buffer
+        self.width = width
+        self.count = count
+        self.offset = offset
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("fixed width array index out of range")
+        start = self.offset + index * self.width
+        return decode(self.buffer[start : start + self.width])
+
+    def __iter__(self) -> Iterator[int]:
+        return iter_decode(
+            self.buffer[self.offset : self.offset + self.width * self.count],
+            self.width,
+        )
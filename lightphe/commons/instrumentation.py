@@ -0,0 +1,214 @@
+# built-in dependencies
+import time
+import bisect
+import threading
+from typing import Callable, Dict, List, Optional
+
+# Opt-in counters and timing histograms of hot paths. Nothing is recorded unless
+# instrumentation is enabled process-wide with enable() or a Metrics object is
+# given to a LightPHE instance. When both are off, call sites only pay a check.
+
+# upper bounds of histogram buckets in seconds: 1 microsecond to ~10 minutes
+BUCKET_BOUNDS: List[float] = [1e-6 * 2**i for i in range(30)]
+
+# kinds of recordings passed to listeners
+COUNTER = "counter"
+TIMER = "timer"
+
+_STATE = {"enabled": False}
+
+
+class Histogram:
+    """
+    Distribution of durations in exponentially growing buckets
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+
+    def percentile(self, q: float) -> float:
+        """
+        Upper bound of the bucket the q-th percentile falls in
+        Args:
+            q (float): percentile in [0, 100]
+        Returns:
+            seconds (float): estimated duration, 0 if nothing is observed
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, size in enumerate(self.buckets):
+            seen += size
+            if seen >= rank and size > 0:
+                bound = BUCKET_BOUNDS[i] if i < len(BUCKET_BOUNDS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count > 0 else 0.0,
+            "max": self.max,
+            "mean": self.total / self.count if self.count > 0 else 0.0,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "buckets": dict(zip(BUCKET_BOUNDS + [float("inf")], self.buckets)),
+        }
+
+
+class Metrics:
+    """
+    Container of counters and timing histograms of operations
+    """
+
+    def __init__(self):
+        self.counters: Dict[str, int] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        self.listeners: List[Callable[[str, str, float], None]] = []
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """
+        Increase a counter
+        Args:
+            name (str): counter name, e.g. dlp_iterations
+            value (int): amount to add
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+        for listener in self.listeners:
+            listener(name, COUNTER, value)
+
+    def observe(self, name: str, seconds: float) -> None:
+        """
+        Record duration of an operation. Its counter is increased as well.
+        Args:
+            name (str): operation name, e.g. encrypt
+            seconds (float): duration of the operation
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + 1
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(seconds)
+        for listener in self.listeners:
+            listener(name, TIMER, seconds)
+
+    def add_listener(self, listener: Callable[[str, str, float], None]) -> None:
+        """
+        Register a callback called for every recording, e.g. to feed a metrics system
+        Args:
+            listener (callable): called with name, kind (counter or timer) and value
+        """
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, str, float], None]) -> None:
+        self.listeners.remove(listener)
+
+    def snapshot(self) -> dict:
+        """
+        Export recordings
+        Returns:
+            snapshot (dict): counters and histograms with their percentiles
+        """
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "histograms": {
+                    name: histogram.to_dict()
+                    for name, histogram in self.histograms.items()
+                },
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def __deepcopy__(self, memo: dict) -> "Metrics":
+        # copies of a cryptosystem keep recording into the same metrics
+        return self
+
+    def __reduce__(self):
+        # recordings of worker processes are not sent back, workers get empty metrics
+        return (Metrics, ())
+
+
+# process-wide metrics, recorded while instrumentation is enabled
+GLOBAL_METRICS = Metrics()
+
+
+def enable() -> None:
+    """
+    Start recording into GLOBAL_METRICS for all LightPHE instances
+    """
+    _STATE["enabled"] = True
+
+
+def disable() -> None:
+    """
+    Stop recording into GLOBAL_METRICS
+    """
+    _STATE["enabled"] = False
+
+
+def is_enabled() -> bool:
+    return _STATE["enabled"]
+
+
+def start(metrics: Optional[Metrics] = None) -> Optional[float]:
+    """
+    Start timing an operation
+    Args:
+        metrics (Metrics): metrics of the instance running the operation
+    Returns:
+        tic (float): start time or None if nothing is going to be recorded
+    """
+    if metrics is None and not _STATE["enabled"]:
+        return None
+    return time.perf_counter()
+
+
+def stop(name: str, tic: Optional[float], metrics: Optional[Metrics] = None) -> None:
+    """
+    Record duration of an operation started with start
+    Args:
+        name (str): operation name
+        tic (float): value returned by start
+        metrics (Metrics): metrics of the instance running the operation
+    """
+    if tic is None:
+        return
+    seconds = time.perf_counter() - tic
+    if metrics is not None:
+        metrics.observe(name, seconds)
+    if _STATE["enabled"]:
+        GLOBAL_METRICS.observe(name, seconds)
+
+
+def count(name: str, value: int = 1, metrics: Optional[Metrics] = None) -> None:
+    """
+    Increase a counter such as DLP iterations
+    Args:
+        name (str): counter name
+        value (int): amount to add
+        metrics (Metrics): metrics of the instance running the operation
+    """
+    if metrics is not None:
+        metrics.increment(name, value)
+    if _STATE["enabled"]:
+        GLOBAL_METRICS.increment(name, value)
@@ -0,0 +1,226 @@
+# built-in dependencies
+import ast
+import json
+import mmap
+from typing import Any, Optional, Tuple
+
+# project dependencies
+from lightphe.commons import fixed_width
+
+# pylint: disable=too-many-return-statements
+
+# Exported key files are JSON documents by default. Integers are tagged and written
+# in hexadecimal because parsing decimal strings of multi-kilobit integers is
+# quadratic (and limited to 4300 digits in recent Python versions). Tuples,
+# e.g. elliptic curve points, are tagged to be restored as tuples.
+#
+# The binary form starts with BINARY_MAGIC, an 8 byte header length and the
+# JSON header. Integers and integer tables live in the payload after the header
+# and are referenced from the header with their offsets. Tables are loaded as
+# fixed width arrays over a memory map, so they are not parsed on load.
+
+METADATA_KEY = "lightphe"
+FORMAT_VERSION = 1
+BINARY_MAGIC = b"LPHEKEY1"
+
+INT_TAG = "$int"
+TUPLE_TAG = "$tuple"
+BLOB_TAG = "$blob"
+TABLE_TAG = "$table"
+
+
+class _Payload:
+    """
+    Collects binary payload of a key file while its header is being encoded
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def add_int(self, value: int) -> list:
+        length = max(1, (value.bit_length() + 7) // 8)
+        offset = len(self.buffer)
+        self.buffer += value.to_bytes(length, fixed_width.BYTE_ORDER)
+        return [offset, length]
+
+    def add_table(self, values: list) -> list:
+        width = max(1, max((value.bit_length() + 7) // 8 for value in values))
+        offset = len(self.buffer)
+        self.buffer += fixed_width.encode_many(values, width)
+        return [offset, width, len(values)]
+
+
+def dump(
+    target_file: str,
+    keys: dict,
+    algorithm_name: Optional[str] = None,
+    precomputations: Optional[dict] = None,
+    binary: bool = False,
+) -> None:
+    """
+    Store keys and optionally their precomputations into a file
+    Args:
+        target_file (str): target file name
+        keys (dict): private-public key pair or public key only
+        algorithm_name (str): algorithm the keys belong to
+        precomputations (dict): values derived from keys to skip calculating them on load
+        binary (bool): set this to True to store integers in binary
+    """
+    payload = _Payload() if binary is True else None
+
+    document = {kind: _encode(value, payload) for kind, value in keys.items()}
+    document[METADATA_KEY] = {
+        "version": FORMAT_VERSION,
+        "algorithm": algorithm_name,
+        "precomputations": _encode(precomputations or {}, payload),
+    }
+
+    header = json.dumps(document)
+
+    if payload is None:
+        with open(target_file, "w", encoding="UTF-8") as file:
+            file.write(header)
+        return
+
+    header_bytes = header.encode("UTF-8")
+    with open(target_file, "wb") as file:
+        file.write(BINARY_MAGIC)
+        file.write(fixed_width.encode(len(header_bytes), 8))
+        file.write(header_bytes)
+        file.write(payload.buffer)
+
+
+def load(target_file: str) -> Tuple[dict, dict, Optional[str]]:
+    """
+    Restore keys and their precomputations from a file
+    Args:
+        target_file (str): file created with dump or exported by former versions
+    Returns:
+        keys (dict): private-public key pair or public key only
+        precomputations (dict): values derived from keys
+        algorithm_name (str): algorithm the keys belong to if it is known
+    """
+    with open(target_file, "rb") as file:
+        magic = file.read(len(BINARY_MAGIC))
+
+    if magic == BINARY_MAGIC:
+        document, payload = _read_binary(target_file)
+    else:
+        with open(target_file, "r", encoding="UTF-8") as file:
+            content = file.read()
+        document, payload = _parse_text(content, target_file), None
+
+    if not isinstance(document, dict):
+        raise ValueError(
+            f"The content of the file {target_file} does not represent a valid dictionary."
+        )
+
+    metadata = document.pop(METADATA_KEY, None)
+    if metadata is None:
+        # exported by a former version - integers are plain and tuples are lists
+        return document, {}, None
+
+    if metadata.get("version") != FORMAT_VERSION:
+        raise ValueError(
+            f"Key file {target_file} has unsupported version {metadata.get('version')}"
+        )
+
+    keys = {kind: _decode(value, payload) for kind, value in document.items()}
+    precomputations = _decode(metadata.get("precomputations") or {}, payload)
+    return keys, precomputations, metadata.get("algorithm")
+
+
+def _parse_text(content: str, target_file: str) -> Any:
+    try:
+        return json.loads(content)
+    except ValueError:
+        pass
+
+    # python literals were accepted by former versions - parse them without eval
+    try:
+        return ast.literal_eval(content)
+    except (ValueError, SyntaxError) as err:
+        raise ValueError(
+            f"The content of the file {target_file} does not represent a valid dictionary."
+        ) from err
+
+
+def _read_binary(target_file: str) -> Tuple[Any, memoryview]:
+    with open(target_file, "rb") as file:
+        content = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    header_start = len(BINARY_MAGIC) + 8
+    header_size = fixed_width.decode(content[len(BINARY_MAGIC) : header_start])
+    header = content[header_start : header_start + header_size].decode("UTF-8")
+
+    # tables keep a reference to the memory map, so it lives as long as they do
+    payload = memoryview(content)[header_start + header_size :]
+    return json.loads(header), payload
+
+
+def _encode(value: Any, payload: Optional[_Payload]) -> Any:
+    if value is None or isinstance(value, (bool, float)):
+        return value
+
+    if isinstance(value, int):
+        if payload is not None and value >= 0:
+            return {BLOB_TAG: payload.add_int(value)}
+        return {INT_TAG: hex(value)}
+
+    if isinstance(value, str):
+        return value
+
+    if isinstance(value, tuple):
+        return {TUPLE_TAG: [_encode(item, payload) for item in value]}
+
+    if isinstance(value, dict):
+        return {str(key): _encode(item, payload) for key, item in value.items()}
+
+    if isinstance(value, (list, fixed_width.FixedWidthArray)):
+        if (
+            payload is not None
+            and len(value) > 0
+            and all(
+                isinstance(item, int) and not isinstance(item, bool) and item >= 0
+                for item in value
+            )
+        ):
+            return {TABLE_TAG: payload.add_table(list(value))}
+        return [_encode(item, payload) for item in value]
+
+    raise ValueError(f"Unsupported type {type(value)} in keys")
+
+
+def _decode(value: Any, payload: Optional[memoryview]) -> Any:
+    if isinstance(value, list):
+        return [_decode(item, payload) for item in value]
+
+    if not isinstance(value, dict):
+        return value
+
+    if len(value) == 1:
+        tag, content = next(iter(value.items()))
+        if tag in (INT_TAG, TUPLE_TAG, BLOB_TAG, TABLE_TAG):
+            return _decode_tagged(tag, content, payload)
+
+    return {key: _decode(item, payload) for key, item in value.items()}
+
+
+def _decode_tagged(tag: str, content: Any, payload: Optional[memoryview]) -> Any:
+    if tag == INT_TAG:
+        return int(content, 16)
+
+    if tag == TUPLE_TAG:
+        return tuple(_decode(item, payload) for item in content)
+
+    if payload is None:
+        raise ValueError(f"{tag} is available in binary key files only")
+
+    if tag == BLOB_TAG:
+        offset, length = content
+        return fixed_width.decode(payload[offset : offset + length])
+
+    offset, width, count = content
+    return fixed_width.FixedWidthArray(
+        buffer=payload, width=width, count=count, offset=offset
+    )
@@ -1,37 +1,4 @@
-from typing import Dict, Type
-
-from lightphe.models.Algorithm import Algorithm
-from lightphe.models.Homomorphic import Homomorphic
-from lightphe.cryptosystems.RSA import RSA
-from lightphe.cryptosystems.ElGamal import ElGamal
-from lightphe.cryptosystems.EllipticCurveElGamal import EllipticCurveElGamal
-from lightphe.cryptosystems.Paillier import Paillier
-from lightphe.cryptosystems.DamgardJurik import DamgardJurik
-from lightphe.cryptosystems.OkamotoUchiyama import OkamotoUchiyama
-from lightphe.cryptosystems.Benaloh import Benaloh
-from lightphe.cryptosystems.NaccacheStern import NaccacheStern
-from lightphe.cryptosystems.GoldwasserMicali import GoldwasserMicali
-from lightphe.cryptosystems.SanderYoungYung import SanderYoungYung
-from lightphe.cryptosystems.BonehGohNissim import BonehGohNissim
-
-
-# Map user-facing algorithm names to the class that owns the REQUIRED_KEYS spec.
-# The spec itself lives as a class attribute on each cryptosystem.
-# Exponential-ElGamal reuses ElGamal's key structure.
-_ALGORITHM_TO_CLASS: Dict[str, Type[Homomorphic]] = {
-    Algorithm.RSA: RSA,
-    Algorithm.ElGamal: ElGamal,
-    Algorithm.ExponentialElGamal: ElGamal,
-    Algorithm.EllipticCurveElGamal: EllipticCurveElGamal,
-    Algorithm.Paillier: Paillier,
-    Algorithm.DamgardJurik: DamgardJurik,
-    Algorithm.OkamotoUchiyama: OkamotoUchiyama,
-    Algorithm.Benaloh: Benaloh,
-    Algorithm.NaccacheStern: NaccacheStern,
-    Algorithm.GoldwasserMicali: GoldwasserMicali,
-    Algorithm.SanderYoungYung: SanderYoungYung,
-    Algorithm.BonehGohNissim: BonehGohNissim,
-}
+from lightphe.commons import registry
 
 
 def validate_keys(algorithm_name: str, keys: dict) -> None:
@@ -52,10 +19,9 @@ def validate_keys(algorithm_name: str, keys: dict) -> None:
     Raises:
         ValueError: when required fields are missing or structure is wrong
     """
-    cls = _ALGORITHM_TO_CLASS.get(algorithm_name)
-    if cls is None:
+    if not registry.is_supported(algorithm_name):
         return
-    spec = cls.REQUIRED_KEYS
+    spec = registry.get_class(algorithm_name).REQUIRED_KEYS
 
     if not isinstance(keys, dict):
         raise ValueError(
@@ -4,6 +4,20 @@ from datetime import datetime
 
 # pylint: disable=broad-except
 
+# route logs to handlers of the standard logging module instead of printing them
+_STDLIB = {"enabled": False}
+
+
+def use_stdlib_logging(enabled: bool = True) -> None:
+    """
+    Emit logs through standard logging module loggers named after modules,
+    e.g. lightphe.commons.phe_utils.
+    Then, levels and handlers configured for them decide what is emitted.
+    Args:
+        enabled (bool): set False to print logs to stdout again
+    """
+    _STDLIB["enabled"] = enabled
+
 
 class Logger:
     def __init__(self, module):
@@ -18,25 +32,68 @@ class Logger:
             )
             self.log_level = logging.INFO
 
-    def info(self, message):
-        if self.log_level <= logging.INFO:
-            self.dump_log(message)
+        name = module.replace("/", ".")
+        if name.endswith(".py"):
+            name = name[: -len(".py")]
+        if not name.startswith("lightphe."):
+            name = f"lightphe.{name}"
+        self.stdlib_logger = logging.getLogger(name)
+
+    def is_enabled(self, level: int) -> bool:
+        """
+        Check a level is emitted. Hot loops should check this once before
+        building costly log arguments.
+        Args:
+            level (int): logging level such as logging.DEBUG
+        Returns:
+            result (bool): True if messages of the level are emitted
+        """
+        if _STDLIB["enabled"]:
+            return self.stdlib_logger.isEnabledFor(level)
+        return self.log_level <= level
+
+    def info(self, message, *args):
+        if self.is_enabled(logging.INFO):
+            self.log(logging.INFO, message, *args)
+
+    def debug(self, message, *args):
+        if self.is_enabled(logging.DEBUG):
+            self.log(logging.DEBUG, message, *args)
+
+    def warn(self, message, *args):
+        if self.is_enabled(logging.WARNING):
+            self.log(logging.WARNING, message, *args)
+
+    def error(self, message, *args):
+        if self.is_enabled(logging.ERROR):
+            self.log(logging.ERROR, message, *args)
+
+    def critical(self, message, *args):
+        if self.is_enabled(logging.CRITICAL):
+            self.log(logging.CRITICAL, message, *args)
 
-    def debug(self, message):
-        if self.log_level <= logging.DEBUG:
-            self.dump_log(f"🕷️ {message}")
+    def log(self, level: int, message, *args):
+        """
+        Emit a message without checking its level. Message is formatted with
+        args in printf style only here, so disabled logs do not pay for it.
+        """
+        if _STDLIB["enabled"]:
+            self.stdlib_logger.log(level, message, *args)
+            return
 
-    def warn(self, message):
-        if self.log_level <= logging.WARNING:
-            self.dump_log(f"⚠️ {message}")
+        if args:
+            message = message % args
 
-    def error(self, message):
-        if self.log_level <= logging.ERROR:
-            self.dump_log(f"🔴 {message}")
+        if level == logging.DEBUG:
+            message = f"🕷️ {message}"
+        elif level == logging.WARNING:
+            message = f"⚠️ {message}"
+        elif level == logging.ERROR:
+            message = f"🔴 {message}"
+        elif level == logging.CRITICAL:
+            message = f"💥 {message}"
 
-    def critical(self, message):
-        if self.log_level <= logging.CRITICAL:
-            self.dump_log(f"💥 {message}")
+        self.dump_log(message)
 
     def dump_log(self, message):
         print(f"{str(datetime.now())[2:-7]} - {message}")
@@ -0,0 +1,121 @@
+# built-in dependencies
+import math
+import random
+from typing import List
+
+# Number theoretic routines used on hot paths of cryptosystems. They are pure
+# python and do not depend on sympy.
+
+
+def jacobi(a: int, n: int) -> int:
+    """
+    Calculate Jacobi symbol (a / n) with the binary algorithm. It is Legendre symbol
+        if n is prime. Then, 1 means a is a quadratic residue modulo n, -1 means a is
+        a non-residue and 0 means n divides a. It requires divisions and shifts only,
+        so it is much faster than Euler's criterion a^((n-1)/2) mod n.
+    Args:
+        a (int): integer
+        n (int): odd positive integer
+    Returns:
+        symbol (int): -1, 0 or 1
+    """
+    if n <= 0 or n % 2 == 0:
+        raise ValueError(f"Jacobi symbol requires an odd positive modulo but got {n}")
+
+    a %= n
+    result = 1
+    while a != 0:
+        # (2 / n) = -1 if and only if n = 3 or 5 mod 8
+        zeros = (a & -a).bit_length() - 1
+        a >>= zeros
+        if zeros & 1 and n & 7 in (3, 5):
+            result = -result
+
+        # quadratic reciprocity: sign flips if both a and n are 3 mod 4
+        if a & n & 2:
+            result = -result
+        a, n = n % a, a
+
+    return result if n == 1 else 0
+
+
+def random_squares(n: int, count: int) -> List[int]:
+    """
+    Generate random quadratic residues y^2 mod n for y co-prime to n
+    Args:
+        n (int): modulo
+        count (int): number of residues
+    Returns:
+        squares (list of int)
+    """
+    squares = []
+    while len(squares) < count:
+        y = random.randint(1, n - 1)
+        if math.gcd(y, n) == 1:
+            squares.append(pow(y, 2, n))
+    return squares
+
+
+def random_non_residues(n: int, x: int, count: int) -> List[int]:
+    """
+    Generate random quadratic non-residues x * y^2 mod n for y co-prime to n
+    Args:
+        n (int): modulo
+        x (int): quadratic non-residue modulo n
+        count (int): number of non-residues
+    Returns:
+        non-residues (list of int)
+    """
+    return [(x * square) % n for square in random_squares(n, count)]
+
+
+def fixed_base_table(
+    base: int, modulus: int, exponent_bits: int, window: int = 6
+) -> List[List[int]]:
+    """
+    Precompute powers of a fixed base, so that many exponentiations of it cost a
+        multiplication per window of the exponent instead of a squaring per bit
+    Args:
+        base (int): fixed base
+        modulus (int): modulus
+        exponent_bits (int): maximum bit length of exponents
+        window (int): number of exponent bits per row
+    Returns:
+        table (list of list of int): row i has base^(j * 2^(window * i)) for j < 2^window
+    """
+    table = []
+    for _ in range(0, max(1, exponent_bits), window):
+        row = [1]
+        for _ in range((1 << window) - 1):
+            row.append(row[-1] * base % modulus)
+        table.append(row)
+        base = row[-1] * base % modulus
+    return table
+
+
+def fixed_base_pow(table: List[List[int]], exponent: int, modulus: int) -> int:
+    """
+    Calculate base^exponent mod modulus with a table of fixed_base_table
+    Args:
+        table (list of list of int): precomputed powers of the base
+        exponent (int): non-negative exponent having at most exponent_bits of the table
+        modulus (int): modulus of the table
+    Returns:
+        power (int)
+    """
+    window = (len(table[0]) - 1).bit_length()
+    if exponent.bit_length() > window * len(table):
+        raise ValueError(
+            f"Exponent of {exponent.bit_length()} bits exceeds the table of"
+            f" {window * len(table)} bits"
+        )
+    mask = (1 << window) - 1
+    result = 1
+    for row in table:
+        if exponent == 0:
+            break
+        digit = exponent & mask
+        if digit:
+            result = result * row[digit] % modulus
+        exponent >>= window
+    return result
@@ -1,6 +1,7 @@
 # built-in dependencies
-from typing import Union, Tuple, Optional
-from decimal import Decimal, getcontext
+import sys
+from typing import Any, Union, Tuple, Optional
+from decimal import Context, Decimal
 
 # project dependencies
 from lightphe.commons.logger import Logger
@@ -9,6 +10,9 @@ logger = Logger(module="lightphe/commons/phe_utils.py")
 
 # pylint: disable=no-else-return, no-else-break
 
+# private context, so the global decimal context of the caller is not changed
+DECIMAL_CONTEXT = Context(prec=50)
+
 
 def normalize_input(value: Union[int, float], modulo: Union[int, str]) -> int:
     """
@@ -25,12 +29,15 @@ def normalize_input(value: Union[int, float], modulo: Union[int, str]) -> int:
     elif isinstance(value, int) and isinstance(modulo, int):
         if value > modulo:
             logger.warn(
-                f"Value {value} is greater than modulo {modulo}. Normalizing it to be in the range of modulo."
+                "Value %s is greater than modulo %s. "
+                "Normalizing it to be in the range of modulo.",
+                value,
+                modulo,
             )
         result = value % modulo
     elif isinstance(value, float) and value >= 0:
         dividend, divisor = fractionize(value=value, modulo=modulo)
-        logger.debug(f"{dividend}*{divisor}^-1 mod {modulo}")
+        logger.debug("%s*%s^-1 mod %s", dividend, divisor, modulo)
         result = (dividend * pow(divisor, -1, modulo)) % modulo
     elif isinstance(value, float) and value < 0:
         # TODO: think and implement this later
@@ -44,8 +51,6 @@ def normalize_input(value: Union[int, float], modulo: Union[int, str]) -> int:
 def fractionize(
     value: float, modulo: int, precision: Optional[int] = None
 ) -> Tuple[int, int]:
-    getcontext().prec = 50
-
     if precision is None:
         decimal_places = len(str(value).split(".")[1])
         scaling_factor = 10**decimal_places
@@ -53,7 +58,10 @@ def fractionize(
         scaling_factor = 10**precision
 
     while True:
-        integer_value = int(Decimal(value) * Decimal(scaling_factor)) % modulo
+        integer_value = (
+            int(DECIMAL_CONTEXT.multiply(Decimal(value), Decimal(scaling_factor)))
+            % modulo
+        )
 
         if precision is None:
             break
@@ -71,10 +79,32 @@ def fractionize(
         else:
             break
 
-    logger.debug(f"{integer_value}*{scaling_factor}^-1 mod {modulo}")
+    logger.debug("%s*%s^-1 mod %s", integer_value, scaling_factor, modulo)
     return integer_value, scaling_factor
 
 
+def is_array(value: Any) -> bool:
+    """
+    Check a value is a numpy array without importing numpy
+    """
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def to_builtin(value: Any) -> Any:
+    """
+    Convert numpy arrays into flat lists and numpy scalars into int or float
+    """
+    np = sys.modules.get("numpy")
+    if np is None:
+        return value
+    if isinstance(value, np.ndarray):
+        return value.ravel().tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
 def solve_dlp():
     # TODO: implement this later
     pass
@@ -0,0 +1,256 @@
+# built-in dependencies
+import math
+import random
+from typing import Optional, Sequence, Tuple
+
+# project dependencies
+from lightphe.commons import backend
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="lightphe/commons/primes.py")
+
+# Prime search used in key generation. Candidates are scanned in windows of an
+# arithmetic progression (x = residue mod modulus). Each window is sieved with
+# small primes first, so that the costly primality test runs only for the
+# candidates having no small factor. Companions (c, d) require c * x + d to be
+# prime as well, e.g. p = 2 * a * u + 1 in Naccache-Stern, and they are sieved
+# in the same pass.
+
+SIEVE_LIMIT = 2**12
+WINDOW_SIZE = 2**12
+
+
+def _sieve_of_eratosthenes(limit: int) -> Tuple[int, ...]:
+    is_prime = bytearray([0, 0]) + bytearray(b"\x01") * (limit - 2)
+    for i in range(2, math.isqrt(limit) + 1):
+        if is_prime[i]:
+            is_prime[i * i :: i] = bytes(len(range(i * i, limit, i)))
+    return tuple(i for i, flag in enumerate(is_prime) if flag)
+
+
+SMALL_PRIMES: Tuple[int, ...] = _sieve_of_eratosthenes(SIEVE_LIMIT)
+
+
+def random_prime(
+    low: int,
+    high: int,
+    modulus: int = 1,
+    residue: int = 0,
+    companions: Sequence[Tuple[int, int]] = (),
+    workers: Optional[int] = None,
+) -> int:
+    """
+    Find a random prime x in [low, high) satisfying x = residue mod modulus
+    Args:
+        low (int): inclusive lower bound
+        high (int): exclusive upper bound
+        modulus (int): modulus of the arithmetic progression candidates are picked from
+        residue (int): residue of the candidates for the modulus
+        companions (list of tuples): (c, d) pairs requiring c * x + d to be prime
+        workers (int): number of processes searching candidates.
+            Default is 1, candidates are searched in the current process.
+    Returns:
+        prime (int): the first prime found after a random starting point
+    """
+    low, high = max(2, math.ceil(low)), math.floor(high)
+    residue %= modulus
+
+    first = _align(low, modulus, residue)
+    count = (high - first + modulus - 1) // modulus if high > first else 0
+    if count <= 0:
+        raise ValueError(
+            f"There is no candidate in [{low}, {high}) for residue {residue} mod {modulus}"
+        )
+
+    workers = _resolve_workers(workers, count)
+    sieve_primes = _sieve_primes(low)
+
+    if workers > 1:
+        prime = _search_parallel(
+            first, count, modulus, companions, sieve_primes, workers
+        )
+        if prime is not None:
+            return prime
+        # random windows missed it, cover the whole range sequentially below
+
+    # scan from a random starting point up to high, and wrap around from low
+    offset = random.randrange(count)
+    for start, size in [(offset, count - offset), (0, offset)]:
+        prime = _scan(first + start * modulus, size, modulus, companions, sieve_primes)
+        if prime is not None:
+            return prime
+
+    raise ValueError(
+        f"There is no prime in [{low}, {high}) for residue {residue} mod {modulus}"
+    )
+
+
+def next_prime(
+    value: int,
+    modulus: int = 1,
+    residue: int = 0,
+    companions: Sequence[Tuple[int, int]] = (),
+    limit: Optional[int] = None,
+) -> Optional[int]:
+    """
+    Find the smallest prime greater than value satisfying x = residue mod modulus
+    Args:
+        value (int): exclusive lower bound
+        modulus (int): modulus of the arithmetic progression candidates are picked from
+        residue (int): residue of the candidates for the modulus
+        companions (list of tuples): (c, d) pairs requiring c * x + d to be prime
+        limit (int): exclusive upper bound to stop searching
+    Returns:
+        prime (int): the prime found or None if there is no prime below limit
+    """
+    low = max(2, value + 1)
+    residue %= modulus
+    first = _align(low, modulus, residue)
+    sieve_primes = _sieve_primes(low)
+
+    while limit is None or first < limit:
+        count = WINDOW_SIZE
+        if limit is not None:
+            count = min(count, (limit - first + modulus - 1) // modulus)
+        prime = _scan(first, count, modulus, companions, sieve_primes)
+        if prime is not None:
+            return prime
+        first += count * modulus
+
+    return None
+
+
+def _align(value: int, modulus: int, residue: int) -> int:
+    # smallest x >= value satisfying x = residue mod modulus
+    return value + (residue - value) % modulus
+
+
+def _resolve_workers(workers: Optional[int], count: int) -> int:
+    # pylint: disable=import-outside-toplevel
+    import multiprocessing
+
+    # spawning processes is opt-in, search serially by default
+    if workers is None or workers <= 1:
+        return 1
+
+    # daemonic processes (e.g. pool workers) are not allowed to have children
+    if multiprocessing.current_process().daemon:
+        return 1
+
+    # not worth to distribute a range covered by a few windows
+    if count <= WINDOW_SIZE * workers:
+        return 1
+
+    return workers
+
+
+def _sieve_primes(low: int) -> Tuple[int, ...]:
+    # a small prime may be a candidate itself if it is not less than low
+    return tuple(s for s in SMALL_PRIMES if s < low)
+
+
+def _scan(
+    first: int,
+    count: int,
+    modulus: int,
+    companions: Sequence[Tuple[int, int]],
+    sieve_primes: Tuple[int, ...],
+) -> Optional[int]:
+    # scan count candidates first, first + modulus, ... window by window
+    for window_start in range(0, count, WINDOW_SIZE):
+        prime = _scan_window(
+            first + window_start * modulus,
+            min(WINDOW_SIZE, count - window_start),
+            modulus,
+            companions,
+            sieve_primes,
+        )
+        if prime is not None:
+            return prime
+    return None
+
+
+def _scan_window(
+    first: int,
+    size: int,
+    modulus: int,
+    companions: Sequence[Tuple[int, int]],
+    sieve_primes: Tuple[int, ...],
+) -> Optional[int]:
+    """
+    Find the first prime in a window of candidates first + i * modulus for i < size
+    """
+    if size <= 0:
+        return None
+
+    sieve = bytearray(b"\x01") * size
+    for s in sieve_primes:
+        # c * (first + i * modulus) + d is divisible by s if
+        # i = -(c * first + d) / (c * modulus) mod s. Skip s dividing c * modulus,
+        # then all candidates have the same residue for s.
+        for c, d in [(1, 0), *companions]:
+            step = c * modulus % s
+            if step == 0:
+                continue
+            start = (-(c * first + d) * pow(step, -1, s)) % s
+            sieve[start::s] = bytes(len(range(start, size, s)))
+
+    index = sieve.find(1)
+    while index != -1:
+        candidate = first + index * modulus
+        if backend.is_prime(candidate) and all(
+            backend.is_prime(c * candidate + d) for c, d in companions
+        ):
+            return candidate
+        index = sieve.find(1, index + 1)
+
+    return None
+
+
+def _search_parallel(
+    first: int,
+    count: int,
+    modulus: int,
+    companions: Sequence[Tuple[int, int]],
+    sieve_primes: Tuple[int, ...],
+    workers: int,
+) -> Optional[int]:
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    # each task scans a window from a random starting point. the first prime found
+    # cancels the pending windows, running ones stop after their own window.
+    max_windows = 4 * (count // WINDOW_SIZE + 1)
+    logger.debug("searching prime candidates in %s processes", workers)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        submitted = 0
+        pending = set()
+        try:
+            while True:
+                while len(pending) < 2 * workers and submitted < max_windows:
+                    start = random.randrange(count)
+                    size = min(WINDOW_SIZE, count - start)
+                    pending.add(
+                        executor.submit(
+                            _scan_window,
+                            first + start * modulus,
+                            size,
+                            modulus,
+                            companions,
+                            sieve_primes,
+                        )
+                    )
+                    submitted += 1
+
+                if not pending:
+                    return None
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    prime = future.result()
+                    if prime is not None:
+                        return prime
+        finally:
+            for future in pending:
+                future.cancel()
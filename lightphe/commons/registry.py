@@ -0,0 +1,150 @@
+# built-in dependencies
+import importlib
+from typing import Dict, Optional, Tuple, Type
+
+# project dependencies
+from lightphe.models.Algorithm import Algorithm
+from lightphe.models.Homomorphic import Homomorphic
+
+# Cryptosystem modules and their dependencies (e.g. sympy, lightecc) are imported
+# when an algorithm is used for the first time, not when lightphe is imported.
+# algorithm name -> (module, class name, fixed arguments, arguments passed if given)
+_CRYPTOSYSTEMS: Dict[str, Tuple[str, str, dict, Tuple[str, ...]]] = {
+    Algorithm.RSA: (
+        "lightphe.cryptosystems.RSA",
+        "RSA",
+        {},
+        ("key_size", "max_tries", "workers"),
+    ),
+    Algorithm.ElGamal: (
+        "lightphe.cryptosystems.ElGamal",
+        "ElGamal",
+        {},
+        ("key_size", "group", "workers"),
+    ),
+    Algorithm.ExponentialElGamal: (
+        "lightphe.cryptosystems.ElGamal",
+        "ElGamal",
+        {"exponential": True},
+        ("key_size", "group", "workers"),
+    ),
+    Algorithm.EllipticCurveElGamal: (
+        "lightphe.cryptosystems.EllipticCurveElGamal",
+        "EllipticCurveElGamal",
+        {},
+        ("key_size", "form", "curve"),
+    ),
+    Algorithm.Paillier: (
+        "lightphe.cryptosystems.Paillier",
+        "Paillier",
+        {},
+        ("key_size", "workers"),
+    ),
+    Algorithm.DamgardJurik: (
+        "lightphe.cryptosystems.DamgardJurik",
+        "DamgardJurik",
+        {},
+        ("key_size", "workers"),
+    ),
+    Algorithm.OkamotoUchiyama: (
+        "lightphe.cryptosystems.OkamotoUchiyama",
+        "OkamotoUchiyama",
+        {},
+        ("key_size", "workers"),
+    ),
+    Algorithm.Benaloh: (
+        "lightphe.cryptosystems.Benaloh",
+        "Benaloh",
+        {},
+        ("key_size", "plaintext_limit", "max_tries", "workers"),
+    ),
+    Algorithm.NaccacheStern: (
+        "lightphe.cryptosystems.NaccacheStern",
+        "NaccacheStern",
+        {},
+        ("key_size", "max_tries", "workers"),
+    ),
+    Algorithm.GoldwasserMicali: (
+        "lightphe.cryptosystems.GoldwasserMicali",
+        "GoldwasserMicali",
+        {},
+        ("key_size", "max_tries", "workers"),
+    ),
+    Algorithm.SanderYoungYung: (
+        "lightphe.cryptosystems.SanderYoungYung",
+        "SanderYoungYung",
+        {},
+        ("key_size", "plaintext_limit", "workers"),
+    ),
+    Algorithm.BonehGohNissim: (
+        "lightphe.cryptosystems.BonehGohNissim",
+        "BonehGohNissim",
+        {},
+        ("key_size", "max_tries", "workers"),
+    ),
+}
+
+# class name -> module of the class
+_CLASS_MODULES: Dict[str, str] = {
+    class_name: module_name for module_name, class_name, _, _ in _CRYPTOSYSTEMS.values()
+}
+
+
+def is_supported(algorithm_name: str) -> bool:
+    """
+    Check an algorithm is implemented
+    Args:
+        algorithm_name (str): user-facing algorithm name (e.g. "RSA")
+    Returns:
+        result (bool): True if the algorithm is implemented
+    """
+    return algorithm_name in _CRYPTOSYSTEMS
+
+
+def get_class(algorithm_name: str) -> Type[Homomorphic]:
+    """
+    Import the cryptosystem class of an algorithm
+    Args:
+        algorithm_name (str): user-facing algorithm name (e.g. "RSA")
+    Returns:
+        cls (Homomorphic): cryptosystem class
+    """
+    if algorithm_name not in _CRYPTOSYSTEMS:
+        raise ValueError(f"unimplemented algorithm - {algorithm_name}")
+    module_name, class_name, _, _ = _CRYPTOSYSTEMS[algorithm_name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def find_class(class_name: str) -> Optional[Type[Homomorphic]]:
+    """
+    Import a cryptosystem class by its class name
+    Args:
+        class_name (str): class name (e.g. "Paillier")
+    Returns:
+        cls (Homomorphic): cryptosystem class or None if there is no such class
+    """
+    module_name = _CLASS_MODULES.get(class_name)
+    if module_name is None:
+        return None
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def build_cryptosystem(
+    algorithm_name: str, keys: Optional[dict] = None, **options
+) -> Homomorphic:
+    """
+    Build a cryptosystem of an algorithm
+    Args:
+        algorithm_name (str): user-facing algorithm name (e.g. "RSA")
+        keys (dict): optional private-public key pair
+        options: key_size, form, curve, plaintext_limit, group, max_tries or workers.
+            The ones not used by the algorithm are discarded.
+    Returns:
+        cryptosystem (Homomorphic)
+    """
+    cls = get_class(algorithm_name)
+    _, _, fixed_arguments, argument_names = _CRYPTOSYSTEMS[algorithm_name]
+    arguments = {
+        name: options[name] for name in argument_names if options.get(name) is not None
+    }
+    return cls(keys=keys, **fixed_arguments, **arguments)
@@ -0,0 +1,103 @@
+# built-in dependencies
+import os
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import List
+
+# project dependencies
+from lightphe.commons import fixed_width
+
+# Integer ciphertexts are passed to worker processes through shared memory blocks
+# in fixed width encoding. So, large integers are not pickled. A block is created
+# and released by the parent process, workers only attach to it by its name.
+
+
+def prepare() -> None:
+    """
+    Start the resource tracker of shared memory blocks. Call this before creating
+    worker processes, then they share it with the parent. Otherwise, workers start
+    trackers of their own and destroy blocks they attached to when they exit.
+    """
+    if os.name == "posix":
+        resource_tracker.ensure_running()
+
+
+def share_integers(values: List[int], width: int) -> SharedMemory:
+    """
+    Create a shared memory block storing integers
+    Args:
+        values (list of int): non-negative integers
+        width (int): number of bytes per integer
+    Returns:
+        block (SharedMemory): release it with release once workers are done
+    """
+    block = allocate(width=width, count=len(values))
+    try:
+        block.buf[: width * len(values)] = fixed_width.encode_many(values, width)
+    except BaseException:
+        release(block)
+        raise
+    return block
+
+
+def allocate(width: int, count: int) -> SharedMemory:
+    """
+    Create a zero-filled shared memory block for integers
+    Args:
+        width (int): number of bytes per integer
+        count (int): number of integers
+    Returns:
+        block (SharedMemory): release it with release once workers are done
+    """
+    # blocks cannot be empty
+    return SharedMemory(create=True, size=max(1, width * count))
+
+
+def read_integers(name: str, width: int, start: int, stop: int) -> List[int]:
+    """
+    Read integers from a shared memory block created in another process
+    Args:
+        name (str): name of the block
+        width (int): number of bytes per integer
+        start (int): index of the first integer
+        stop (int): index after the last integer
+    Returns:
+        values (list of int)
+    """
+    block = SharedMemory(name=name)
+    try:
+        view = block.buf[start * width : stop * width]
+        try:
+            return list(fixed_width.iter_decode(view, width))
+        finally:
+            view.release()
+    finally:
+        block.close()
+
+
+def write_integer(name: str, width: int, index: int, value: int) -> None:
+    """
+    Write an integer into a shared memory block created in another process
+    Args:
+        name (str): name of the block
+        width (int): number of bytes per integer
+        index (int): position of the integer
+        value (int): non-negative integer
+    """
+    block = SharedMemory(name=name)
+    try:
+        block.buf[index * width : (index + 1) * width] = fixed_width.encode(
+            value, width
+        )
+    finally:
+        block.close()
+
+
+def release(block: SharedMemory) -> None:
+    """
+    Close and destroy a shared memory block
+    Args:
+        block (SharedMemory): block created with share_integers or allocate
+    """
+    block.close()
+    block.unlink()
@@ -0,0 +1,92 @@
+# built-in dependencies
+import os
+import csv
+from typing import Any, Iterable, Iterator, List, Union
+
+# Plaintext sources of streaming encryption. Values are read lazily, so a source
+# is never loaded into memory as a whole. Multi-dimensional sources are read in
+# row-major order.
+
+
+def read_plaintexts(source: Any) -> Iterator[Union[int, float]]:
+    """
+    Iterate plaintexts of a source
+    Args:
+        source: iterable of int or float, numpy array, or path of a .csv or .npy file
+    Returns:
+        plaintexts (iterator of int or float)
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".csv":
+            return _read_csv(path)
+        if extension == ".npy":
+            return _read_npy(path)
+        raise ValueError(
+            f"Plaintexts can be streamed from .csv or .npy files but got {path}"
+        )
+
+    if hasattr(source, "dtype") and hasattr(source, "flat"):
+        # numpy array
+        return _read_array(source)
+
+    return iter(source)
+
+
+def chunked(values: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Group values into lists of a given size. Last chunk may be shorter.
+    Args:
+        values (iterable): values to group
+        size (int): number of values per chunk
+    Returns:
+        chunks (iterator of list)
+    """
+    if size < 1:
+        raise ValueError(f"Chunk size must be positive but it is {size}")
+
+    chunk = []
+    for value in values:
+        chunk.append(value)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def _read_csv(path: str) -> Iterator[Union[int, float]]:
+    with open(path, "r", encoding="UTF-8", newline="") as file:
+        for row in csv.reader(file):
+            for cell in row:
+                cell = cell.strip()
+                if cell == "":
+                    continue
+                try:
+                    yield int(cell)
+                except ValueError:
+                    yield float(cell)
+
+
+def _read_npy(path: str) -> Iterator[Union[int, float]]:
+    try:
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+    except ImportError as err:
+        raise ImportError(
+            "numpy is required to stream .npy files. Install it with pip install numpy"
+        ) from err
+
+    # memory-mapped, so only the pages being encrypted are loaded
+    array = np.load(path, mmap_mode="r")
+    return _read_array(array)
+
+
+def _read_array(array: Any) -> Iterator[Union[int, float]]:
+    if array.dtype.kind not in "iuf":
+        raise ValueError(f"Numeric arrays can be encrypted but dtype is {array.dtype}")
+    for value in array.flat:
+        # numpy scalars are converted to built-in int or float
+        yield value.item()
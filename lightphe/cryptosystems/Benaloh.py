@@ -1,7 +1,8 @@
 # built-in dependencies
+import math
 import random
 from math import gcd
-from typing import Optional
+from typing import Optional, Sequence, Dict
 
 # 3rd party dependencies
 import sympy
@@ -9,6 +10,8 @@ from tqdm import tqdm
 
 # project dependencies
 from lightphe.models.Homomorphic import Homomorphic
+from lightphe.commons import primes
+from lightphe.commons import backend
 from lightphe.commons.logger import Logger
 
 logger = Logger(module="lightphe/cryptosystems/Benaloh.py")
@@ -26,6 +29,7 @@ class Benaloh(Homomorphic):
         key_size: Optional[int] = None,
         plaintext_limit: Optional[int] = None,
         max_tries: int = 10000,
+        workers: Optional[int] = None,
     ):
         """
         Args:
@@ -36,25 +40,38 @@ class Benaloh(Homomorphic):
                 If provided, r is set to the next prime greater than this value;
                 otherwise, r is chosen randomly from a default range.
             max_tries (int): maximum attempts to generate keys.
+            workers (int): number of processes searching primes in key generation.
+                Default is 1, primes are searched in the current process.
         """
         self.keys = keys or self.generate_keys(
             key_size=key_size or 1024,
             plaintext_limit=plaintext_limit,
             max_tries=max_tries,
+            workers=workers,
         )
         self.plaintext_modulo = self.keys["public_key"]["r"]
         self.ciphertext_modulo = self.keys["public_key"]["n"]
 
+        # baby steps x^j mod n for j in [0, m) with m ~ sqrt(r), calculated once in
+        # first decryption. Tables of all powers exported by former versions are
+        # loaded as they are, then a single giant step is required.
+        self.dlp_table: Optional[Sequence[int]] = None
+        self.__dlp_lookup: Optional[Dict[int, int]] = None
+        # x^-m mod n
+        self.__giant_step: Optional[int] = None
+
     def generate_keys(
         self,
         key_size: int,
         max_tries: int = 10000,
         plaintext_limit: Optional[int] = None,
+        workers: Optional[int] = None,
     ) -> dict:
         """
         Generate public and private keys of Paillier cryptosystem
         Args:
             key_size (int): key size in bits
+            workers (int): number of processes searching primes. Default is 1.
         Returns:
             keys (dict): having private_key and public_key keys
         """
@@ -64,20 +81,31 @@ class Benaloh(Homomorphic):
 
         x = 1
         for _ in tqdm(range(max_tries), disable=True):
-            # picking a prime p
-            p = sympy.randprime(2 ** (key_size // 2 - 300), 2 ** (key_size // 2) - 1)
-            q = sympy.randprime(2 ** (key_size // 2 - 300), 2 ** (key_size // 2) - 1)
-
-            n = p * q
-            phi = (p - 1) * (q - 1)
-
             # generate block size r
             if plaintext_limit is None:
-                r = sympy.randprime(1000, 2000)
+                r = primes.random_prime(1000, 2000, workers=workers)
             else:
-                r = sympy.nextprime(plaintext_limit)
+                r = primes.next_prime(plaintext_limit)
             # plaintexts will be allowed in [0, r-1]
 
+            # picking a prime p among the ones satisfying p = 1 mod r instead of
+            # expecting a random prime to satisfy it
+            p = primes.random_prime(
+                2 ** (key_size // 2 - 300),
+                2 ** (key_size // 2) - 1,
+                modulus=r,
+                residue=1,
+                workers=workers,
+            )
+            q = primes.random_prime(
+                2 ** (key_size // 2 - 300),
+                2 ** (key_size // 2) - 1,
+                workers=workers,
+            )
+
+            n = p * q
+            phi = (p - 1) * (q - 1)
+
             # block size r checks
             if not (
                 # r should divide p-1 without remainder
@@ -161,9 +189,9 @@ class Benaloh(Homomorphic):
                 f"New plaintext is {plaintext}"
             )
 
-        c = (pow(y, plaintext, n) * pow(u, r, n)) % n
+        c = (backend.powmod(y, plaintext, n) * backend.powmod(u, r, n)) % n
 
-        if gcd(c, n) != 1:
+        if backend.gcd(c, n) != 1:
             logger.debug("ciphertext is not co-prime with n!")
 
         return c
@@ -179,18 +207,40 @@ class Benaloh(Homomorphic):
         n = self.keys["public_key"]["n"]
         r = self.keys["public_key"]["r"]
         phi = self.keys["private_key"]["phi"]
-        x = self.keys["private_key"]["x"]
 
-        a = pow(ciphertext, int(phi // r), n)
+        a = backend.powmod(ciphertext, int(phi // r), n)
 
-        md = 0
-        while True:
-            if pow(x, md, n) == a:
-                break
-            md = md + 1
-            if md > r:
-                raise ValueError(f"Message cannot be restored in [{0}, {n}]")
-        return md
+        # baby-step giant-step: a = x^(i * m + j) for some i < ceil(r / m), j < m
+        lookup = self.__get_dlp_lookup()
+        m = len(lookup)
+        for i in range(-(-r // m)):
+            j = lookup.get(a)
+            if j is not None:
+                return i * m + j
+            a = (a * self.__giant_step) % n
+
+        raise ValueError(f"Message cannot be restored in [{0}, {n}]")
+
+    def __get_dlp_lookup(self) -> Dict[int, int]:
+        """
+        Decryption requires to solve DLP for base x in a group of order r.
+        Baby steps x^j for j < sqrt(r) are calculated once and looked up in the
+        following decryptions, so memory and first decryption cost O(sqrt(r)).
+        """
+        if self.__dlp_lookup is None:
+            n = self.keys["public_key"]["n"]
+            x = self.keys["private_key"]["x"]
+            if self.dlp_table is None:
+                r = self.keys["public_key"]["r"]
+                dlp_table = []
+                power = 1
+                for _ in range(math.isqrt(r - 1) + 1):
+                    dlp_table.append(power)
+                    power = (power * x) % n
+                self.dlp_table = dlp_table
+            self.__dlp_lookup = {power: md for md, power in enumerate(self.dlp_table)}
+            self.__giant_step = backend.powmod(x, -len(self.dlp_table), n)
+        return self.__dlp_lookup
 
     def add(self, ciphertext1: int, ciphertext2: int) -> int:
         """
@@ -225,7 +275,36 @@ class Benaloh(Homomorphic):
                 f"Benaloh can encrypt messages [1, {self.plaintext_modulo}]. "
                 f"Seems constant exceeded this limit. New constant is {constant}"
             )
-        return pow(ciphertext, constant, n)
+        return backend.powmod(ciphertext, constant, n)
+
+    def get_precomputations(self) -> dict:
+        """
+        Benaloh caches baby steps, powers of x, to solve DLP in decryption
+        Returns:
+            precomputations (dict): having dlp_table key if private key is available
+        """
+        if self.keys.get("private_key") is None:
+            return {}
+        self.__get_dlp_lookup()
+        return {"dlp_table": self.dlp_table}
+
+    def set_precomputations(self, precomputations: dict) -> None:
+        """
+        Load baby steps calculated by get_precomputations
+        Args:
+            precomputations (dict): exported precomputations
+        """
+        if precomputations.get("dlp_table") is not None:
+            self.dlp_table = precomputations["dlp_table"]
+            self.__dlp_lookup = None
+
+    def clear_precomputations(self) -> None:
+        """
+        Drop cached baby steps and giant step
+        """
+        self.dlp_table = None
+        self.__dlp_lookup = None
+        self.__giant_step = None
 
     def reencrypt(self, ciphertext: int) -> int:
         """
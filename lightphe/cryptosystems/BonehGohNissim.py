@@ -13,6 +13,8 @@ from sympy.ntheory.residue_ntheory import sqrt_mod
 
 # project dependencies
 from lightphe.models.Homomorphic import Homomorphic
+from lightphe.commons import primes
+from lightphe.commons import instrumentation
 from lightphe.commons.logger import Logger
 
 logger = Logger(module="lightphe/cryptosystems/BonehGohNissim.py")
@@ -37,16 +39,20 @@ class BonehGohNissim(Homomorphic):
         keys: Optional[dict] = None,
         key_size: Optional[int] = None,
         max_tries: int = 10000,
+        workers: Optional[int] = None,
     ):
         """
         Args:
             keys (dict): private - public key pair.
                 set this to None if you want to generate random keys.
             key_size (int): size of the keys to generate in bits. Default is 1024.
+            workers (int): number of processes searching primes in key generation.
+                Default is 1, primes are searched in the current process.
         """
         self.keys = keys or self.generate_keys(
             key_size=key_size or 1024,
             max_tries=max_tries,
+            workers=workers,
         )
 
         self.ec = LightECC(
@@ -71,9 +77,14 @@ class BonehGohNissim(Homomorphic):
         self,
         key_size: int,
         max_tries: int = 10000,
+        workers: Optional[int] = None,
     ):
         """
         Generate public and private keys of Boneh-Goh-Nissim cryptosystem
+        Args:
+            key_size (int): key size in bits
+            max_tries (int): maximum number of attempts to generate keys
+            workers (int): number of processes searching primes. Default is 1.
         Returns:
             keys (dict): having private_key and public_key keys
         """
@@ -83,31 +94,36 @@ class BonehGohNissim(Homomorphic):
 
         for key_attempt in range(max_tries):
             # choose large odd distinct primes q1 and q2
-            q1 = sympy.randprime(2 ** (key_size // 2), 2 ** (key_size // 2 + 1))
-            q2 = sympy.randprime(2 ** (key_size // 2), 2 ** (key_size // 2 + 1))
+            q1 = primes.random_prime(
+                2 ** (key_size // 2), 2 ** (key_size // 2 + 1), workers=workers
+            )
+            q2 = primes.random_prime(
+                2 ** (key_size // 2), 2 ** (key_size // 2 + 1), workers=workers
+            )
             while q1 == q2:
-                q2 = sympy.randprime(2 ** (key_size // 2), 2 ** (key_size // 2 + 1))
+                q2 = primes.random_prime(
+                    2 ** (key_size // 2), 2 ** (key_size // 2 + 1), workers=workers
+                )
 
             n = q1 * q2
 
             # Find l such that p = n*l - 1 is prime and p ≡ 3 (mod 4).
             # Supersingularity of y² = x³ + x requires p ≡ 3 (mod 4).
             # Since n is odd (product of two odd primes), n*l ≡ 0 (mod 4)
-            # iff l ≡ 0 (mod 4). So we iterate multiples of 4 systematically.
-            l = None
-            for l_candidate in range(4, max_tries * 4 + 4, 4):
-                p_candidate = n * l_candidate - 1
-                if sympy.isprime(p_candidate):
-                    l = l_candidate
-                    break
-
-            if l is None:
+            # iff l ≡ 0 (mod 4). So p ≡ -1 (mod 4n) and we look for the smallest
+            # such prime for l in [4, 4 * max_tries].
+            p_candidate = primes.next_prime(
+                4 * n - 2, modulus=4 * n, residue=-1, limit=4 * n * max_tries
+            )
+
+            if p_candidate is None:
                 logger.debug(
                     f"No valid l found for attempt {key_attempt + 1}, retrying"
                 )
                 continue
 
-            p = n * l - 1
+            p = p_candidate
+            l = (p + 1) // n
             a = 1
             b = 0
 
@@ -126,7 +142,7 @@ class BonehGohNissim(Homomorphic):
                 continue
 
             logger.debug("Curve order validated by LightECC.")
-            logger.debug(f"q1 = {q1}, q2 = {q2}, n = {n}, p = {p}, l = {l}")
+            logger.debug("q1 = %s, q2 = %s, n = %s, p = %s, l = %s", q1, q2, n, p, l)
             break
         else:
             raise Exception(f"Failed to generate keys after {max_tries} attempts")
@@ -240,6 +256,7 @@ class BonehGohNissim(Homomorphic):
         for i in range(1, q2):
             iP = P * i
             if iP == mP:
+                instrumentation.count("dlp_iterations", i, self.metrics)
                 return i
 
         raise Exception("Decryption failed")
@@ -277,6 +294,7 @@ class BonehGohNissim(Homomorphic):
         for i in range(1, q2):
             acc = _fp2_mul(acc, base, p)
             if acc == target:
+                instrumentation.count("dlp_iterations", i, self.metrics)
                 return i
 
         raise Exception("Decryption of G_T ciphertext failed")
@@ -376,6 +394,9 @@ class BonehGohNissim(Homomorphic):
         """
         h = self.keys["public_key"]["h"]
         h = EllipticCurvePoint(x=h[0], y=h[1], curve=self.ec.curve)
-        r = self.generate_random_key()
+        # order of h divides n, so r in [1, n) randomizes it uniformly and
+        # re-encryption requires the public key only
+        n = self.keys["public_key"]["curve"]["n"]
+        r = random.randint(1, n - 1)
         c_prime = ciphertext + (r * h)
         return c_prime
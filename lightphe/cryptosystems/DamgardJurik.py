@@ -1,8 +1,9 @@
 import random
 import math
 from typing import Optional
-import sympy
 from lightphe.models.Homomorphic import Homomorphic
+from lightphe.commons import primes
+from lightphe.commons import backend
 from lightphe.commons.logger import Logger
 
 logger = Logger(module="lightphe/cryptosystems/DamgardJurik.py")
@@ -20,25 +21,42 @@ class DamgardJurik(Homomorphic):
         "private_key": ["phi"],
     }
 
-    def __init__(self, s: int = 2, keys: Optional[dict] = None, key_size: Optional[int] = None):
+    def __init__(
+        self,
+        s: int = 2,
+        keys: Optional[dict] = None,
+        key_size: Optional[int] = None,
+        workers: Optional[int] = None,
+    ):
         """
         Args:
             s (int): cryptosystem's module is going to be n^(s+1). if s == 1 then this is Paillier
             keys (dict): private - public key pair.
                 set this to None if you want to generate random keys.
             key_size (int): key size in bits
+            workers (int): number of processes searching primes in key generation.
+                Default is 1, primes are searched in the current process.
         """
-        self.keys = keys or self.generate_keys(key_size=key_size or 1024, s=s)
+        self.keys = keys or self.generate_keys(key_size=key_size or 1024, s=s, workers=workers)
         n = self.keys["public_key"]["n"]
         self.plaintext_modulo = n
         self.ciphertext_modulo = pow(n, s + 1)
 
-    def generate_keys(self, key_size: int, s: Optional[int] = None):
+        # modular inverse of phi, calculated once in first decryption
+        self.mu: Optional[int] = None
+
+    def generate_keys(
+        self,
+        key_size: int,
+        s: Optional[int] = None,
+        workers: Optional[int] = None,
+    ):
         """
         Generate public and private keys of Paillier cryptosystem
         Args:
             s (int): cryptosystem's module is going to be n^(s+1). if s == 1 then this is Paillier
             key_size (int): key size in bits
+            workers (int): number of processes searching primes. Default is 1.
         Returns:
             keys (dict): having private_key and public_key keys
         """
@@ -47,10 +65,10 @@ class DamgardJurik(Homomorphic):
         keys["public_key"] = {}
 
         # picking a prime modulus p
-        p = sympy.randprime(200, 2 ** int(key_size / 2) - 1)
+        p = primes.random_prime(200, 2 ** int(key_size / 2) - 1, workers=workers)
 
         # picking a prime modulus q
-        q = sympy.randprime(200, 2 ** int(key_size / 2) - 1)
+        q = primes.random_prime(200, 2 ** int(key_size / 2) - 1, workers=workers)
 
         n = p * q
         phi = (p - 1) * (q - 1)
@@ -93,10 +111,10 @@ class DamgardJurik(Homomorphic):
         modulo = pow(n, s + 1)
 
         # assert math.gcd(r, n) == 1
-        c = (pow(g, plaintext, modulo) * pow(r, n, modulo)) % modulo
+        c = (backend.powmod(g, plaintext, modulo) * backend.powmod(r, n, modulo)) % modulo
         # c = (pow(g, plaintext, modulo) * pow(r, pow(n, s), modulo)) % modulo
-        if math.gcd(c, modulo) != 1:
-            logger.info(f"WARNING! gcd({c=}, {modulo=}) != 1")
+        if backend.gcd(c, modulo) != 1:
+            logger.info("WARNING! gcd(c=%s, modulo=%s) != 1", c, modulo)
         return c
 
     def decrypt(self, ciphertext: int):
@@ -110,9 +128,12 @@ class DamgardJurik(Homomorphic):
         phi = self.keys["private_key"]["phi"]
         n = self.keys["public_key"]["n"]
         s = self.keys["public_key"]["s"]
-        mu = pow(phi, -1, n)
+
+        if self.mu is None:
+            self.mu = backend.invert(phi, n)
+
         modulo = pow(n, s + 1)
-        return (self.lx(pow(ciphertext, phi, modulo)) * mu) % (n)
+        return (self.lx(backend.powmod(ciphertext, phi, modulo)) * self.mu) % (n)
 
     def add(self, ciphertext1: int, ciphertext2: int) -> int:
         """
@@ -145,10 +166,12 @@ class DamgardJurik(Homomorphic):
         if constant > self.plaintext_modulo:
             constant = constant % self.plaintext_modulo
             logger.debug(
-                f"Damgard-Jurik can encrypt messages [1, {n}]. "
-                f"Seems constant exceeded this limit. New constant is {constant}"
+                "Damgard-Jurik can encrypt messages [1, %s]. "
+                "Seems constant exceeded this limit. New constant is %s",
+                n,
+                constant,
             )
-        return pow(ciphertext, constant, self.ciphertext_modulo)
+        return backend.powmod(ciphertext, constant, self.ciphertext_modulo)
 
     def reencrypt(self, ciphertext: int) -> int:
         """
@@ -162,6 +185,34 @@ class DamgardJurik(Homomorphic):
         neutral_encrypted = self.encrypt(plaintext=neutral_element)
         return self.add(ciphertext1=ciphertext, ciphertext2=neutral_encrypted)
 
+    def get_precomputations(self) -> dict:
+        """
+        Damgard-Jurik caches modular inverse of phi for decryption
+        Returns:
+            precomputations (dict): having mu key if private key is available
+        """
+        if self.keys.get("private_key") is None:
+            return {}
+
+        if self.mu is None:
+            self.mu = backend.invert(self.keys["private_key"]["phi"], self.plaintext_modulo)
+
+        return {"mu": self.mu}
+
+    def set_precomputations(self, precomputations: dict) -> None:
+        """
+        Load modular inverse of phi calculated by get_precomputations
+        Args:
+            precomputations (dict): exported precomputations
+        """
+        self.mu = precomputations.get("mu", self.mu)
+
+    def clear_precomputations(self) -> None:
+        """
+        Drop cached modular inverse of phi
+        """
+        self.mu = None
+
     def lx(self, x: int) -> int:
         """
         Find logarithm over cyclic group
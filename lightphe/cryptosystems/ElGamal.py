@@ -1,17 +1,21 @@
 # built-in dependencies
 import random
 import decimal
-from typing import Optional
-
-# 3rd party dependencies
-import sympy
+from typing import List, Optional
 
 # project dependencies
 from lightphe.models.Homomorphic import Homomorphic
+from lightphe.commons import primes
+from lightphe.commons import groups
+from lightphe.commons import number_theory
+from lightphe.commons import instrumentation
 from lightphe.commons.logger import Logger
 
 logger = Logger(module="lightphe/cryptosystems/ElGamal.py")
 
+# fixed base tables of re-encryption pay off for batches of this size
+FIXED_BASE_MIN_BATCH = 32
+
 
 class ElGamal(Homomorphic):
     """
@@ -24,7 +28,14 @@ class ElGamal(Homomorphic):
         "private_key": ["x"],
     }
 
-    def __init__(self, keys: Optional[dict] = None, exponential=False, key_size: Optional[int] = None):
+    def __init__(
+        self,
+        keys: Optional[dict] = None,
+        exponential=False,
+        key_size: Optional[int] = None,
+        group: Optional[str] = None,
+        workers: Optional[int] = None,
+    ):
         """
         Args:
             keys (dict): private - public key pair.
@@ -33,26 +44,45 @@ class ElGamal(Homomorphic):
             exponential (boolean): set this to True to make cryptosystem exponential ElGamal.
                 Regular ElGamal is homomorphic with respect to the multiplication whereas
                 exponential ElGamal is homomorphic with respect to the addition
+            group (str): set this to work in a subgroup of prime order q of a safe prime
+                modulus p = 2q + 1 with short random exponents, which makes encryption
+                much cheaper. Options: safe-prime to generate a key_size bits modulus,
+                or a well-known group to skip generating it (modp2048, modp3072,
+                modp4096 of RFC 3526 and ffdhe2048, ffdhe3072, ffdhe4096 of RFC 7919).
+                Regular ElGamal maps messages in [1, q] into the subgroup then.
+            workers (int): number of processes searching primes in key generation.
+                Default is 1, primes are searched in the current process.
         """
         self.exponential = exponential
-        self.keys = keys or self.generate_keys(key_size or 1024)
+        self.keys = keys or self.generate_keys(key_size or 1024, group=group, workers=workers)
         self.plaintext_modulo = self.keys["public_key"]["p"]
         self.ciphertext_modulo = self.keys["public_key"]["p"]
 
-    def generate_keys(self, key_size: int):
+    def generate_keys(
+        self,
+        key_size: int,
+        group: Optional[str] = None,
+        workers: Optional[int] = None,
+    ):
         """
         Generate public and private keys of ElGamal cryptosystem
         Args:
             key_size (int): key size in bits
+            group (str): safe-prime or a well-known group name, see constructor.
+                Public key has the subgroup order q in this case.
+            workers (int): number of processes searching primes. Default is 1.
         Returns:
             keys (dict): having private_key and public_key keys
         """
+        if group is not None:
+            return self.__generate_subgroup_keys(key_size, group, workers)
+
         keys = {}
         keys["private_key"] = {}
         keys["public_key"] = {}
 
         # picking a prime modulus p
-        p = sympy.randprime(100, 2 ** int(key_size / 2) - 1)
+        p = primes.random_prime(100, 2 ** int(key_size / 2) - 1, workers=workers)
 
         # picking a generator g
         # g = random.randint(2, int(math.sqrt(p))) # reaches int limit for 3072-bit key
@@ -75,14 +105,88 @@ class ElGamal(Homomorphic):
 
         return keys
 
+    def __generate_subgroup_keys(
+        self, key_size: int, group: str, workers: Optional[int] = None
+    ) -> dict:
+        if group == "safe-prime":
+            # p = 2q + 1 having key_size bits
+            q = primes.random_prime(
+                2 ** (key_size - 2),
+                2 ** (key_size - 1),
+                modulus=2,
+                residue=1,
+                companions=[(2, 1)],
+                workers=workers,
+            )
+            p = 2 * q + 1
+            # squares generate the subgroup of order q
+            g = pow(random.randint(2, p - 2), 2, p)
+            while g == 1:
+                g = pow(random.randint(2, p - 2), 2, p)
+        else:
+            p, q, g = groups.get_group(group)
+
+        keys = {"public_key": {"p": p, "g": g, "q": q}}
+        x = random.randint(1, self.__short_exponent_bound(q, p))
+        keys["public_key"]["y"] = pow(g, x, p)
+        keys["private_key"] = {"x": x}
+        return keys
+
+    @staticmethod
+    def __short_exponent_bound(q: int, p: int) -> int:
+        # exponents are reduced mod q, so they need as many bits as the security level
+        bits = groups.short_exponent_bits(p.bit_length())
+        return min(q - 1, 2**bits)
+
+    def __random_key_bound(self) -> int:
+        p = self.keys["public_key"]["p"]
+        q = self.keys["public_key"].get("q")
+        if q is not None:
+            return self.__short_exponent_bound(q, p)
+        return p - 1
+
+    def __encode(self, plaintext: int) -> int:
+        """
+        Map a plaintext into the subgroup of order q if it is set. Otherwise, the
+            Legendre symbol of c2 would reveal the one of the plaintext because y^r
+            is a quadratic residue. -1 is a non-residue for a safe prime p, so either
+            m or p - m is in the subgroup.
+        Args:
+            plaintext (int): message in [1, q]
+        Returns:
+            encoded plaintext (int): quadratic residue mod p
+        """
+        p = self.keys["public_key"]["p"]
+        q = self.keys["public_key"].get("q")
+        if q is None:
+            return plaintext
+        if not 0 < plaintext <= q:
+            raise ValueError(
+                f"ElGamal in a subgroup of order q can encrypt messages in [1, {q}]"
+            )
+        return plaintext if pow(plaintext, q, p) == 1 else p - plaintext
+
+    def __decode(self, encoded: int) -> int:
+        """
+        Restore a plaintext mapped into the subgroup of order q by __encode
+        Args:
+            encoded (int): quadratic residue mod p
+        Returns:
+            plaintext (int): message in [1, q]
+        """
+        p = self.keys["public_key"]["p"]
+        q = self.keys["public_key"].get("q")
+        if q is None or encoded <= q:
+            return encoded
+        return p - encoded
+
     def generate_random_key(self) -> int:
         """
         ElGamal requires to generate one-time random key per encryption
         Returns:
             random key (int): one time random key for encryption
         """
-        p = self.keys["public_key"]["p"]
-        return random.randint(1, p - 1)
+        return random.randint(1, self.__random_key_bound())
 
     def encrypt(self, plaintext: int, random_key: Optional[int] = None) -> tuple:
         """
@@ -101,13 +205,15 @@ class ElGamal(Homomorphic):
         if plaintext > p:
             plaintext = plaintext % p
             logger.debug(
-                f"ElGamal can encrypt messages [1, {p}]. "
-                f"Seems you exceeded this limit. New plaintext is {plaintext}"
+                "ElGamal can encrypt messages [1, %s]. "
+                "Seems you exceeded this limit. New plaintext is %s",
+                p,
+                plaintext,
             )
 
         c1 = pow(g, r, p)
         if self.exponential is False:
-            c2 = (plaintext * pow(y, r, p)) % p
+            c2 = (self.__encode(plaintext) * pow(y, r, p)) % p
         else:
             c2 = (pow(g, plaintext, p) * pow(y, r, p)) % p
 
@@ -130,13 +236,14 @@ class ElGamal(Homomorphic):
         m_prime = (c2 * pow(c1, -1 * x, p)) % p
 
         if self.exponential is False:
-            return m_prime
+            return self.__decode(m_prime)
 
         if self.exponential is True:
             # m_prime = g^m . Find m for known m_prime and known g (DLP).
             m = 0
             while True:
                 if pow(g, m, p) == m_prime:
+                    instrumentation.count("dlp_iterations", m + 1, self.metrics)
                     return m
                 m += 1
                 if m > p:
@@ -181,8 +288,10 @@ class ElGamal(Homomorphic):
         if constant > p:
             constant = constant % p
             logger.debug(
-                f"ElGamal can encrypt messages [1, {p}]. "
-                f"Seems constant exceeded this limit. New constant is {constant}"
+                "ElGamal can encrypt messages [1, %s]. "
+                "Seems constant exceeded this limit. New constant is %s",
+                p,
+                constant,
             )
 
         return pow(ciphertext[0], constant, p), pow(ciphertext[1], constant, p)
@@ -210,3 +319,32 @@ class ElGamal(Homomorphic):
             reencrypted_value = self.multiply(ciphertext1=ciphertext, ciphertext2=neutral_encrypted)
 
         return reencrypted_value
+
+    def reencrypt_many(self, ciphertexts: List[tuple]) -> List[tuple]:
+        """
+        Re-generate many ciphertexts. Powers of g and y are precomputed once for
+        the batch, so random exponentiations are much cheaper than in reencrypt.
+        Args:
+            ciphertexts (list of tuple): given ciphertexts
+        Returns:
+            new ciphertexts (list of tuple): different ciphertexts for same plaintexts
+        """
+        if len(ciphertexts) < FIXED_BASE_MIN_BATCH:
+            return super().reencrypt_many(ciphertexts)
+
+        p = self.keys["public_key"]["p"]
+        bits = self.__random_key_bound().bit_length()
+        g_table = number_theory.fixed_base_table(self.keys["public_key"]["g"], p, bits)
+        y_table = number_theory.fixed_base_table(self.keys["public_key"]["y"], p, bits)
+
+        # multiply with (g^r, y^r), encryption of 1 in regular and of 0 in exponential ElGamal
+        result = []
+        for c1, c2 in ciphertexts:
+            r = self.generate_random_key()
+            result.append(
+                (
+                    c1 * number_theory.fixed_base_pow(g_table, r, p) % p,
+                    c2 * number_theory.fixed_base_pow(y_table, r, p) % p,
+                )
+            )
+        return result
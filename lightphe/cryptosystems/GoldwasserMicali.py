@@ -1,21 +1,29 @@
 # built-in dependencies
 import random
-from typing import Optional, List
+import functools
+from concurrent.futures import Executor
+from typing import Optional, List, Sequence, Union
 import math
 
 # 3rd party dependencies
-import sympy
-from sympy import jacobi_symbol
 from tqdm import tqdm
 
 # project dependencies
 from lightphe.models.Homomorphic import Homomorphic
+from lightphe.models.PackedCiphertext import PackedCiphertext
+from lightphe.models.RandomnessPool import RandomnessPool
+from lightphe.commons import primes
+from lightphe.commons.number_theory import random_squares
+from lightphe.commons.backend import jacobi
 from lightphe.commons.logger import Logger
 
 logger = Logger(module="lightphe/cryptosystems/GoldwasserMicali.py")
 
 # pylint:disable=consider-using-enumerate
 
+# ciphertexts are lists of integers, one per bit, or packed into a buffer
+GMCiphertext = Union[List[int], PackedCiphertext]
+
 
 class GoldwasserMicali(Homomorphic):
     """
@@ -28,11 +36,15 @@ class GoldwasserMicali(Homomorphic):
         "private_key": ["p", "q"],
     }
 
+    # precomputed random squares drawn by encryption if set
+    randomness: Optional[RandomnessPool] = None
+
     def __init__(
         self,
         keys: Optional[dict] = None,
         key_size: Optional[int] = None,
         max_tries: int = 10000,
+        workers: Optional[int] = None,
     ):
         """
         Args:
@@ -40,10 +52,14 @@ class GoldwasserMicali(Homomorphic):
                 set this to None if you want to generate random keys.
             key_size (int): key size in bits
             max_tries (int): maximum attempts to generate keys
+            workers (int): number of processes searching primes in key generation.
+                Default is 1, primes are searched in the current process.
         """
 
         self.keys = keys or self.generate_keys(
-            key_size=key_size or 1024, max_tries=max_tries
+            key_size=key_size or 1024,
+            max_tries=max_tries,
+            workers=workers,
         )
         self.ciphertext_modulo = self.keys["public_key"]["n"]
 
@@ -53,19 +69,29 @@ class GoldwasserMicali(Homomorphic):
         # even if it is larger than n.
         self.plaintext_modulo = self.keys["public_key"]["n"]
 
-    def generate_keys(self, key_size: int, max_tries: int = 10000) -> dict:
+    def generate_keys(
+        self,
+        key_size: int,
+        max_tries: int = 10000,
+        workers: Optional[int] = None,
+    ) -> dict:
         """
         Generate public and private keys of Goldwasser-Micali cryptosystem
         Args:
             key_size (int): key size in bits
             max_tries (int): maximum number of tries to generate keys
+            workers (int): number of processes searching primes. Default is 1.
         Returns:
             keys (dict): having private_key and public_key keys
         """
         for attempt in tqdm(range(max_tries), disable=True):
             # pick large random primes p and q
-            p = sympy.randprime(2 ** (key_size // 2 - 100), 2 ** (key_size // 2) - 1)
-            q = sympy.randprime(2 ** (key_size // 2 - 100), 2 ** (key_size // 2) - 1)
+            p = primes.random_prime(
+                2 ** (key_size // 2 - 100), 2 ** (key_size // 2) - 1, workers=workers
+            )
+            q = primes.random_prime(
+                2 ** (key_size // 2 - 100), 2 ** (key_size // 2) - 1, workers=workers
+            )
 
             # to prevent factorizatin attacks, it is recommended that n should be
             # several hundred bits or more
@@ -76,7 +102,7 @@ class GoldwasserMicali(Homomorphic):
                 x = random.randint(2, n - 1)
                 if math.gcd(x, n) != 1:
                     continue
-                if jacobi_symbol(x, p) == -1 and jacobi_symbol(x, q) == -1:
+                if jacobi(x, p) == -1 and jacobi(x, q) == -1:
                     break
             else:
                 # # If no suitable x is found after 1000 tries, discard the current p–q pair and retry
@@ -88,7 +114,9 @@ class GoldwasserMicali(Homomorphic):
             }
 
             logger.debug(
-                f"Goldwasser-Micali keys generated after {attempt+1} attempts, n bits: {n.bit_length()}"
+                "Goldwasser-Micali keys generated after %s attempts, n bits: %s",
+                attempt + 1,
+                n.bit_length(),
             )
 
             return keys
@@ -111,6 +139,53 @@ class GoldwasserMicali(Homomorphic):
                 break
         return r
 
+    def use_randomness_pool(
+        self,
+        capacity: int = 1024,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> RandomnessPool:
+        """
+        Precompute random squares in background, then encryption and re-encryption
+            draw them instead of calculating them per bit
+        Args:
+            capacity (int): number of ready random squares
+            workers (int): number of processes generating squares. Default is cpu count.
+            executor (Executor): optional executor to generate squares in
+        Returns:
+            pool (RandomnessPool): pool owned by the cryptosystem. Call close of the
+                cryptosystem to shut it down.
+        """
+        # pool set before is replaced
+        self.close()
+
+        self.randomness = RandomnessPool(
+            factory=functools.partial(random_squares, self.keys["public_key"]["n"]),
+            capacity=capacity,
+            workers=workers,
+            executor=executor,
+        )
+        return self.randomness
+
+    def close(self) -> None:
+        """
+        Shut down randomness pool set by use_randomness_pool. Random squares are
+            calculated on demand afterwards.
+        """
+        if self.randomness is not None:
+            self.randomness.close()
+        self.randomness = None
+
+    def random_square(self) -> int:
+        """
+        Random square r^2 mod n for a one-time random key r
+        Returns:
+            square (int): drawn from the randomness pool if it is set
+        """
+        if self.randomness is not None:
+            return self.randomness.take()
+        return random_squares(self.keys["public_key"]["n"], 1)[0]
+
     def encrypt(self, plaintext: int, random_key: Optional[int] = None) -> List[int]:
         """
         Encrypt a given plaintext for optionally given random key with Goldwasser-Micali
@@ -137,16 +212,37 @@ class GoldwasserMicali(Homomorphic):
             mi = int(m_binary[i])
 
             if random_key:
-                ri = random_key[i]
+                square = pow(random_key[i], 2, n)
             else:
-                ri = self.generate_random_key()
+                square = self.random_square()
 
-            ci = (pow(ri, 2, n) * pow(x, mi, n)) % n
+            ci = (square * x) % n if mi == 1 else square
             c.append(ci)
 
         return c
 
-    def decrypt(self, ciphertext: List[int]) -> int:
+    def encrypt_packed(
+        self, plaintext: int, bit_length: Optional[int] = None
+    ) -> PackedCiphertext:
+        """
+        Encrypt a given plaintext into a packed ciphertext
+        Args:
+            plaintext (int): message to encrypt
+            bit_length (int): number of bits to encrypt, e.g. size of a bitmap.
+                Leading zero bits are encrypted as well. Default is bit length of plaintext.
+        Returns:
+            ciphertext (PackedCiphertext): encrypted message
+        """
+        c = self.encrypt(plaintext=plaintext)
+        if bit_length is not None:
+            if bit_length < len(c):
+                raise ValueError(
+                    f"Plaintext {plaintext} does not fit into {bit_length} bits"
+                )
+            c = [self.random_square() for _ in range(bit_length - len(c))] + c
+        return PackedCiphertext.pack(c, self.keys["public_key"]["n"])
+
+    def decrypt(self, ciphertext: GMCiphertext) -> int:
         """
         Decrypt a given ciphertext with Goldwasser-Micali
         Args:
@@ -154,29 +250,17 @@ class GoldwasserMicali(Homomorphic):
         Returns:
             plaintext (int): restored message
         """
-        m_binaries = []
-
         p = self.keys["private_key"]["p"]
-        q = self.keys["private_key"]["q"]
 
+        plaintext = 0
         for i in ciphertext:
-            xp = i % p
-            xq = i % q
-
-            # reaches int limit for 3072-bit key
-            # if pow(xp, int((p - 1) / 2), p) == 1 and pow(xq, int((q - 1) / 2), q) == 1:
-            if (
-                pow(xp, int((p - 1) // 2), p) == 1
-                and pow(xq, int((q - 1) // 2), q) == 1
-            ):
-                m_binaries.append("0")
-            else:
-                m_binaries.append("1")
+            # x is a non-residue and r^2 is a residue modulo both primes, so
+            # legendre symbol modulo p is enough to restore the bit
+            plaintext = (plaintext << 1) | (0 if jacobi(i, p) == 1 else 1)
 
-        m_binary = "".join(m_binaries)
-        return int(m_binary, 2)
+        return plaintext
 
-    def xor(self, ciphertext1: List[int], ciphertext2: List[int]) -> List[int]:
+    def xor(self, ciphertext1: GMCiphertext, ciphertext2: GMCiphertext) -> GMCiphertext:
         """
         Perform homomorphic xor on encrypted data.
         Result of this must be equal to E(m1 ^ m2) = E(m1) ^ E(m2)
@@ -185,16 +269,24 @@ class GoldwasserMicali(Homomorphic):
             ciphertext1 (list of int): 1st ciphertext created with Goldwasser-Micali
             ciphertext2 (list of int): 2nd ciphertext created with Goldwasser-Micali
         Returns:
-            ciphertext3 (list of int): 3rd ciphertext created with Goldwasser-Micali
+            ciphertext3 (list of int): 3rd ciphertext created with Goldwasser-Micali.
+                Packed if any of ciphertexts is packed.
         """
+        packed = isinstance(ciphertext1, PackedCiphertext) or isinstance(
+            ciphertext2, PackedCiphertext
+        )
+        ciphertext1 = list(ciphertext1)
+        ciphertext2 = list(ciphertext2)
+
+        # shorter one is padded with encrypted zeros
         if len(ciphertext1) > len(ciphertext2):
-            ciphertext2 = [self.encrypt(0)[0]] * (
-                len(ciphertext1) - len(ciphertext2)
-            ) + ciphertext2
+            ciphertext2 = [
+                self.random_square() for _ in range(len(ciphertext1) - len(ciphertext2))
+            ] + ciphertext2
         elif len(ciphertext2) > len(ciphertext1):
-            ciphertext1 = [self.encrypt(0)[0]] * (
-                len(ciphertext2) - len(ciphertext1)
-            ) + ciphertext1
+            ciphertext1 = [
+                self.random_square() for _ in range(len(ciphertext2) - len(ciphertext1))
+            ] + ciphertext1
 
         assert len(ciphertext1) == len(ciphertext2)
 
@@ -205,9 +297,38 @@ class GoldwasserMicali(Homomorphic):
 
             ciphertext3.append((c1 * c2) % self.ciphertext_modulo)
 
+        if packed:
+            return PackedCiphertext.pack(ciphertext3, self.ciphertext_modulo)
         return ciphertext3
 
-    def reencrypt(self, ciphertext: List[int]) -> List[int]:
+    def xor_many(self, ciphertexts: Sequence[GMCiphertext]) -> GMCiphertext:
+        """
+        Perform homomorphic xor of many ciphertexts at once.
+        Ciphertexts of each bit position are multiplied in one pass instead of
+        building a new ciphertext per pair.
+        Args:
+            ciphertexts (list): ciphertexts created with Goldwasser-Micali
+        Returns:
+            ciphertext: encrypted xor of all messages. Packed if any of ciphertexts is packed.
+        """
+        if len(ciphertexts) == 0:
+            raise ValueError("Xor of no ciphertexts cannot be calculated")
+
+        n = self.ciphertext_modulo
+        length = max(len(ciphertext) for ciphertext in ciphertexts)
+
+        # missing leading bits of shorter ciphertexts are zeros, nothing to multiply
+        products = [1] * length
+        for ciphertext in ciphertexts:
+            offset = length - len(ciphertext)
+            for i, ci in enumerate(ciphertext, start=offset):
+                products[i] = (products[i] * ci) % n
+
+        if any(isinstance(ciphertext, PackedCiphertext) for ciphertext in ciphertexts):
+            return PackedCiphertext.pack(products, n)
+        return products
+
+    def reencrypt(self, ciphertext: GMCiphertext) -> GMCiphertext:
         """
         Re-encrypt a given ciphertext with Goldwasser-Micali
         Args:
@@ -219,8 +340,9 @@ class GoldwasserMicali(Homomorphic):
 
         c_reencrypted = []
         for ci in ciphertext:
-            ri = self.generate_random_key()
-            ci_reencrypted = (pow(ri, 2, n) * ci) % n
+            ci_reencrypted = (self.random_square() * ci) % n
             c_reencrypted.append(ci_reencrypted)
 
+        if isinstance(ciphertext, PackedCiphertext):
+            return PackedCiphertext.pack(c_reencrypted, n)
         return c_reencrypted
@@ -1,10 +1,13 @@
 import random
-from typing import Optional
+import logging
+from typing import Optional, Sequence, List, Dict
 import math
 import sympy
 from sympy.ntheory.modular import solve_congruence
 from tqdm import tqdm
 from lightphe.models.Homomorphic import Homomorphic
+from lightphe.commons import primes
+from lightphe.commons import backend
 from lightphe.commons.logger import Logger
 
 logger = Logger(module="lightphe/cryptosystems/NaccacheStern.py")
@@ -31,6 +34,7 @@ class NaccacheStern(Homomorphic):
         key_size: Optional[int] = None,
         deterministic: bool = False,
         max_tries: int = 10000,
+        workers: Optional[int] = None,
     ):
         """
         Args:
@@ -41,21 +45,41 @@ class NaccacheStern(Homomorphic):
             deterministic (boolean): deterministic or probabilistic version of
                 cryptosystem
             max_tries (int): maximum attempts to generate keys
+            workers (int): number of processes searching primes in key generation.
+                Default is 1, primes are searched in the current process.
         """
         # Naccache-Stern requires to solve DLP in decryption, so small key is recommended
         self.keys = keys or self.generate_keys(
-            key_size=key_size or 1024, max_tries=max_tries
+            key_size=key_size or 1024,
+            max_tries=max_tries,
+            workers=workers,
         )
         self.plaintext_modulo = self.keys["public_key"]["sigma"]
         self.ciphertext_modulo = self.keys["public_key"]["n"]
         self.deterministic = deterministic
 
-    def generate_keys(self, key_size: int, max_tries: int = 10000) -> dict:
+        # sigma is the product of the small primes; recover them by factoring once.
+        self.prime_set: List[int] = sorted(
+            sympy.factorint(self.keys["public_key"]["sigma"]).keys()
+        )
+
+        # g^(j*phi/pi) mod n for j in [0, pi) per small prime pi,
+        # calculated once in first decryption
+        self.dlp_tables: Optional[List[Sequence[int]]] = None
+        self.__dlp_lookups: Optional[List[Dict[int, int]]] = None
+
+    def generate_keys(
+        self,
+        key_size: int,
+        max_tries: int = 10000,
+        workers: Optional[int] = None,
+    ) -> dict:
         """
         Generate public and private keys of Naccache-Stern cryptosystem
         Args:
             key_size (int): key size in bits (≥1024 recommended)
             max_tries (int): maximum attempts to generate keys
+            workers (int): number of processes searching primes. Default is 1.
         Returns:
             keys (dict): containing 'private_key' and 'public_key'
         """
@@ -66,7 +90,7 @@ class NaccacheStern(Homomorphic):
         prime_set = sorted(random.sample(small_primes, 4))
         k = len(prime_set)
 
-        if all(sympy.isprime(prime) is True for prime in prime_set) is False:
+        if all(backend.is_prime(prime) for prime in prime_set) is False:
             raise ValueError("All items of prime set must be prime!")
 
         # divide the set in half and find products of primes
@@ -86,15 +110,28 @@ class NaccacheStern(Homomorphic):
             desc="Attempting Naccache-Stern key generation",
             disable=True,
         ):
-            # Generate large random primes a and b
-            a = sympy.randprime(2 ** (key_size // 2 - 300), 2 ** (key_size // 2) - 1)
-            b = sympy.randprime(2 ** (key_size // 2 - 300), 2 ** (key_size // 2) - 1)
+            # Generate large random primes a and b such that 2au + 1 and 2bv + 1
+            # are primes as well. Both are sieved together in the prime search.
+            a = primes.random_prime(
+                2 ** (key_size // 2 - 300),
+                2 ** (key_size // 2) - 1,
+                companions=[(2 * u,
+                1)],
+                workers=workers,
+            )
+            b = primes.random_prime(
+                2 ** (key_size // 2 - 300),
+                2 ** (key_size // 2) - 1,
+                companions=[(2 * v,
+                1)],
+                workers=workers,
+            )
 
             # calculate two primes from chosen ones
             p = 2 * a * u + 1
             q = 2 * b * v + 1
 
-            if not (sympy.isprime(p) and sympy.isprime(q)):
+            if not (backend.is_prime(p) and backend.is_prime(q)):
                 continue
 
             # recommended n is 768 bits
@@ -176,7 +213,7 @@ class NaccacheStern(Homomorphic):
                 },
             }
             logger.debug(
-                f"Keys generated after {attempt+1} attempts, n bits: {n.bit_length()}"
+                "Keys generated after %s attempts, n bits: %s", attempt + 1, n.bit_length()
             )
             return keys
 
@@ -211,15 +248,17 @@ class NaccacheStern(Homomorphic):
         if plaintext > self.plaintext_modulo:
             plaintext = plaintext % self.plaintext_modulo
             logger.debug(
-                f"plaintext must be in scale [0, {self.plaintext_modulo}] "
-                "but this is exceeded. New plaintext is {plaintext}"
+                "plaintext must be in scale [0, %s] but this is exceeded. "
+                "New plaintext is %s",
+                self.plaintext_modulo,
+                plaintext,
             )
 
         if self.deterministic is True:
-            return pow(g, plaintext, n)
+            return backend.powmod(g, plaintext, n)
 
         # Probabilistic
-        return (pow(r, sigma, n) * pow(g, plaintext, n)) % n
+        return (backend.powmod(r, sigma, n) * backend.powmod(g, plaintext, n)) % n
 
     def decrypt(self, ciphertext: int):
         """
@@ -232,30 +271,30 @@ class NaccacheStern(Homomorphic):
         phi = self.keys["private_key"]["phi"]
         n = self.keys["public_key"]["n"]
         g = self.keys["public_key"]["g"]
-        sigma = self.keys["public_key"]["sigma"]
-        # sigma is the product of the small primes; recover them by factoring.
-        prime_set = sorted(sympy.factorint(sigma).keys())
+        prime_set = self.prime_set
+        dlp_lookups = self.__get_dlp_lookups()
+
+        debug = logger.is_enabled(logging.DEBUG)
 
         remainders = []
         for i, prime in enumerate(prime_set):
-            ci = pow(ciphertext, int(phi // prime), n)
-            logger.debug(f"c_{i} = {ci}")
-
-            j = 0
-            while True:
-                if ci == pow(g, int((j * phi) // prime), n):
-                    logger.debug(f"m_{i} = {j}")
-                    remainders.append(j)
-                    break
-                j = j + 1
-                if j > prime**2:
-                    raise ValueError(
-                        f"c_{i} cannot be restored from {ci} = {g}^(j*{phi}/{prime}) mod {n}"
-                    )
+            ci = backend.powmod(ciphertext, int(phi // prime), n)
+            if debug:
+                logger.log(logging.DEBUG, "c_%s = %s", i, ci)
+
+            j = dlp_lookups[i].get(ci)
+            if j is None:
+                raise ValueError(
+                    f"c_{i} cannot be restored from {ci} = {g}^(j*{phi}/{prime}) mod {n}"
+                )
+            if debug:
+                logger.log(logging.DEBUG, "m_%s = %s", i, j)
+            remainders.append(j)
 
         congruences = []
         for i in range(0, len(prime_set)):
-            logger.debug(f"m mod {prime_set[i]} = {remainders[i]}")
+            if debug:
+                logger.log(logging.DEBUG, "m mod %s = %s", prime_set[i], remainders[i])
             congruences.append((remainders[i], prime_set[i]))
 
         # chinese remainder problem
@@ -264,6 +303,32 @@ class NaccacheStern(Homomorphic):
             raise ValueError("message cannot be restored with Chinese Remainder!")
         return ms[0]
 
+    def __get_dlp_lookups(self) -> List[Dict[int, int]]:
+        """
+        Decryption requires to solve DLP for each small prime pi in a group of order pi.
+        Powers of g^(phi/pi) are calculated once and looked up in the following decryptions.
+        """
+        if self.__dlp_lookups is None:
+            if self.dlp_tables is None:
+                phi = self.keys["private_key"]["phi"]
+                n = self.keys["public_key"]["n"]
+                g = self.keys["public_key"]["g"]
+                dlp_tables = []
+                for prime in self.prime_set:
+                    base = pow(g, int(phi // prime), n)
+                    dlp_table = []
+                    power = 1
+                    for _ in range(prime):
+                        dlp_table.append(power)
+                        power = (power * base) % n
+                    dlp_tables.append(dlp_table)
+                self.dlp_tables = dlp_tables
+            self.__dlp_lookups = [
+                {power: j for j, power in enumerate(dlp_table)}
+                for dlp_table in self.dlp_tables
+            ]
+        return self.__dlp_lookups
+
     def add(self, ciphertext1: int, ciphertext2: int) -> int:
         """
         Perform homomorphic addition on encrypted data.
@@ -291,11 +356,41 @@ class NaccacheStern(Homomorphic):
         if constant > self.plaintext_modulo:
             constant = constant % self.plaintext_modulo
             logger.debug(
-                f"Naccache-Stern can encrypt messages [1, {self.plaintext_modulo}]. "
-                f"Seems constant exceeded this limit. New constant is {constant}"
+                "Naccache-Stern can encrypt messages [1, %s]. "
+                "Seems constant exceeded this limit. New constant is %s",
+                self.plaintext_modulo,
+                constant,
             )
 
-        return pow(ciphertext, constant, self.ciphertext_modulo)
+        return backend.powmod(ciphertext, constant, self.ciphertext_modulo)
+
+    def get_precomputations(self) -> dict:
+        """
+        Naccache-Stern caches DLP tables of each small prime for decryption
+        Returns:
+            precomputations (dict): having dlp_tables key if private key is available
+        """
+        if self.keys.get("private_key") is None:
+            return {}
+        self.__get_dlp_lookups()
+        return {"dlp_tables": self.dlp_tables}
+
+    def set_precomputations(self, precomputations: dict) -> None:
+        """
+        Load DLP tables calculated by get_precomputations
+        Args:
+            precomputations (dict): exported precomputations
+        """
+        if precomputations.get("dlp_tables") is not None:
+            self.dlp_tables = precomputations["dlp_tables"]
+            self.__dlp_lookups = None
+
+    def clear_precomputations(self) -> None:
+        """
+        Drop cached DLP tables
+        """
+        self.dlp_tables = None
+        self.__dlp_lookups = None
 
     def reencrypt(self, ciphertext: int) -> int:
         """
@@ -1,8 +1,9 @@
 import random
 import math
 from typing import Optional
-import sympy
 from lightphe.models.Homomorphic import Homomorphic
+from lightphe.commons import primes
+from lightphe.commons import backend
 from lightphe.commons.logger import Logger
 
 logger = Logger(module="lightphe/cryptosystems/OkamotoUchiyama.py")
@@ -19,22 +20,33 @@ class OkamotoUchiyama(Homomorphic):
         "private_key": ["p", "q"],
     }
 
-    def __init__(self, keys: Optional[dict] = None, key_size: Optional[int] = None):
+    def __init__(
+        self,
+        keys: Optional[dict] = None,
+        key_size: Optional[int] = None,
+        workers: Optional[int] = None,
+    ):
         """
         Args:
             keys (dict): private - public key pair.
                 set this to None if you want to generate random keys.
             key_size (int): key size in bits
+            workers (int): number of processes searching primes in key generation.
+                Default is 1, primes are searched in the current process.
         """
-        self.keys = keys or self.generate_keys(key_size or 1024)
+        self.keys = keys or self.generate_keys(key_size or 1024, workers=workers)
         self.plaintext_modulo = self.keys["public_key"]["n"]
         self.ciphertext_modulo = self.keys["public_key"]["n"]
 
-    def generate_keys(self, key_size: int) -> dict:
+        # modular inverse of L(g^(p-1) mod p^2), calculated once in first decryption
+        self.b_inverse: Optional[int] = None
+
+    def generate_keys(self, key_size: int, workers: Optional[int] = None) -> dict:
         """
         Generate public and private keys of OkamotoUchiyama cryptosystem
         Args:
             key_size (int): key size in bits
+            workers (int): number of processes searching primes. Default is 1.
         Returns:
             keys (dict): having private_key and public_key keys
         """
@@ -43,10 +55,10 @@ class OkamotoUchiyama(Homomorphic):
         keys["public_key"] = {}
 
         # picking a prime modulus p
-        p = sympy.randprime(200, 2 ** int(key_size / 2) - 1)
+        p = primes.random_prime(200, 2 ** int(key_size / 2) - 1, workers=workers)
 
         # picking a prime modulus q
-        q = sympy.randprime(200, 2 ** int(key_size / 2) - 1)
+        q = primes.random_prime(200, 2 ** int(key_size / 2) - 1, workers=workers)
 
         # modulo
         n = p * p * q
@@ -98,10 +110,12 @@ class OkamotoUchiyama(Homomorphic):
             if plaintext > p:
                 plaintext = plaintext % p
                 logger.debug(
-                    f"plaintext must be in scale [0, {p=}] but this is exceeded."
-                    "New plaintext is {plaintext}"
+                    "plaintext must be in scale [0, p=%s] but this is exceeded. "
+                    "New plaintext is %s",
+                    p,
+                    plaintext,
                 )
-        return (pow(g, plaintext, n) * pow(h, r, n)) % n
+        return (backend.powmod(g, plaintext, n) * backend.powmod(h, r, n)) % n
 
     def decrypt(self, ciphertext: int):
         """
@@ -112,11 +126,17 @@ class OkamotoUchiyama(Homomorphic):
             plaintext (int): restored message
         """
         p = self.keys["private_key"]["p"]
-        g = self.keys["public_key"]["g"]
 
-        a = self.lx(pow(ciphertext, p - 1, p * p))
-        b = self.lx(pow(g, p - 1, p * p))
-        return (a * pow(b, -1, p)) % p
+        a = self.lx(backend.powmod(ciphertext, p - 1, p * p))
+        return (a * self.__get_b_inverse()) % p
+
+    def __get_b_inverse(self) -> int:
+        if self.b_inverse is None:
+            p = self.keys["private_key"]["p"]
+            g = self.keys["public_key"]["g"]
+            b = self.lx(backend.powmod(g, p - 1, p * p))
+            self.b_inverse = backend.invert(b, p)
+        return self.b_inverse
 
     def add(self, ciphertext1: int, ciphertext2: int) -> int:
         """
@@ -147,10 +167,12 @@ class OkamotoUchiyama(Homomorphic):
         if constant > self.plaintext_modulo:
             constant = constant % self.plaintext_modulo
             logger.debug(
-                f"Okamoto-Uchiyama can encrypt messages [1, {n}]. "
-                f"Seems constant exceeded this limit. New constant is {constant}"
+                "Okamoto-Uchiyama can encrypt messages [1, %s]. "
+                "Seems constant exceeded this limit. New constant is %s",
+                n,
+                constant,
             )
-        return pow(ciphertext, constant, n)
+        return backend.powmod(ciphertext, constant, n)
 
     def reencrypt(self, ciphertext: int) -> int:
         """
@@ -164,6 +186,30 @@ class OkamotoUchiyama(Homomorphic):
         neutral_encrypted = self.encrypt(plaintext=neutral_element)
         return self.add(ciphertext1=ciphertext, ciphertext2=neutral_encrypted)
 
+    def get_precomputations(self) -> dict:
+        """
+        Okamoto-Uchiyama caches the modular inverse used in decryption
+        Returns:
+            precomputations (dict): having b_inverse key if private key is available
+        """
+        if self.keys.get("private_key") is None:
+            return {}
+        return {"b_inverse": self.__get_b_inverse()}
+
+    def set_precomputations(self, precomputations: dict) -> None:
+        """
+        Load the modular inverse calculated by get_precomputations
+        Args:
+            precomputations (dict): exported precomputations
+        """
+        self.b_inverse = precomputations.get("b_inverse", self.b_inverse)
+
+    def clear_precomputations(self) -> None:
+        """
+        Drop cached modular inverse of b
+        """
+        self.b_inverse = None
+
     def lx(self, x: int) -> int:
         """
         Find logarithm over cyclic group
@@ -1,8 +1,9 @@
 import random
 import math
 from typing import Optional
-import sympy
 from lightphe.models.Homomorphic import Homomorphic
+from lightphe.commons import primes
+from lightphe.commons import backend
 from lightphe.commons.logger import Logger
 
 logger = Logger(module="lightphe/cryptosystems/Paillier.py")
@@ -20,23 +21,34 @@ class Paillier(Homomorphic):
         "private_key": ["phi"],
     }
 
-    def __init__(self, keys: Optional[dict] = None, key_size: Optional[int] = None):
+    def __init__(
+        self,
+        keys: Optional[dict] = None,
+        key_size: Optional[int] = None,
+        workers: Optional[int] = None,
+    ):
         """
         Args:
             keys (dict): private - public key pair.
                 set this to None if you want to generate random keys.
             key_size (int): key size in bits
+            workers (int): number of processes searching primes in key generation.
+                Default is 1, primes are searched in the current process.
         """
-        self.keys = keys or self.generate_keys(key_size or 1024)
+        self.keys = keys or self.generate_keys(key_size or 1024, workers=workers)
         n = self.keys["public_key"]["n"]
         self.plaintext_modulo = n
         self.ciphertext_modulo = n * n
 
-    def generate_keys(self, key_size: int):
+        # modular inverse of phi, calculated once in first decryption
+        self.mu: Optional[int] = None
+
+    def generate_keys(self, key_size: int, workers: Optional[int] = None):
         """
         Generate public and private keys of Paillier cryptosystem
         Args:
             key_size (int): key size in bits
+            workers (int): number of processes searching primes. Default is 1.
         Returns:
             keys (dict): having private_key and public_key keys
         """
@@ -45,10 +57,10 @@ class Paillier(Homomorphic):
         keys["public_key"] = {}
 
         # picking a prime modulus p
-        p = sympy.randprime(200, 2 ** int(key_size / 2) - 1)
+        p = primes.random_prime(200, 2 ** int(key_size / 2) - 1, workers=workers)
 
         # picking a prime modulus q
-        q = sympy.randprime(200, 2 ** int(key_size / 2) - 1)
+        q = primes.random_prime(200, 2 ** int(key_size / 2) - 1, workers=workers)
 
         n = p * q
         phi = (p - 1) * (q - 1)
@@ -86,8 +98,8 @@ class Paillier(Homomorphic):
         g = self.keys["public_key"]["g"]
         n = self.keys["public_key"]["n"]
         r = random_key or self.generate_random_key()
-        assert math.gcd(r, n) == 1
-        return (pow(g, plaintext, n * n) * pow(r, n, n * n)) % (n * n)
+        assert backend.gcd(r, n) == 1
+        return (backend.powmod(g, plaintext, n * n) * backend.powmod(r, n, n * n)) % (n * n)
 
     def decrypt(self, ciphertext: int):
         """
@@ -99,9 +111,11 @@ class Paillier(Homomorphic):
         """
         phi = self.keys["private_key"]["phi"]
         n = self.keys["public_key"]["n"]
-        mu = pow(phi, -1, n)
 
-        return (self.lx(pow(ciphertext, phi, n * n)) * mu) % (n)
+        if self.mu is None:
+            self.mu = backend.invert(phi, n)
+
+        return (self.lx(backend.powmod(ciphertext, phi, n * n)) * self.mu) % (n)
 
     def add(self, ciphertext1: int, ciphertext2: int) -> int:
         """
@@ -133,11 +147,13 @@ class Paillier(Homomorphic):
         if constant > self.plaintext_modulo:
             constant = constant % self.plaintext_modulo
             logger.debug(
-                f"Paillier can encrypt messages [1, {n}]. "
-                f"Seems constant exceeded this limit. New constant is {constant}"
+                "Paillier can encrypt messages [1, %s]. "
+                "Seems constant exceeded this limit. New constant is %s",
+                n,
+                constant,
             )
 
-        return pow(ciphertext, constant, n * n)
+        return backend.powmod(ciphertext, constant, n * n)
 
     def reencrypt(self, ciphertext: int) -> int:
         """
@@ -151,6 +167,34 @@ class Paillier(Homomorphic):
         neutral_encrypted = self.encrypt(plaintext=neutral_element)
         return self.add(ciphertext1=ciphertext, ciphertext2=neutral_encrypted)
 
+    def get_precomputations(self) -> dict:
+        """
+        Paillier caches modular inverse of phi for decryption
+        Returns:
+            precomputations (dict): having mu key if private key is available
+        """
+        if self.keys.get("private_key") is None:
+            return {}
+
+        if self.mu is None:
+            self.mu = backend.invert(self.keys["private_key"]["phi"], self.plaintext_modulo)
+
+        return {"mu": self.mu}
+
+    def set_precomputations(self, precomputations: dict) -> None:
+        """
+        Load modular inverse of phi calculated by get_precomputations
+        Args:
+            precomputations (dict): exported precomputations
+        """
+        self.mu = precomputations.get("mu", self.mu)
+
+    def clear_precomputations(self) -> None:
+        """
+        Drop cached modular inverse of phi
+        """
+        self.mu = None
+
     def lx(self, x: int) -> int:
         """
         Find logarithm over cyclic group
@@ -1,8 +1,8 @@
 import random
 import math
 from typing import Optional
-import sympy
 from lightphe.models.Homomorphic import Homomorphic
+from lightphe.commons import primes
 from lightphe.commons.logger import Logger
 
 logger = Logger(module="lightphe/cryptosystems/RSA.py")
@@ -25,6 +25,7 @@ class RSA(Homomorphic):
         key_size: Optional[int] = None,
         encrypt_with_public=True,
         max_tries: int = 10000,
+        workers: Optional[int] = None,
     ):
         """
         Args:
@@ -38,9 +39,13 @@ class RSA(Homomorphic):
                 Set this arg to True if you want to do encryption with public key e,
                 and do decryption with private key d.
             max_tries (int): maximum attempts to generate keys.
+            workers (int): number of processes searching primes in key generation.
+                Default is 1, primes are searched in the current process.
         """
         self.keys = keys or self.generate_keys(
-            key_size=key_size or 1024, max_tries=max_tries
+            key_size=key_size or 1024,
+            max_tries=max_tries,
+            workers=workers,
         )
         self.plaintext_modulo = self.keys["public_key"]["n"]
         self.ciphertext_modulo = self.keys["public_key"]["n"]
@@ -50,12 +55,14 @@ class RSA(Homomorphic):
         self,
         key_size: int,
         max_tries: int = 10000,
+        workers: Optional[int] = None,
     ) -> dict:
         """
         Generate public and private keys of RSA cryptosystem
         Args:
             key_size (int): key size in bits
             max_tries (int): maximum number of tries to generate keys
+            workers (int): number of processes searching primes. Default is 1.
         Returns:
             keys (dict): having private_key and public_key keys
         """
@@ -65,8 +72,12 @@ class RSA(Homomorphic):
 
         for _ in range(max_tries):
             # picking a prime modulus p and q
-            p = sympy.randprime(2 ** (key_size // 2 - 300), 2 ** (key_size // 2) - 1)
-            q = sympy.randprime(2 ** (key_size // 2 - 300), 2 ** (key_size // 2) - 1)
+            p = primes.random_prime(
+                2 ** (key_size // 2 - 300), 2 ** (key_size // 2) - 1, workers=workers
+            )
+            q = primes.random_prime(
+                2 ** (key_size // 2 - 300), 2 ** (key_size // 2) - 1, workers=workers
+            )
 
             if p == q:
                 continue
@@ -81,7 +92,15 @@ class RSA(Homomorphic):
                     d = pow(e, -1, phi)
                     return {
                         "public_key": {"n": n, "e": e},
-                        "private_key": {"d": d},
+                        # factors and CRT exponents speed up private key operations
+                        "private_key": {
+                            "d": d,
+                            "p": p,
+                            "q": q,
+                            "dp": d % (p - 1),
+                            "dq": d % (q - 1),
+                            "qinv": pow(q, -1, p),
+                        },
                     }
         raise ValueError(f"Failed to generate RSA keys after {max_tries} tries")
 
@@ -106,16 +125,17 @@ class RSA(Homomorphic):
         if plaintext > n:
             plaintext = plaintext % n
             logger.debug(
-                f"RSA can encrypt messages [1, {n}]. "
-                f"Seems you exceeded this limit. New plaintext is {plaintext}"
+                "RSA can encrypt messages [1, %s]. "
+                "Seems you exceeded this limit. New plaintext is %s",
+                n,
+                plaintext,
             )
 
         if self.encrypt_with_public is True:
             e = self.keys["public_key"]["e"]
             c = pow(plaintext, e, n)
         else:
-            d = self.keys["private_key"]["d"]
-            c = pow(plaintext, d, n)
+            c = self.private_power(plaintext)
 
         return c
 
@@ -135,14 +155,46 @@ class RSA(Homomorphic):
         """
         n = self.keys["public_key"]["n"]
         if self.encrypt_with_public is True:
-            d = self.keys["private_key"]["d"]
-            p = pow(ciphertext, d, n)
+            p = self.private_power(ciphertext)
         else:
             e = self.keys["public_key"]["e"]
             p = pow(ciphertext, e, n)
 
         return p
 
+    def private_power(self, value: int) -> int:
+        """
+        Raise a value to the private exponent d modulo n. Chinese remainder theorem
+        is used if the private key has factors of n, which is about 3 times faster.
+        Args:
+            value (int): ciphertext to decrypt or message to sign
+        Returns:
+            result (int): value^d mod n
+        """
+        private_key = self.keys["private_key"]
+        n = self.keys["public_key"]["n"]
+        d = private_key["d"]
+
+        p = private_key.get("p")
+        q = private_key.get("q")
+        if p is None or q is None:
+            # keys generated by older versions
+            return pow(value, d, n)
+
+        if p * q != n:
+            raise ValueError("Factors in RSA private key do not match the modulus")
+
+        # keys having factors only
+        dp = private_key.get("dp") or d % (p - 1)
+        dq = private_key.get("dq") or d % (q - 1)
+        qinv = private_key.get("qinv") or pow(q, -1, p)
+
+        # garner's recombination
+        m1 = pow(value, dp, p)
+        m2 = pow(value, dq, q)
+        h = (qinv * (m1 - m2)) % p
+        return m2 + h * q
+
     def multiply(self, ciphertext1: int, ciphertext2: int) -> int:
         """
         Perform homomorphic multiplication on encrypted data.
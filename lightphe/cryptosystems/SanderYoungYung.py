@@ -1,19 +1,29 @@
 # built-in dependencies
 import math
+import logging
 import random
-from typing import Optional, List
-
-# third-party dependencies
-import sympy
-from sympy import jacobi_symbol
+import functools
+from concurrent.futures import Executor
+from typing import Optional, List, Sequence, Union
 
 # project dependencies
 from lightphe.models.Homomorphic import Homomorphic
+from lightphe.models.RandomnessPool import RandomnessPool
+from lightphe.models.PackedCiphertext import PackedBlockCiphertext
+from lightphe.commons import primes
+from lightphe.commons.number_theory import (
+    random_squares,
+    random_non_residues,
+)
+from lightphe.commons.backend import jacobi
 from lightphe.commons.logger import Logger
 
 
 logger = Logger(module="lightphe/cryptosystems/SanderYoungYung.py")
 
+# ciphertexts are lists of blocks of l integers, one block per bit, or packed into a buffer
+SYYCiphertext = Union[List[List[int]], PackedBlockCiphertext]
+
 
 class SanderYoungYung(Homomorphic):
     """
@@ -26,20 +36,29 @@ class SanderYoungYung(Homomorphic):
         "private_key": ["p", "q"],
     }
 
+    # precomputed quadratic residues y^2 and non-residues x * y^2 drawn by encryption if set
+    residues: Optional[RandomnessPool] = None
+    non_residues: Optional[RandomnessPool] = None
+
     def __init__(
         self,
         keys: Optional[dict] = None,
         key_size: Optional[int] = None,
         plaintext_limit: Optional[int] = None,
+        workers: Optional[int] = None,
     ):
         """
         Args:
             keys (dict): private - public key pair.
                 set this to None if you want to generate random keys.
             key_size (int): key size in bits
+            workers (int): number of processes searching primes in key generation.
+                Default is 1, primes are searched in the current process.
         """
         self.keys = keys or self.generate_keys(
-            key_size or 1024, plaintext_limit=plaintext_limit
+            key_size or 1024,
+            plaintext_limit=plaintext_limit,
+            workers=workers,
         )
         self.ciphertext_modulo = self.keys["public_key"]["n"]
         self.plaintext_modulo = self.keys["public_key"]["l"]
@@ -49,12 +68,14 @@ class SanderYoungYung(Homomorphic):
         key_size: int,
         max_tries: int = 10000,
         plaintext_limit: Optional[int] = None,
+        workers: Optional[int] = None,
     ) -> dict:
         """
         Generate public and private keys of Sander-Young-Yung cryptosystem
         Args:
             key_size (int): key size in bits
             max_tries (int): maximum number of attempts to find suitable keys
+            workers (int): number of processes searching primes. Default is 1.
 
         Returns:
             keys (dict): having private_key and public_key keys
@@ -66,8 +87,12 @@ class SanderYoungYung(Homomorphic):
 
         for _ in range(max_tries):
             # pick primes p and q
-            p = sympy.randprime(2 ** (key_size // 2 - 100), 2 ** (key_size // 2) - 1)
-            q = sympy.randprime(2 ** (key_size // 2 - 100), 2 ** (key_size // 2) - 1)
+            p = primes.random_prime(
+                2 ** (key_size // 2 - 100), 2 ** (key_size // 2) - 1, workers=workers
+            )
+            q = primes.random_prime(
+                2 ** (key_size // 2 - 100), 2 ** (key_size // 2) - 1, workers=workers
+            )
 
             # pick positive integer l
             if plaintext_limit is not None:
@@ -81,7 +106,7 @@ class SanderYoungYung(Homomorphic):
                 x = random.randint(1, n - 1)
                 if math.gcd(x, n) != 1:
                     continue
-                if jacobi_symbol(x, p) != -1 or jacobi_symbol(x, q) != -1:
+                if jacobi(x, p) != -1 or jacobi(x, q) != -1:
                     continue
 
                 keys["public_key"]["n"] = n
@@ -111,6 +136,78 @@ class SanderYoungYung(Homomorphic):
                 break
         return r
 
+    def use_randomness_pool(
+        self,
+        capacity: int = 4096,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[RandomnessPool]:
+        """
+        Precompute random quadratic residues and non-residues in background, then
+            encryption and re-encryption draw them instead of calculating them
+        Args:
+            capacity (int): number of ready residues and of ready non-residues
+            workers (int): number of processes generating them. Default is cpu count.
+            executor (Executor): optional executor to generate them in
+        Returns:
+            pools (list of RandomnessPool): residues and non-residues pools owned by
+                the cryptosystem. Call close of the cryptosystem to shut them down.
+        """
+        # pools set before are replaced
+        self.close()
+
+        n = self.keys["public_key"]["n"]
+        x = self.keys["public_key"]["x"]
+
+        self.residues = RandomnessPool(
+            factory=functools.partial(random_squares, n),
+            capacity=capacity,
+            workers=workers,
+            executor=executor,
+        )
+        # both pools share the same processes
+        self.non_residues = RandomnessPool(
+            factory=functools.partial(random_non_residues, n, x),
+            capacity=capacity,
+            executor=self.residues.executor,
+        )
+        return [self.residues, self.non_residues]
+
+    def close(self) -> None:
+        """
+        Shut down randomness pools set by use_randomness_pool. Random values are
+            calculated on demand afterwards.
+        """
+        # non-residues pool runs in the processes owned by the residues pool,
+        # so it is closed first
+        for pool in [self.non_residues, self.residues]:
+            if pool is not None:
+                pool.close()
+        self.residues = None
+        self.non_residues = None
+
+    def random_square(self) -> int:
+        """
+        Random quadratic residue y^2 mod n for a one-time random key y
+        Returns:
+            residue (int): drawn from the residues pool if it is set
+        """
+        if self.residues is not None:
+            return self.residues.take()
+        return random_squares(self.keys["public_key"]["n"], 1)[0]
+
+    def random_non_residue(self) -> int:
+        """
+        Random quadratic non-residue x * y^2 mod n for a one-time random key y
+        Returns:
+            non-residue (int): drawn from the non-residues pool if it is set
+        """
+        if self.non_residues is not None:
+            return self.non_residues.take()
+        return random_non_residues(
+            self.keys["public_key"]["n"], self.keys["public_key"]["x"], 1
+        )[0]
+
     def encrypt(self, plaintext: int) -> List[List[int]]:
         """
         Encrypt a given plaintext for optionally given random key with Sander-Young-Yung
@@ -121,49 +218,64 @@ class SanderYoungYung(Homomorphic):
         """
         ciphertexts = []
 
-        n = self.keys["public_key"]["n"]
         l = self.keys["public_key"]["l"]
-        x = self.keys["public_key"]["x"]
 
         m_binary = bin(plaintext)[2:]
 
         # number of bits
         k = len(m_binary)
 
-        logger.debug(f"plaintext: {plaintext}, binary: {m_binary} ({k} bits)")
+        debug = logger.is_enabled(logging.DEBUG)
+        if debug:
+            logger.log(
+                logging.DEBUG, "plaintext: %s, binary: %s (%s bits)", plaintext, m_binary, k
+            )
 
         for i in range(0, k):
-            ciphertext = []
             mi = int(m_binary[i])
 
-            logger.debug(f"Encrypting bit {i} of plaintext: {mi}")
+            if debug:
+                logger.log(logging.DEBUG, "Encrypting bit %s of plaintext: %s", i, mi)
             if mi == 1:
-                vs = [0 for _ in range(l)]
-                # vs: 1 is encoded as the zero vector in Z2^l
-                for i in range(l):
-                    yi = self.generate_random_key()
-                    ci = (yi * yi) % n
-                    ciphertext.append(ci)
-            if mi == 0:
-                while True:
-                    vs = []
-                    for i in range(l):
-                        vi = random.randint(0, 1)
-                        vs.append(vi)
-                    if sum(vs) > 0:
-                        break
-                    # vs: 0 is encoded as a nonzero vector in Z2^l
-
-                for i in range(l):
-                    yi = self.generate_random_key()
-                    ci = (yi * yi * pow(x, vs[i], n)) % n
-                    ciphertext.append(ci)
+                # 1 is encoded as the zero vector in Z2^l
+                ciphertext = [self.random_square() for _ in range(l)]
+            else:
+                # 0 is encoded as a nonzero vector in Z2^l
+                vs = 0
+                while vs == 0:
+                    vs = random.getrandbits(l)
+
+                ciphertext = [
+                    self.random_non_residue() if (vs >> j) & 1 else self.random_square()
+                    for j in range(l)
+                ]
 
             ciphertexts.append(ciphertext)
 
         return ciphertexts
 
-    def decrypt(self, ciphertext: List[List[int]]) -> int:
+    def encrypt_packed(
+        self, plaintext: int, bit_length: Optional[int] = None
+    ) -> PackedBlockCiphertext:
+        """
+        Encrypt a given plaintext into a packed ciphertext
+        Args:
+            plaintext (int): message to encrypt
+            bit_length (int): number of bits to encrypt. Leading zero bits are
+                encrypted as well. Default is bit length of plaintext.
+        Returns:
+            ciphertext (PackedBlockCiphertext): encrypted message
+        """
+        c = self.encrypt(plaintext=plaintext)
+        if bit_length is not None:
+            if bit_length < len(c):
+                raise ValueError(
+                    f"Plaintext {plaintext} does not fit into {bit_length} bits"
+                )
+            c = [self.encrypt(plaintext=0)[0] for _ in range(bit_length - len(c))] + c
+        return PackedBlockCiphertext.pack(c, self.ciphertext_modulo)
+
+    def decrypt(self, ciphertext: SYYCiphertext) -> int:
         """
         Decrypt a given ciphertext with Sander-Young-Yung
         Args:
@@ -172,59 +284,110 @@ class SanderYoungYung(Homomorphic):
             plaintext (int): restored message in binary format (0 or 1)
         """
         p = self.keys["private_key"]["p"]
-        q = self.keys["private_key"]["q"]
         l = self.keys["public_key"]["l"]
-        plaintexts = []
+
+        plaintext = 0
         for ci in ciphertext:
-            vs = []
+            # bit is 1 if all components are quadratic residues. x is a non-residue
+            # and y^2 is a residue modulo both primes, so checking modulo p is enough.
+            # one non-residue component is enough to decide the bit is 0.
+            bit = 1
             for i in range(l):
-                if jacobi_symbol(ci[i], p) == 1 and jacobi_symbol(ci[i], q) == 1:
-                    vi = 0
-                else:
-                    vi = 1
-                vs.append(vi)
-            plaintext = 1 if sum(vs) == 0 else 0
-            plaintexts.append(plaintext)
+                if jacobi(ci[i], p) != 1:
+                    bit = 0
+                    break
+            plaintext = (plaintext << 1) | bit
 
-        return int("".join(map(str, plaintexts)), 2)
+        return plaintext
 
     def homomorphic_and(
-        self, ciphertext1: List[List[int]], ciphertext2: List[List[int]]
-    ) -> List[List[int]]:
-        if len(ciphertext1) > len(ciphertext2):
-            pad = self.encrypt(plaintext=0)
-            for _ in range(len(ciphertext1) - len(ciphertext2)):
-                ciphertext2 = pad + ciphertext2
-        if len(ciphertext2) > len(ciphertext1):
-            pad = self.encrypt(plaintext=0)
-            for _ in range(len(ciphertext2) - len(ciphertext1)):
-                ciphertext1 = pad + ciphertext1
-
-        c1_and_c2_list = []
+        self, ciphertext1: SYYCiphertext, ciphertext2: SYYCiphertext
+    ) -> SYYCiphertext:
+        """
+        Perform homomorphic and on encrypted data.
+        Leading bits of the longer ciphertext are dropped instead of padding the
+        shorter one with encrypted zeros, because their and is zero.
+        Args:
+            ciphertext1: 1st ciphertext created with Sander-Young-Yung
+            ciphertext2: 2nd ciphertext created with Sander-Young-Yung
+        Returns:
+            ciphertext: encrypted and of messages. Packed if any of ciphertexts is packed.
+        """
+        return self.and_many([ciphertext1, ciphertext2])
+
+    def and_many(self, ciphertexts: Sequence[SYYCiphertext]) -> SYYCiphertext:
+        """
+        Perform homomorphic and of many ciphertexts at once
+        Args:
+            ciphertexts (list): ciphertexts created with Sander-Young-Yung
+        Returns:
+            ciphertext: encrypted and of all messages. Packed if any of ciphertexts is packed.
+        """
+        if len(ciphertexts) == 0:
+            raise ValueError("And of no ciphertexts cannot be calculated")
+
         n = self.keys["public_key"]["n"]
         l = self.keys["public_key"]["l"]
 
-        if len(ciphertext1) != len(ciphertext2):
-            raise ValueError(
-                f"Ciphertexts must have the same length but got {len(ciphertext1)} and {len(ciphertext2)}"
-            )
+        # bits are aligned at the least significant end
+        length = min(len(ciphertext) for ciphertext in ciphertexts)
 
-        for c1, c2 in zip(ciphertext1, ciphertext2):
-            if len(c1) != len(c2):
+        products: Optional[List[int]] = None
+        for ciphertext in ciphertexts:
+            values = self.__flatten(ciphertext)
+            values = values[len(values) - length * l :]
+            if products is None:
+                products = values
+            else:
+                products = [(a * b) % n for a, b in zip(products, values)]
+
+        assert products is not None
+        return self.__restore(products, packed=self.__any_packed(ciphertexts))
+
+    def reencrypt(self, ciphertext: SYYCiphertext) -> SYYCiphertext:
+        """
+        Re-generate ciphertext with re-encryption. Many ciphertext will be decrypted
+            to same plaintext.
+        Args:
+            ciphertext: given ciphertext
+        Returns:
+            ciphertext: different ciphertext for same plaintext. Packed if given one is.
+        """
+        n = self.ciphertext_modulo
+        values = [
+            (value * self.random_square()) % n for value in self.__flatten(ciphertext)
+        ]
+        return self.__restore(values, packed=isinstance(ciphertext, PackedBlockCiphertext))
+
+    def __flatten(self, ciphertext: SYYCiphertext) -> List[int]:
+        l = self.keys["public_key"]["l"]
+        if isinstance(ciphertext, PackedBlockCiphertext):
+            if ciphertext.block_size != l:
+                raise ValueError(
+                    f"Blocks of ciphertexts must have {l} integers"
+                    f" but it is {ciphertext.block_size}"
+                )
+            return ciphertext.values()
+
+        values = []
+        for block in ciphertext:
+            if len(block) != l:
                 raise ValueError(
-                    f"Ciphertexts must have the same length but got {len(c1)} and {len(c2)}"
+                    f"Blocks of ciphertexts must have {l} integers but it is {len(block)}"
                 )
-            c1_and_c2 = [(c1[i] * c2[i]) % n for i in range(l)]
-            c1_and_c2_list.append(c1_and_c2)
-        return c1_and_c2_list
+            values.extend(block)
+        return values
 
-    def reencrypt(self, ciphertext: List[List[int]]) -> List[List[int]]:
-        ciphertext_reencrypted = []
+    def __restore(self, values: List[int], packed: bool) -> SYYCiphertext:
         l = self.keys["public_key"]["l"]
-        for ci in ciphertext:
-            r = [self.generate_random_key() for _ in range(l)]
-            ci_reencrypted = [
-                (ci[i] * r[i] * r[i]) % self.ciphertext_modulo for i in range(l)
-            ]
-            ciphertext_reencrypted.append(ci_reencrypted)
-        return ciphertext_reencrypted
+        if packed:
+            return PackedBlockCiphertext.from_values(
+                values=values, modulo=self.ciphertext_modulo, block_size=l
+            )
+        return [values[start : start + l] for start in range(0, len(values), l)]
+
+    @staticmethod
+    def __any_packed(ciphertexts: Sequence[SYYCiphertext]) -> bool:
+        return any(
+            isinstance(ciphertext, PackedBlockCiphertext) for ciphertext in ciphertexts
+        )
@@ -1,18 +1,9 @@
 from typing import Union, Optional
 from lightphe.models.Homomorphic import Homomorphic
-from lightphe.models.Algorithm import Algorithm
-from lightphe.cryptosystems.RSA import RSA
-from lightphe.cryptosystems.ElGamal import ElGamal
-from lightphe.cryptosystems.Paillier import Paillier
-from lightphe.cryptosystems.DamgardJurik import DamgardJurik
-from lightphe.cryptosystems.OkamotoUchiyama import OkamotoUchiyama
-from lightphe.cryptosystems.Benaloh import Benaloh
-from lightphe.cryptosystems.NaccacheStern import NaccacheStern
-from lightphe.cryptosystems.GoldwasserMicali import GoldwasserMicali
-from lightphe.cryptosystems.EllipticCurveElGamal import EllipticCurveElGamal
-from lightphe.cryptosystems.SanderYoungYung import SanderYoungYung
-from lightphe.cryptosystems.BonehGohNissim import BonehGohNissim
+from lightphe.commons import registry
 from lightphe.commons import phe_utils
+from lightphe.commons import instrumentation
+from lightphe.commons.instrumentation import Metrics
 from lightphe.commons.logger import Logger
 
 logger = Logger(module="lightphe/models/Ciphertext.py")
@@ -21,47 +12,53 @@ logger = Logger(module="lightphe/models/Ciphertext.py")
 
 
 class Ciphertext:
+    # no per-instance dict, ciphertexts of a cryptosystem point to one shared
+    # cryptosystem object instead of carrying keys of their own
+    __slots__ = ("algorithm_name", "value", "cs")
+
     def __init__(
         self,
         algorithm_name: str,
-        keys: dict,
-        value: Union[int, tuple, list],
+        keys: Optional[dict] = None,
+        value: Optional[Union[int, tuple, list]] = None,
         form: Optional[str] = None,
         curve: Optional[str] = None,
+        metrics: Optional[Metrics] = None,
+        cs: Optional[Homomorphic] = None,
     ):
+        """
+        Args:
+            algorithm_name (str): algorithm name of the cryptosystem
+            keys (dict): public key of the cryptosystem. discarded if cs is given.
+            value (int or tuple or list): ciphertext content
+            form (str): form of the elliptic curve. discarded if cs is given.
+            curve (str): elliptic curve name. discarded if cs is given.
+            metrics (Metrics): record operations of this ciphertext. discarded if cs is given.
+            cs (Homomorphic): built cryptosystem to share with other ciphertexts.
+                It must not be modified once ciphertexts point to it.
+        """
         self.algorithm_name = algorithm_name
-        self.keys = keys
         self.value = value
 
-        if algorithm_name == Algorithm.RSA:
-            cs = RSA(keys=keys)
-        elif algorithm_name == Algorithm.ElGamal:
-            cs = ElGamal(keys=keys)
-        elif algorithm_name == Algorithm.ExponentialElGamal:
-            cs = ElGamal(keys=keys, exponential=True)
-        elif algorithm_name == Algorithm.EllipticCurveElGamal:
-            cs = EllipticCurveElGamal(keys=keys, form=form, curve=curve)
-        elif algorithm_name == Algorithm.Paillier:
-            cs = Paillier(keys=keys)
-        elif algorithm_name == Algorithm.DamgardJurik:
-            cs = DamgardJurik(keys=keys)
-        elif algorithm_name == Algorithm.OkamotoUchiyama:
-            cs = OkamotoUchiyama(keys=keys)
-        elif algorithm_name == Algorithm.Benaloh:
-            cs = Benaloh(keys=keys)
-        elif algorithm_name == Algorithm.NaccacheStern:
-            cs = NaccacheStern(keys=keys)
-        elif algorithm_name == Algorithm.GoldwasserMicali:
-            cs = GoldwasserMicali(keys=keys)
-        elif algorithm_name == Algorithm.SanderYoungYung:
-            cs = SanderYoungYung(keys=keys)
-        elif algorithm_name == Algorithm.BonehGohNissim:
-            cs = BonehGohNissim(keys=keys)
-        else:
-            raise ValueError(f"unimplemented algorithm - {algorithm_name}")
+        if cs is None:
+            if keys is None:
+                raise ValueError(
+                    "Either keys or cs must be given to build a ciphertext"
+                )
+            cs = registry.build_cryptosystem(
+                algorithm_name=algorithm_name, keys=keys, form=form, curve=curve
+            )
+            cs.metrics = metrics
 
         self.cs: Homomorphic = cs
 
+    @property
+    def keys(self) -> dict:
+        """
+        Keys of the cryptosystem this ciphertext belongs to
+        """
+        return self.cs.keys
+
     def __str__(self) -> str:
         return f"Ciphertext({self.value})"
 
@@ -79,9 +76,13 @@ class Ciphertext:
         if self.cs.keys.get("public_key") is None:
             raise ValueError("You must have public key to perform homomorphic addition")
 
+        tic = instrumentation.start(self.cs.metrics)
         result = self.cs.add(ciphertext1=self.value, ciphertext2=other.value)
+        instrumentation.stop("add", tic, self.cs.metrics)
         return Ciphertext(
-            algorithm_name=self.algorithm_name, keys=self.keys, value=result
+            algorithm_name=self.algorithm_name,
+            value=result,
+            cs=self.cs,
         )
 
     def __mul__(self, other: Union["Ciphertext", int, float]) -> "Ciphertext":
@@ -97,11 +98,14 @@ class Ciphertext:
                 "You must have public key to perform homomorphic multiplication"
             )
 
+        tic = instrumentation.start(self.cs.metrics)
         if isinstance(other, Ciphertext):
             # Handle multiplication with another EncryptedObject
             result = self.cs.multiply(ciphertext1=self.value, ciphertext2=other.value)
+            instrumentation.stop("multiply", tic, self.cs.metrics)
         elif isinstance(other, int):
             result = self.cs.multiply_by_constant(ciphertext=self.value, constant=other)
+            instrumentation.stop("scalar_multiply", tic, self.cs.metrics)
         elif isinstance(other, float):
             constant = phe_utils.normalize_input(
                 value=other, modulo=self.cs.plaintext_modulo
@@ -109,12 +113,15 @@ class Ciphertext:
             result = self.cs.multiply_by_constant(
                 ciphertext=self.value, constant=constant
             )
+            instrumentation.stop("scalar_multiply", tic, self.cs.metrics)
         else:
             raise ValueError(
                 f"A ciphertext can be multiplied by either ciphertext itself or a scalar but it is {type(other)}"
             )
         return Ciphertext(
-            algorithm_name=self.algorithm_name, keys=self.keys, value=result
+            algorithm_name=self.algorithm_name,
+            value=result,
+            cs=self.cs,
         )
 
     def __rmul__(self, constant: Union[int, float]) -> "Ciphertext":
@@ -138,9 +145,13 @@ class Ciphertext:
         if self.cs.keys.get("public_key") is None:
             raise ValueError("You must have public key to perform homomorphic xor")
 
+        tic = instrumentation.start(self.cs.metrics)
         result = self.cs.xor(ciphertext1=self.value, ciphertext2=other.value)
+        instrumentation.stop("xor", tic, self.cs.metrics)
         return Ciphertext(
-            algorithm_name=self.algorithm_name, keys=self.keys, value=result
+            algorithm_name=self.algorithm_name,
+            value=result,
+            cs=self.cs,
         )
 
     def __and__(self, other: "Ciphertext") -> "Ciphertext":
@@ -154,9 +165,13 @@ class Ciphertext:
         if self.cs.keys.get("public_key") is None:
             raise ValueError("You must have public key to perform homomorphic and")
 
+        tic = instrumentation.start(self.cs.metrics)
         result = self.cs.homomorphic_and(
             ciphertext1=self.value, ciphertext2=other.value
         )
+        instrumentation.stop("and", tic, self.cs.metrics)
         return Ciphertext(
-            algorithm_name=self.algorithm_name, keys=self.keys, value=result
+            algorithm_name=self.algorithm_name,
+            value=result,
+            cs=self.cs,
         )
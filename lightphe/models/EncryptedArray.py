@@ -0,0 +1,256 @@
+# built-in dependencies
+import os
+import mmap
+import itertools
+from typing import Iterable, Iterator, Optional, Union
+
+# project dependencies
+from lightphe.models.Homomorphic import Homomorphic
+from lightphe.models.Ciphertext import Ciphertext
+from lightphe.commons import phe_utils
+from lightphe.commons import registry
+from lightphe.commons import fixed_width
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="lightphe/models/EncryptedArray.py")
+
+# pylint: disable=too-many-instance-attributes
+
+# file layout: 8 bytes of magic, 4 bytes of item width, 4 reserved bytes, then items
+MAGIC = b"LPHEARR1"
+HEADER_SIZE = 16
+
+# number of ciphertexts read from disk at once while streaming
+DEFAULT_CHUNK_SIZE = 4096
+
+
+class EncryptedArray:
+    """
+    On-disk store of fixed-width ciphertexts backed by a memory-mapped file.
+    Available for cryptosystems whose ciphertexts are integers
+    (RSA, Paillier, Damgard-Jurik, Okamoto-Uchiyama, Benaloh, Naccache-Stern).
+    Items are decoded only when they are accessed.
+    """
+
+    def __init__(
+        self,
+        target_file: str,
+        cs: Homomorphic,
+        algorithm_name: Optional[str] = None,
+    ):
+        """
+        Open an existing encrypted array in read-only mode
+        Args:
+            target_file (str): file created with EncryptedArray.create
+            cs (Homomorphic): cryptosystem used to encrypt items of the array
+            algorithm_name (str): algorithm name of the cryptosystem.
+                Required for Exponential-ElGamal like algorithms sharing the same class.
+        """
+        self.target_file = target_file
+        self.cs = cs
+        self.algorithm_name = algorithm_name or cs.get_algorithm_name()
+        self.keys = {k: v for k, v in cs.keys.items() if k != "private_key"}
+        # shared by ciphertexts read from the array and its views
+        self.__public_cs = registry.build_cryptosystem(
+            algorithm_name=self.algorithm_name, keys=self.keys
+        )
+
+        # pylint: disable=consider-using-with
+        self._file = open(target_file, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._owner = True
+
+        if self._mmap[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{target_file} is not a valid encrypted array file")
+
+        self.width = fixed_width.decode(self._mmap[len(MAGIC) : len(MAGIC) + 4])
+        expected_width = fixed_width.byte_width(cs.ciphertext_modulo)
+        if self.width != expected_width:
+            self.close()
+            raise ValueError(
+                f"{target_file} stores {self.width} byte items but cryptosystem "
+                f"requires {expected_width} byte items"
+            )
+
+        payload_size = len(self._mmap) - HEADER_SIZE
+        if payload_size % self.width != 0:
+            self.close()
+            raise ValueError(f"{target_file} is truncated")
+
+        self._indices = range(payload_size // self.width)
+
+    @classmethod
+    def create(
+        cls,
+        target_file: str,
+        cs: Homomorphic,
+        ciphertexts: Iterable[Union[int, Ciphertext]],
+        algorithm_name: Optional[str] = None,
+    ) -> "EncryptedArray":
+        """
+        Stream ciphertexts into a new encrypted array file
+        Args:
+            target_file (str): file to create. Overwritten if it exists.
+            cs (Homomorphic): cryptosystem used to encrypt items
+            ciphertexts (iterable): integer ciphertexts or Ciphertext objects.
+                It is consumed lazily, so generators are welcome.
+            algorithm_name (str): algorithm name of the cryptosystem
+        Returns:
+            encrypted array (EncryptedArray): opened in read-only mode
+        """
+        width = fixed_width.byte_width(cs.ciphertext_modulo)
+
+        count = 0
+        with open(target_file, "wb") as file:
+            file.write(MAGIC + fixed_width.encode(width, 4) + bytes(4))
+            for ciphertext in ciphertexts:
+                value = (
+                    ciphertext.value
+                    if isinstance(ciphertext, Ciphertext)
+                    else ciphertext
+                )
+                file.write(fixed_width.encode(value, width))
+                count += 1
+
+        logger.debug(
+            "%s ciphertexts stored in %s (%s bytes each)", count, target_file, width
+        )
+        return cls(target_file=target_file, cs=cs, algorithm_name=algorithm_name)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(
+        self, key: Union[int, slice]
+    ) -> Union[Ciphertext, "EncryptedArray"]:
+        """
+        Access a ciphertext or a view of many ciphertexts
+        Args:
+            key (int or slice): index or slice
+        Returns:
+            ciphertext (Ciphertext) for index, encrypted array view (EncryptedArray) for slice
+        """
+        if isinstance(key, slice):
+            view = object.__new__(EncryptedArray)
+            view.__dict__.update(self.__dict__)
+            view._indices = self._indices[key]
+            view._owner = False
+            return view
+
+        return self.__wrap(self.__read(self._indices[key]))
+
+    def __iter__(self) -> Iterator[Ciphertext]:
+        for value in self.values():
+            yield self.__wrap(value)
+
+    def __repr__(self) -> str:
+        return f"EncryptedArray({self.target_file}, {len(self)} items)"
+
+    def __enter__(self) -> "EncryptedArray":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def values(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[int]:
+        """
+        Lazily iterate raw integer ciphertexts, reading the file chunk by chunk
+        Args:
+            chunk_size (int): number of ciphertexts read at once
+        Yields:
+            ciphertext (int)
+        """
+        indices = self._indices
+        if indices.step != 1:
+            for index in indices:
+                yield self.__read(index)
+            return
+
+        for chunk_start in range(indices.start, indices.stop, chunk_size):
+            chunk_stop = min(chunk_start + chunk_size, indices.stop)
+            start = HEADER_SIZE + chunk_start * self.width
+            stop = HEADER_SIZE + chunk_stop * self.width
+            # copy just this chunk so that no buffer of the map is exported
+            yield from fixed_width.iter_decode(self._mmap[start:stop], self.width)
+
+    def sum(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Ciphertext:
+        """
+        Perform homomorphic addition of all items by streaming over the file
+        Args:
+            chunk_size (int): number of ciphertexts read at once
+        Returns:
+            ciphertext (Ciphertext): encrypted sum of items
+        """
+        total = None
+        for value in self.values(chunk_size=chunk_size):
+            total = (
+                value
+                if total is None
+                else self.cs.add(ciphertext1=total, ciphertext2=value)
+            )
+
+        if total is None:
+            raise ValueError("Sum cannot be calculated for empty encrypted array")
+
+        return self.__wrap(total)
+
+    def weighted_sum(
+        self,
+        weights: Iterable[Union[int, float]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Ciphertext:
+        """
+        Perform homomorphic weighted sum of items with plain weights by streaming over the file
+        Args:
+            weights (iterable of int or float): plain weights, consumed lazily
+            chunk_size (int): number of ciphertexts read at once
+        Returns:
+            ciphertext (Ciphertext): encrypted weighted sum of items
+        """
+        total = None
+        missing = object()
+        for value, weight in itertools.zip_longest(
+            self.values(chunk_size=chunk_size), weights, fillvalue=missing
+        ):
+            if value is missing or weight is missing:
+                raise ValueError("Weights and encrypted array must have same length")
+
+            constant = phe_utils.normalize_input(
+                value=weight, modulo=self.cs.plaintext_modulo
+            )
+            weighted = self.cs.multiply_by_constant(ciphertext=value, constant=constant)
+            total = (
+                weighted
+                if total is None
+                else self.cs.add(ciphertext1=total, ciphertext2=weighted)
+            )
+
+        if total is None:
+            raise ValueError("Sum cannot be calculated for empty encrypted array")
+
+        return self.__wrap(total)
+
+    def close(self) -> None:
+        """
+        Release the memory map and the file handle. Views of a closed array become unusable.
+        """
+        if self._owner is True and not self._mmap.closed:
+            self._mmap.close()
+            self._file.close()
+
+    def remove(self) -> None:
+        """
+        Close the array and delete its file
+        """
+        self.close()
+        os.remove(self.target_file)
+
+    def __read(self, index: int) -> int:
+        start = HEADER_SIZE + index * self.width
+        return fixed_width.decode(self._mmap[start : start + self.width])
+
+    def __wrap(self, value: int) -> Ciphertext:
+        return Ciphertext(
+            algorithm_name=self.algorithm_name, value=value, cs=self.__public_cs
+        )
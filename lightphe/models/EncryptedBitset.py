@@ -0,0 +1,215 @@
+# built-in dependencies
+import functools
+from typing import Any, List, Optional, Sequence, Union
+
+# project dependencies
+from lightphe.models.Homomorphic import Homomorphic
+from lightphe.models.Ciphertext import Ciphertext
+from lightphe.models.PackedCiphertext import PackedCiphertext, PackedBlockCiphertext
+from lightphe.commons import phe_utils
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="lightphe/models/EncryptedBitset.py")
+
+# cryptosystems encrypting bit by bit and their homomorphic bitwise operation
+BITWISE_OPERATIONS = {
+    "Goldwasser-Micali": "xor",
+    "Sander-Young-Yung": "and",
+}
+
+Lane = Union[PackedCiphertext, PackedBlockCiphertext]
+
+
+class EncryptedBitset:
+    """
+    Vector of unsigned integers encrypted bit by bit into fixed width lanes, e.g.
+    feature flags of many users. Lanes are packed ciphertexts of Goldwasser-Micali,
+    supporting element-wise xor, or Sander-Young-Yung, supporting element-wise and.
+    Bignum work of lanes can be run in many processes.
+    """
+
+    def __init__(
+        self,
+        lanes: List[Lane],
+        cs: Homomorphic,
+        bit_width: int,
+        workers: Optional[int] = None,
+    ):
+        """
+        Args:
+            lanes (list): packed ciphertexts of items having bit_width bits each
+            cs (Homomorphic): Goldwasser-Micali or Sander-Young-Yung cryptosystem
+            bit_width (int): number of bits per item
+            workers (int): number of processes for operations. Default is 1.
+        """
+        self.lanes = lanes
+        self.cs = cs
+        self.bit_width = bit_width
+        self.workers = workers
+        self.algorithm_name = cs.get_algorithm_name()
+
+    @classmethod
+    def encrypt(
+        cls,
+        values: Union[Sequence[int], Any],
+        cs: Homomorphic,
+        bit_width: Optional[int] = None,
+        workers: Optional[int] = None,
+    ) -> "EncryptedBitset":
+        """
+        Encrypt unsigned integers into fixed width lanes
+        Args:
+            values (list of int or numpy array): unsigned integers
+            cs (Homomorphic): Goldwasser-Micali or Sander-Young-Yung cryptosystem
+            bit_width (int): number of bits per item. Default is bit length of the largest one.
+            workers (int): number of processes encrypting items. Default is 1.
+        Returns:
+            encrypted bitset (EncryptedBitset)
+        """
+        algorithm_name = cs.get_algorithm_name()
+        if algorithm_name not in BITWISE_OPERATIONS:
+            raise ValueError(
+                f"Encrypted bitsets require one of {list(BITWISE_OPERATIONS)}"
+                f" but it is {algorithm_name}"
+            )
+
+        if phe_utils.is_array(values):
+            values = values.ravel().tolist()
+        values = [int(value) for value in values]
+
+        if any(value < 0 for value in values):
+            raise ValueError("Encrypted bitsets can store unsigned integers only")
+
+        if bit_width is None:
+            bit_width = max((value.bit_length() for value in values), default=1) or 1
+        elif bit_width < 1:
+            raise ValueError(f"Bit width must be positive but it is {bit_width}")
+
+        lanes = run(
+            cs=cs,
+            method="encrypt_packed",
+            arguments=[(value, bit_width) for value in values],
+            workers=workers,
+        )
+        return cls(lanes=lanes, cs=cs, bit_width=bit_width, workers=workers)
+
+    def decrypt(self, cs: Homomorphic, as_numpy: bool = False) -> Union[List[int], Any]:
+        """
+        Decrypt lanes
+        Args:
+            cs (Homomorphic): cryptosystem having private key
+            as_numpy (bool): restore into a numpy array
+        Returns:
+            values (list of int or numpy array)
+        """
+        values = run(
+            cs=cs,
+            method="decrypt",
+            arguments=[(lane,) for lane in self.lanes],
+            workers=self.workers,
+        )
+        if as_numpy:
+            # pylint: disable=import-outside-toplevel
+            import numpy as np
+
+            return np.array(values, dtype=np.uint64 if self.bit_width <= 64 else object)
+        return values
+
+    def __len__(self) -> int:
+        return len(self.lanes)
+
+    def __getitem__(
+        self, key: Union[int, slice]
+    ) -> Union[Ciphertext, "EncryptedBitset"]:
+        if isinstance(key, slice):
+            return self.__like(self.lanes[key])
+        return Ciphertext(
+            algorithm_name=self.algorithm_name, value=self.lanes[key], cs=self.cs
+        )
+
+    def __xor__(self, other: "EncryptedBitset") -> "EncryptedBitset":
+        """
+        Element-wise homomorphic xor of Goldwasser-Micali bitsets
+        """
+        return self.__combine(other, operation="xor", method="xor_many")
+
+    def __and__(self, other: "EncryptedBitset") -> "EncryptedBitset":
+        """
+        Element-wise homomorphic and of Sander-Young-Yung bitsets
+        """
+        return self.__combine(other, operation="and", method="and_many")
+
+    def __repr__(self) -> str:
+        return f"EncryptedBitset({len(self)} items of {self.bit_width} bits)"
+
+    def __combine(
+        self, other: "EncryptedBitset", operation: str, method: str
+    ) -> "EncryptedBitset":
+        if not isinstance(other, EncryptedBitset):
+            raise ValueError(
+                f"Encrypted bitsets support {operation} with encrypted bitsets"
+                f" but it is {type(other)}"
+            )
+        if BITWISE_OPERATIONS[self.algorithm_name] != operation:
+            raise ValueError(
+                f"{self.algorithm_name} is not homomorphic with respect to {operation}"
+            )
+        if len(self) != len(other) or self.bit_width != other.bit_width:
+            raise ValueError(
+                f"Encrypted bitsets must have the same shape but they have {len(self)}"
+                f" items of {self.bit_width} bits and {len(other)} items of"
+                f" {other.bit_width} bits"
+            )
+
+        lanes = run(
+            cs=self.cs,
+            method=method,
+            arguments=[([a, b],) for a, b in zip(self.lanes, other.lanes)],
+            workers=self.workers,
+        )
+        return self.__like(lanes)
+
+    def __like(self, lanes: List[Lane]) -> "EncryptedBitset":
+        return EncryptedBitset(
+            lanes=lanes, cs=self.cs, bit_width=self.bit_width, workers=self.workers
+        )
+
+
+def run(
+    cs: Homomorphic,
+    method: str,
+    arguments: List[tuple],
+    workers: Optional[int] = None,
+) -> List[Any]:
+    """
+    Call a method of a cryptosystem for many arguments, in a process pool if
+        many workers are requested
+    Args:
+        cs (Homomorphic): cryptosystem
+        method (str): method name
+        arguments (list of tuple): positional arguments per call
+        workers (int): number of processes. Default is 1.
+    Returns:
+        results (list): in order of arguments
+    """
+    workers = min(workers or 1, len(arguments))
+    if workers <= 1:
+        return call_chunk(cs, method, arguments)
+
+    # pylint: disable=import-outside-toplevel
+    import multiprocessing
+    from contextlib import closing
+    from lightphe.models.Tensor import chunkify
+
+    # cryptosystem is sent once per chunk
+    with closing(multiprocessing.Pool(workers)) as pool:
+        chunks = pool.map(
+            functools.partial(call_chunk, cs, method), chunkify(arguments, workers)
+        )
+    return [result for chunk in chunks for result in chunk]
+
+
+def call_chunk(cs: Homomorphic, method: str, arguments: List[tuple]) -> List[Any]:
+    """Call a method of a cryptosystem for a chunk of arguments."""
+    func = getattr(cs, method)
+    return [func(*args) for args in arguments]
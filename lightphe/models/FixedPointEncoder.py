@@ -0,0 +1,213 @@
+# built-in dependencies
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+# project dependencies
+from lightphe.commons import phe_utils
+
+# pylint: disable=too-many-branches
+
+
+class FixedPointEncoder:
+    """
+    Encode real numbers into the plaintext space of a cryptosystem as fixed-point
+    integers, i.e. values scaled by 10^precision and truncated. Negative values
+    are encoded as modulo - |scaled value| like in two's complement, so they can
+    be restored with to_signed while their magnitude is below modulo / 2.
+    """
+
+    def __init__(self, modulo: int, precision: int = 5):
+        """
+        Args:
+            modulo (int): plaintext modulo of the cryptosystem
+            precision (int): number of digits kept after dot
+        """
+        if not isinstance(modulo, int) or modulo < 2:
+            raise ValueError(
+                f"Fixed-point encoding requires an integer modulo but got {modulo}"
+            )
+        if precision < 0:
+            raise ValueError(f"Precision must be non-negative but it is {precision}")
+
+        self.modulo = modulo
+        self.precision = precision
+        self.scale = 10**precision
+
+    def encode_magnitude(self, value: Union[int, float]) -> int:
+        """
+        Scale absolute value of a number
+        Args:
+            value (int or float): number to encode
+        Returns:
+            magnitude (int): trunc(|value| * 10^precision) mod modulo
+        """
+        if isinstance(value, int):
+            return (abs(value) * self.scale) % self.modulo
+
+        # exact ratio of the float, so no decimal context is required
+        numerator, denominator = abs(value).as_integer_ratio()
+        return (numerator * self.scale // denominator) % self.modulo
+
+    def encode(self, value: Union[int, float]) -> int:
+        """
+        Encode a number
+        Args:
+            value (int or float): number to encode
+        Returns:
+            encoded value (int): scaled value mod modulo
+        """
+        magnitude = self.encode_magnitude(value)
+        return (self.modulo - magnitude) % self.modulo if value < 0 else magnitude
+
+    def encode_batch(self, values: Any) -> Tuple[List[int], List[int], List[int]]:
+        """
+        Encode many numbers. Numpy arrays are encoded in numpy at once.
+        Args:
+            values (list or numpy.ndarray): numbers to encode, flattened in row-major order
+        Returns:
+            encoded values (list of int): scaled values mod modulo
+            magnitudes (list of int): scaled absolute values mod modulo
+            signs (list of int): 1 or -1
+        """
+        if phe_utils.is_array(values):
+            return self.__encode_array(values)
+
+        encoded, magnitudes, signs = [], [], []
+        for value in values:
+            magnitude = self.encode_magnitude(value)
+            negative = value < 0
+            magnitudes.append(magnitude)
+            encoded.append(
+                (self.modulo - magnitude) % self.modulo if negative else magnitude
+            )
+            signs.append(-1 if negative else 1)
+        return encoded, magnitudes, signs
+
+    def to_signed(self, residue: int) -> int:
+        """
+        Restore a signed integer from its residue. Upper half of the plaintext
+            space is interpreted as negative values.
+        Args:
+            residue (int): decrypted value in [0, modulo)
+        Returns:
+            value (int): in (-modulo / 2, modulo / 2]
+        """
+        return residue - self.modulo if residue > self.modulo // 2 else residue
+
+    def decode(
+        self, magnitude: int, sign: int = 1, divisor: Optional[int] = None
+    ) -> float:
+        """
+        Restore a number from its decrypted magnitude
+        Args:
+            magnitude (int): decrypted scaled absolute value
+            sign (int): 1 or -1
+            divisor (int): decrypted divisor. default is 10^precision.
+                products of fixed-point values are scaled by its powers.
+        Returns:
+            value (float)
+        """
+        return sign * magnitude / (divisor or self.scale)
+
+    def decode_batch(
+        self,
+        magnitudes: List[int],
+        signs: List[int],
+        divisors: Optional[List[int]] = None,
+        as_numpy: bool = False,
+        shape: Optional[Sequence[int]] = None,
+    ) -> Any:
+        """
+        Restore many numbers from their decrypted magnitudes
+        Args:
+            magnitudes (list of int): decrypted scaled absolute values
+            signs (list of int): 1 or -1
+            divisors (list of int): decrypted divisors. default is 10^precision.
+            as_numpy (bool): restore into a numpy array
+            shape (tuple): dimensions of the numpy array
+        Returns:
+            values (list of float or numpy.ndarray)
+        """
+        if divisors is None:
+            divisors = [self.scale] * len(magnitudes)
+
+        if not as_numpy:
+            return [
+                sign * magnitude / divisor
+                for magnitude, sign, divisor in zip(magnitudes, signs, divisors)
+            ]
+
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+
+        try:
+            quotients = np.asarray(magnitudes, dtype=np.float64) / np.asarray(
+                divisors, dtype=np.float64
+            )
+        except OverflowError:
+            # magnitudes of mixed sign additions may exceed float range
+            quotients = np.array([m / d for m, d in zip(magnitudes, divisors)])
+
+        values = np.asarray(signs, dtype=np.float64) * quotients
+        return values if shape is None else values.reshape(tuple(shape))
+
+    def __encode_array(self, array: Any) -> Tuple[List[int], List[int], List[int]]:
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+
+        values = np.asarray(array).ravel()
+        if values.dtype.kind not in "iuf":
+            raise ValueError(
+                f"Numeric arrays can be encrypted but dtype is {values.dtype}"
+            )
+
+        negative = values < 0
+
+        if values.dtype.kind == "f":
+            if not np.all(np.isfinite(values)):
+                raise ValueError("Arrays having NaN or infinity cannot be encrypted")
+            magnitudes = np.trunc(np.abs(values) * self.scale)
+            largest = int(magnitudes.max()) if magnitudes.size > 0 else 0
+            if largest < 2**62:
+                magnitudes = magnitudes.astype(np.int64)
+            else:
+                # beyond int64, scale exact ratios of floats in python
+                magnitudes = np.array(
+                    [self.encode_magnitude(value) for value in values.tolist()],
+                    dtype=object,
+                )
+        else:
+            largest = (
+                max(abs(int(values.min())), abs(int(values.max())))
+                if values.size > 0
+                else 0
+            )
+            largest *= self.scale
+            if largest < 2**62:
+                magnitudes = np.abs(values.astype(np.int64)) * self.scale
+            else:
+                # python integers do not overflow
+                magnitudes = np.abs(values.astype(object)) * self.scale
+
+        if largest >= self.modulo:
+            magnitudes = magnitudes % self.modulo
+
+        if self.modulo < 2**62:
+            # fits into int64, normalize negative values in numpy
+            encoded = np.where(
+                negative, (self.modulo - magnitudes) % self.modulo, magnitudes
+            )
+            return (
+                encoded.tolist(),
+                magnitudes.tolist(),
+                np.where(negative, -1, 1).tolist(),
+            )
+
+        magnitudes = magnitudes.tolist()
+        encoded = list(magnitudes)
+        signs = [1] * len(magnitudes)
+        for i in np.flatnonzero(negative).tolist():
+            if magnitudes[i] != 0:
+                encoded[i] = self.modulo - magnitudes[i]
+            signs[i] = -1
+
+        return encoded, magnitudes, signs
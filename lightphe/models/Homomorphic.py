@@ -1,12 +1,17 @@
 # built-in dependencies
-from typing import Optional, Union
+from typing import List, Optional, Union, TYPE_CHECKING
 from abc import ABC, abstractmethod
 
-# 3rd party dependencies
-from lightecc.interfaces.elliptic_curve import EllipticCurvePoint
-
 # project dependencies
 from lightphe.models.Algorithm import Algorithm
+from lightphe.commons.instrumentation import Metrics
+from lightphe.commons.logger import Logger
+
+if TYPE_CHECKING:
+    # imported for type hints only, lightecc is loaded by elliptic curve based cryptosystems
+    from lightecc.interfaces.elliptic_curve import EllipticCurvePoint
+
+logger = Logger(module="lightphe/models/Homomorphic.py")
 
 
 # Signature for supported cryptosystems
@@ -24,6 +29,9 @@ class Homomorphic(ABC):
     #       holds a dict to its required sub-fields.
     REQUIRED_KEYS: dict
 
+    # per instance metrics, e.g. to count DLP iterations in decryption
+    metrics: Optional[Metrics] = None
+
     @abstractmethod
     def generate_keys(
         self,
@@ -31,6 +39,7 @@ class Homomorphic(ABC):
         s: Optional[int] = None,
         max_retries: Optional[int] = None,
         plaintext_limit: Optional[int] = None,
+        workers: Optional[int] = None,
     ) -> dict:
         pass
 
@@ -41,61 +50,132 @@ class Homomorphic(ABC):
     @abstractmethod
     def encrypt(
         self, plaintext: int, random_key: Union[Optional[int], Optional[list]] = None
-    ) -> Union[int, tuple, list, EllipticCurvePoint]:
+    ) -> Union[int, tuple, list, "EllipticCurvePoint"]:
         pass
 
     @abstractmethod
-    def decrypt(self, ciphertext: Union[int, tuple, list, EllipticCurvePoint]) -> int:
+    def decrypt(self, ciphertext: Union[int, tuple, list, "EllipticCurvePoint"]) -> int:
         pass
 
     def add(
         self,
-        ciphertext1: Union[int, tuple, list, EllipticCurvePoint],
-        ciphertext2: Union[int, tuple, list, EllipticCurvePoint],
-    ) -> Union[int, tuple, list, EllipticCurvePoint]:
+        ciphertext1: Union[int, tuple, list, "EllipticCurvePoint"],
+        ciphertext2: Union[int, tuple, list, "EllipticCurvePoint"],
+    ) -> Union[int, tuple, list, "EllipticCurvePoint"]:
         raise ValueError(
             f"{self.get_algorithm_name()} is not homomorphic with respect to the addition"
         )
 
     def multiply(
         self,
-        ciphertext1: Union[int, tuple, list, EllipticCurvePoint],
-        ciphertext2: Union[int, tuple, list, EllipticCurvePoint],
-    ) -> Union[int, tuple, list, EllipticCurvePoint]:
+        ciphertext1: Union[int, tuple, list, "EllipticCurvePoint"],
+        ciphertext2: Union[int, tuple, list, "EllipticCurvePoint"],
+    ) -> Union[int, tuple, list, "EllipticCurvePoint"]:
         raise ValueError(
             f"{self.get_algorithm_name()} is not homomorphic with respect to the multiplication"
         )
 
     def xor(
         self,
-        ciphertext1: Union[int, tuple, list, EllipticCurvePoint],
-        ciphertext2: Union[int, tuple, list, EllipticCurvePoint],
-    ) -> Union[int, tuple, list, EllipticCurvePoint]:
+        ciphertext1: Union[int, tuple, list, "EllipticCurvePoint"],
+        ciphertext2: Union[int, tuple, list, "EllipticCurvePoint"],
+    ) -> Union[int, tuple, list, "EllipticCurvePoint"]:
         raise ValueError(
             f"{self.get_algorithm_name()} is not homomorphic with respect to the exclusive or"
         )
 
     def homomorphic_and(
         self,
-        ciphertext1: Union[int, tuple, list, EllipticCurvePoint],
-        ciphertext2: Union[int, tuple, list, EllipticCurvePoint],
-    ) -> Union[int, tuple, list, EllipticCurvePoint]:
+        ciphertext1: Union[int, tuple, list, "EllipticCurvePoint"],
+        ciphertext2: Union[int, tuple, list, "EllipticCurvePoint"],
+    ) -> Union[int, tuple, list, "EllipticCurvePoint"]:
         raise ValueError(
             f"{self.get_algorithm_name()} is not homomorphic with respect to the bitwise and"
         )
 
     def multiply_by_constant(
-        self, ciphertext: Union[int, tuple, list, EllipticCurvePoint], constant: int
-    ) -> Union[int, tuple, list, EllipticCurvePoint]:
+        self, ciphertext: Union[int, tuple, list, "EllipticCurvePoint"], constant: int
+    ) -> Union[int, tuple, list, "EllipticCurvePoint"]:
         raise ValueError(
             f"{self.get_algorithm_name()} is not supporting multiplying ciphertext by a known constant"
         )
 
     def reencrypt(
-        self, ciphertext: Union[int, tuple, list, EllipticCurvePoint]
-    ) -> Union[int, tuple, list, EllipticCurvePoint]:
+        self, ciphertext: Union[int, tuple, list, "EllipticCurvePoint"]
+    ) -> Union[int, tuple, list, "EllipticCurvePoint"]:
         raise ValueError(f"{self.get_algorithm_name()} does not support re-encryption")
 
+    def reencrypt_many(
+        self, ciphertexts: List[Union[int, tuple, list, "EllipticCurvePoint"]]
+    ) -> List[Union[int, tuple, list, "EllipticCurvePoint"]]:
+        """
+        Re-generate many ciphertexts. Cryptosystems override this to share
+        precomputations across the batch.
+        Args:
+            ciphertexts (list): given ciphertexts
+        Returns:
+            new ciphertexts (list): different ciphertexts for same plaintexts
+        """
+        return [self.reencrypt(ciphertext=ciphertext) for ciphertext in ciphertexts]
+
+    def multiply_many(
+        self, ciphertexts: List[Union[int, tuple, list, "EllipticCurvePoint"]]
+    ) -> Union[int, tuple, list, "EllipticCurvePoint"]:
+        """
+        Homomorphic product of many ciphertexts with a balanced product tree.
+        Products are reduced at each level, so operands stay as large as a ciphertext.
+        Args:
+            ciphertexts (list): encrypted messages
+        Returns:
+            ciphertext: encrypted product
+        """
+        if len(ciphertexts) == 0:
+            raise ValueError("Product of no ciphertexts cannot be calculated")
+
+        level = list(ciphertexts)
+        while len(level) > 1:
+            products = [
+                self.multiply(ciphertext1=level[i], ciphertext2=level[i + 1])
+                for i in range(0, len(level) - 1, 2)
+            ]
+            if len(level) % 2 == 1:
+                products.append(level[-1])
+            level = products
+        return level[0]
+
+    def get_precomputations(self) -> dict:
+        """
+        Values derived from private key which are costly to calculate such as
+        modular inverses or DLP tables. They are calculated once, cached in the
+        cryptosystem and can be exported together with keys.
+        Returns:
+            precomputations (dict): empty if private key is not available
+        """
+        return {}
+
+    def set_precomputations(self, precomputations: dict) -> None:
+        """
+        Load values previously calculated by get_precomputations
+        Args:
+            precomputations (dict): exported precomputations
+        """
+        if precomputations:
+            logger.debug(
+                f"{self.get_algorithm_name()} does not use precomputations, discarded"
+            )
+
+    def clear_precomputations(self) -> None:
+        """
+        Drop values derived from private key, e.g. once the private key is removed
+        """
+
+    def __getstate__(self) -> dict:
+        # copies and pickles without the private key do not carry values derived
+        # from it
+        if self.keys.get("private_key") is None:
+            self.clear_precomputations()
+        return self.__dict__
+
     def get_algorithm_name(self) -> str:
         class_name = self.__class__.__name__
         algorithm_name = getattr(Algorithm, class_name, None)
@@ -0,0 +1,245 @@
+# built-in dependencies
+import time
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future
+from typing import Deque, Dict, Optional, Set, Tuple
+
+# project dependencies
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="lightphe/models/KeyPool.py")
+
+# pylint: disable=too-many-instance-attributes, too-few-public-methods
+
+# (algorithm name, key size, options affecting keys such as curve or plaintext limit)
+Spec = Tuple[str, Optional[int], Tuple[Tuple[str, object], ...]]
+
+# seconds to wait before generating keys again after a failure, doubled per
+# consecutive failure, so that a spec failing deterministically does not spin
+RETRY_DELAY = 0.1
+MAX_RETRY_DELAY = 30.0
+
+
+def _generate_keys(algorithm_name: str, key_size: Optional[int], options: dict) -> dict:
+    """
+    Generate a private-public key pair. Run in a worker of the pool's executor.
+    """
+    # pylint: disable=import-outside-toplevel, cyclic-import
+    from lightphe import LightPHE
+
+    cs = LightPHE(algorithm_name=algorithm_name, key_size=key_size, **options)
+    return cs.cs.keys
+
+
+class _Slot:
+    """
+    Ready keys and refill state of a registered (algorithm, key size, options)
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.ready: Deque[dict] = deque()
+        self.in_flight: Set[Future] = set()
+        self.error: Optional[BaseException] = None
+        self.failures = 0
+        # monotonic time before which failed generation is not retried
+        self.retry_at = 0.0
+
+
+class KeyPool:
+    """
+    Keeps pre-generated private-public key pairs ready, so that building a
+    cryptosystem per tenant or session does not block on key generation.
+    Consumed keys are replaced in background.
+    """
+
+    def __init__(
+        self,
+        size: int = 4,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Args:
+            size (int): default number of ready key pairs per registered spec
+            workers (int): number of processes generating keys. Default is cpu count.
+            executor (Executor): optional executor to generate keys in, e.g. a
+                ThreadPoolExecutor. It is not shut down when the pool is closed.
+        """
+        if size < 1:
+            raise ValueError(f"pool size must be positive but it was {size}")
+
+        if executor is None:
+            # pylint: disable=import-outside-toplevel
+            from concurrent.futures import ProcessPoolExecutor
+
+            executor = ProcessPoolExecutor(max_workers=workers)
+            self._owns_executor = True
+        else:
+            self._owns_executor = False
+
+        self.size = size
+        self._executor = executor
+        self._slots: Dict[Spec, _Slot] = {}
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def register(
+        self,
+        algorithm_name: str,
+        key_size: Optional[int] = None,
+        size: Optional[int] = None,
+        **options,
+    ) -> None:
+        """
+        Start generating key pairs for an algorithm in background
+        Args:
+            algorithm_name (str): algorithm to generate keys for
+            key_size (int): key size in bits. Default of the algorithm if not set.
+            size (int): number of ready key pairs. Default is the pool size.
+            options: form, curve, plaintext_limit or group arguments of LightPHE
+        """
+        spec = self.__spec(algorithm_name, key_size, options)
+        with self._condition:
+            slot = self._slots.get(spec)
+            if slot is None:
+                slot = self._slots[spec] = _Slot(size=size or self.size)
+            elif size is not None:
+                slot.size = size
+            self.__refill(spec, slot)
+
+    def acquire(
+        self,
+        algorithm_name: str,
+        key_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        **options,
+    ) -> dict:
+        """
+        Take a ready key pair out of the pool. A spec which is not registered
+        yet is registered with the pool size.
+        Args:
+            algorithm_name (str): algorithm to get keys for
+            key_size (int): key size in bits. Default of the algorithm if not set.
+            timeout (float): seconds to wait if there is no ready key pair.
+                Waits until one is generated if not set.
+            options: form, curve, plaintext_limit or group arguments of LightPHE
+        Returns:
+            keys (dict): private-public key pair which is not handed out before
+        """
+        spec = self.__spec(algorithm_name, key_size, options)
+        # notifications of other specs must not restart the timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            slot = self._slots.get(spec)
+            if slot is None:
+                slot = self._slots[spec] = _Slot(size=self.size)
+
+            while not slot.ready:
+                if slot.error is not None and not slot.in_flight:
+                    error, slot.error = slot.error, None
+                    raise error
+                if self._closed:
+                    raise ValueError("key pool is closed")
+
+                # generation may have stopped after a failure raised before
+                self.__refill(spec, slot)
+                if slot.ready or slot.error is not None:
+                    # generated or failed in a done callback run by refill
+                    continue
+
+                now = time.monotonic()
+                remaining = None if deadline is None else deadline - now
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(
+                        f"no keys for {algorithm_name} became ready in {timeout} seconds"
+                    )
+                if not slot.in_flight and slot.retry_at > now:
+                    # wake up to retry once the backoff passes
+                    backoff = slot.retry_at - now
+                    remaining = (
+                        backoff if remaining is None else min(remaining, backoff)
+                    )
+                self._condition.wait(timeout=remaining)
+
+            keys = slot.ready.popleft()
+            self.__refill(spec, slot)
+
+        return keys
+
+    def available(
+        self, algorithm_name: str, key_size: Optional[int] = None, **options
+    ) -> int:
+        """
+        Number of ready key pairs for an algorithm
+        """
+        spec = self.__spec(algorithm_name, key_size, options)
+        with self._condition:
+            slot = self._slots.get(spec)
+            return 0 if slot is None else len(slot.ready)
+
+    def close(self) -> None:
+        """
+        Stop refilling and drop ready key pairs
+        """
+        with self._condition:
+            self._closed = True
+            for slot in self._slots.values():
+                slot.ready.clear()
+                # cancelling runs the done callback which discards the future
+                for future in list(slot.in_flight):
+                    future.cancel()
+            self._condition.notify_all()
+
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    def __enter__(self) -> "KeyPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @staticmethod
+    def __spec(algorithm_name: str, key_size: Optional[int], options: dict) -> Spec:
+        # options not set are not part of the spec
+        return (
+            algorithm_name,
+            key_size,
+            tuple(sorted((k, v) for k, v in options.items() if v is not None)),
+        )
+
+    def __refill(self, spec: Spec, slot: _Slot) -> None:
+        # called with the condition acquired. done callbacks of futures completed
+        # already run in add_done_callback, so backoff is checked after each of them.
+        while (
+            not self._closed
+            and slot.retry_at <= time.monotonic()
+            and len(slot.ready) + len(slot.in_flight) < slot.size
+        ):
+            algorithm_name, key_size, options = spec
+            future = self._executor.submit(
+                _generate_keys, algorithm_name, key_size, dict(options)
+            )
+            slot.in_flight.add(future)
+            future.add_done_callback(
+                lambda future, slot=slot: self.__on_generated(slot, future)
+            )
+
+    def __on_generated(self, slot: _Slot, future: Future) -> None:
+        with self._condition:
+            slot.in_flight.discard(future)
+            if future.cancelled():
+                pass
+            elif future.exception() is not None:
+                logger.error(f"Key generation failed: {future.exception()}")
+                slot.error = future.exception()
+                slot.failures += 1
+                slot.retry_at = time.monotonic() + min(
+                    MAX_RETRY_DELAY, RETRY_DELAY * 2 ** (slot.failures - 1)
+                )
+            elif not self._closed:
+                slot.failures = 0
+                slot.ready.append(future.result())
+            self._condition.notify_all()
@@ -0,0 +1,211 @@
+# built-in dependencies
+from typing import Iterator, List, Union
+
+# project dependencies
+from lightphe.commons import fixed_width
+
+
+class PackedCiphertext:
+    """
+    Ciphertext of a bitwise encrypting cryptosystem (e.g. Goldwasser-Micali) stored
+    in a contiguous fixed width buffer instead of a list of integers. Items are the
+    ciphertexts of bits from the most significant to the least significant one.
+    """
+
+    __slots__ = ("buffer", "width", "length")
+
+    def __init__(self, buffer: bytes, width: int, length: int):
+        """
+        Args:
+            buffer (bytes): ciphertexts of bits in fixed width encoding
+            width (int): number of bytes per ciphertext
+            length (int): number of bits
+        """
+        if len(buffer) != width * length:
+            raise ValueError(
+                f"Buffer of {length} ciphertexts having {width} bytes must be"
+                f" {width * length} bytes but it is {len(buffer)}"
+            )
+        self.buffer = buffer
+        self.width = width
+        self.length = length
+
+    @classmethod
+    def pack(cls, ciphertexts: List[int], modulo: int) -> "PackedCiphertext":
+        """
+        Pack ciphertexts of bits
+        Args:
+            ciphertexts (list of int): ciphertexts of bits
+            modulo (int): ciphertext modulo
+        Returns:
+            packed ciphertext (PackedCiphertext)
+        """
+        width = fixed_width.byte_width(modulo)
+        return cls(
+            buffer=fixed_width.encode_many(ciphertexts, width),
+            width=width,
+            length=len(ciphertexts),
+        )
+
+    def unpack(self) -> List[int]:
+        """
+        Restore ciphertexts of bits
+        Returns:
+            ciphertexts (list of int)
+        """
+        return list(self)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[int]:
+        return fixed_width.iter_decode(self.buffer, self.width)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, List[int]]:
+        return fixed_width.FixedWidthArray(self.buffer, self.width, self.length)[index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PackedCiphertext):
+            return NotImplemented
+        return self.width == other.width and self.buffer == other.buffer
+
+    def __hash__(self) -> int:
+        return hash((self.width, self.buffer))
+
+    def __repr__(self) -> str:
+        return f"PackedCiphertext({self.length} bits, {self.width} bytes per bit)"
+
+
+class PackedBlockCiphertext:
+    """
+    Ciphertext of a cryptosystem encrypting each bit into a block of integers
+    (e.g. Sander-Young-Yung) stored in a contiguous fixed width buffer as a 2-D
+    array having a row per bit from the most significant to the least significant
+    one. Buffer can be any bytes-like object, so it is serialized and restored
+    without copying.
+    """
+
+    __slots__ = ("buffer", "width", "length", "block_size")
+
+    def __init__(
+        self,
+        buffer: Union[bytes, bytearray, memoryview],
+        width: int,
+        length: int,
+        block_size: int,
+    ):
+        """
+        Args:
+            buffer (bytes-like): ciphertexts of bits in fixed width encoding, row by row
+            width (int): number of bytes per integer
+            length (int): number of bits
+            block_size (int): number of integers per bit
+        """
+        if len(buffer) != width * length * block_size:
+            raise ValueError(
+                f"Buffer of {length} blocks having {block_size} integers of {width} bytes"
+                f" must be {width * length * block_size} bytes but it is {len(buffer)}"
+            )
+        self.buffer = buffer
+        self.width = width
+        self.length = length
+        self.block_size = block_size
+
+    @classmethod
+    def pack(cls, ciphertexts: List[List[int]], modulo: int) -> "PackedBlockCiphertext":
+        """
+        Pack blocks of ciphertexts of bits
+        Args:
+            ciphertexts (list of list of int): a block of integers per bit
+            modulo (int): ciphertext modulo
+        Returns:
+            packed ciphertext (PackedBlockCiphertext)
+        """
+        block_size = len(ciphertexts[0]) if ciphertexts else 0
+        if any(len(block) != block_size for block in ciphertexts):
+            raise ValueError("Blocks of a ciphertext must have the same size")
+        return cls.from_values(
+            values=[value for block in ciphertexts for value in block],
+            modulo=modulo,
+            block_size=block_size,
+        )
+
+    @classmethod
+    def from_values(
+        cls, values: List[int], modulo: int, block_size: int
+    ) -> "PackedBlockCiphertext":
+        """
+        Pack integers of blocks given in a flat list
+        Args:
+            values (list of int): integers of blocks, row by row
+            modulo (int): ciphertext modulo
+            block_size (int): number of integers per bit
+        Returns:
+            packed ciphertext (PackedBlockCiphertext)
+        """
+        width = fixed_width.byte_width(modulo)
+        return cls(
+            buffer=fixed_width.encode_many(values, width),
+            width=width,
+            length=len(values) // block_size if block_size else 0,
+            block_size=block_size,
+        )
+
+    def values(self) -> List[int]:
+        """
+        Integers of all blocks in a flat list, row by row
+        """
+        return list(fixed_width.iter_decode(self.buffer, self.width))
+
+    def unpack(self) -> List[List[int]]:
+        """
+        Restore blocks of ciphertexts of bits
+        Returns:
+            ciphertexts (list of list of int)
+        """
+        return list(self)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[List[int]]:
+        values = self.values()
+        for start in range(0, len(values), self.block_size):
+            yield values[start : start + self.block_size]
+
+    def __getitem__(self, index: int) -> List[int]:
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("packed ciphertext index out of range")
+        row = self.width * self.block_size
+        return list(
+            fixed_width.iter_decode(
+                memoryview(self.buffer)[index * row : (index + 1) * row], self.width
+            )
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PackedBlockCiphertext):
+            return NotImplemented
+        return (
+            self.width == other.width
+            and self.block_size == other.block_size
+            and bytes(self.buffer) == bytes(other.buffer)
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.width, self.block_size, bytes(self.buffer)))
+
+    def __reduce__(self):
+        # memory views are not picklable
+        return (
+            PackedBlockCiphertext,
+            (bytes(self.buffer), self.width, self.length, self.block_size),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"PackedBlockCiphertext({self.length} bits, {self.block_size} integers"
+            f" of {self.width} bytes per bit)"
+        )
@@ -0,0 +1,162 @@
+# built-in dependencies
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future
+from typing import Callable, Deque, List, Optional, Set
+
+# project dependencies
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="lightphe/models/RandomnessPool.py")
+
+# pylint: disable=too-many-instance-attributes
+
+
+class RandomnessPool:
+    """
+    Keeps one-time random values of encryption ready, e.g. random squares r^2 mod n
+    of Goldwasser-Micali, so that they are not calculated on the hot path. Every
+    value is handed out once. Consumed values are replaced in background in batches.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[int], List[int]],
+        capacity: int = 1024,
+        batch_size: int = 128,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Args:
+            factory (callable): generates a given number of random values. It must be
+                picklable, e.g. a module level function or a partial of it, to run
+                in a process pool.
+            capacity (int): number of ready values. Set 0 to calculate values on demand.
+            batch_size (int): number of values generated per task
+            workers (int): number of processes generating values. Default is cpu count.
+            executor (Executor): optional executor to generate values in, e.g. a
+                ThreadPoolExecutor. It is not shut down when the pool is closed.
+        """
+        if capacity < 0:
+            raise ValueError(
+                f"pool capacity must be non-negative but it was {capacity}"
+            )
+        if batch_size < 1:
+            raise ValueError(f"batch size must be positive but it was {batch_size}")
+
+        self.factory = factory
+        self.capacity = capacity
+        self.batch_size = max(1, min(batch_size, capacity))
+
+        self._ready: Deque[int] = deque()
+        self._in_flight: Set[Future] = set()
+        self._condition = threading.Condition()
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+        self._owns_executor = False
+        if capacity > 0 and executor is None:
+            # pylint: disable=import-outside-toplevel
+            from concurrent.futures import ProcessPoolExecutor
+
+            executor = ProcessPoolExecutor(max_workers=workers)
+            self._owns_executor = True
+        self.executor = executor
+
+        with self._condition:
+            self.__refill()
+
+    def take(self) -> int:
+        """
+        Take a ready random value out of the pool. It is calculated on demand if
+        the pool is drained.
+        Returns:
+            value (int): random value which is not handed out before
+        """
+        with self._condition:
+            value = self._ready.popleft() if self._ready else None
+            self.__refill()
+
+        if value is None:
+            return self.factory(1)[0]
+        return value
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until values being generated are ready
+        Args:
+            timeout (float): seconds to wait. Waits until they are ready if not set.
+        Returns:
+            result (bool): True if values are ready
+        """
+        with self._condition:
+            return (
+                self._condition.wait_for(lambda: not self._in_flight, timeout=timeout)
+                and self._error is None
+            )
+
+    def close(self) -> None:
+        """
+        Stop refilling and drop ready values
+        """
+        with self._condition:
+            self._closed = True
+            self._ready.clear()
+            # cancelling runs the done callback which discards the future
+            for future in list(self._in_flight):
+                future.cancel()
+            self._condition.notify_all()
+
+        if self._owns_executor and self.executor is not None:
+            self.executor.shutdown(wait=False)
+
+    def __len__(self) -> int:
+        return len(self._ready)
+
+    def __enter__(self) -> "RandomnessPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __deepcopy__(self, memo: dict) -> "RandomnessPool":
+        # copies of a cryptosystem draw from the same pool
+        return self
+
+    def __reduce__(self):
+        # pools are not sent to worker processes, they calculate values on demand
+        return (RandomnessPool, (self.factory, 0))
+
+    def __refill(self) -> None:
+        # called with the condition acquired
+        if self._closed or self.executor is None or self._error is not None:
+            return
+        pending = len(self._ready) + len(self._in_flight) * self.batch_size
+        while pending + self.batch_size <= self.capacity:
+            try:
+                future = self.executor.submit(self.factory, self.batch_size)
+            except RuntimeError:
+                # shared executor is shut down, values are calculated on demand
+                logger.warn(
+                    "Executor of the randomness pool is shut down,"
+                    " values are calculated on demand from now on"
+                )
+                self._closed = True
+                return
+            self._in_flight.add(future)
+            future.add_done_callback(self.__on_generated)
+            pending += self.batch_size
+
+    def __on_generated(self, future: Future) -> None:
+        with self._condition:
+            self._in_flight.discard(future)
+            if future.cancelled():
+                pass
+            elif future.exception() is not None:
+                # stop refilling, values are calculated on demand from now on
+                logger.error("Generating random values failed: %s", future.exception())
+                self._error = future.exception()
+            elif not self._closed:
+                self._ready.extend(future.result())
+            self._condition.notify_all()
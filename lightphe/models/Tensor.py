@@ -1,15 +1,16 @@
 # built-in dependencies
-from typing import Union, List
-import multiprocessing
-from contextlib import closing
-
-# 3rd party dependencies
-from tqdm import tqdm
+import math
+import operator
+import itertools
+from typing import Any, Union, List, Optional, Sequence, Tuple
 
 # project dependencies
 from lightphe.models.Homomorphic import Homomorphic
 from lightphe.commons import phe_utils
+from lightphe.commons import instrumentation
+from lightphe.commons import fixed_width
 from lightphe.models.Ciphertext import Ciphertext
+from lightphe.models.FixedPointEncoder import FixedPointEncoder
 from lightphe.models.Algorithm import Algorithm
 from lightphe.commons.logger import Logger
 
@@ -22,6 +23,8 @@ class Fraction:
     Class to store fractional values
     """
 
+    __slots__ = ("dividend", "abs_dividend", "divisor", "sign")
+
     def __init__(
         self,
         dividend: Union[int, tuple, list],
@@ -58,17 +61,134 @@ class EncryptedTensor:
         fractions: List[Fraction],
         cs: Homomorphic,
         precision: int = 5,
+        shape: Optional[Sequence[int]] = None,
+        signed: bool = False,
     ):
         """
         Initialization method
         Args:
             fractions (list): list of fractions storing individual encrypted tensor items
+                in row-major order
             cs (cryptosystem): built cryptosystem
             precision (int): precision of the tensor
+            shape (tuple): dimensions of the tensor. default is (len(fractions),)
+            signed (bool): negative items are encoded into the upper half of plaintext
+                space. Then, dividend and abs_dividend of fractions are the same
+                ciphertext, their sign is 1 and sign is restored after decryption.
         """
         self.fractions = fractions
         self.cs = cs
         self.precision = precision
+        self.signed = signed
+        self.shape: Tuple[int, ...] = (
+            (len(fractions),) if shape is None else tuple(shape)
+        )
+        if math.prod(self.shape) != len(fractions):
+            raise ValueError(
+                f"Shape {self.shape} does not match {len(fractions)} tensor items"
+            )
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    def __len__(self) -> int:
+        if self.ndim == 0:
+            raise TypeError("len() of a 0-d encrypted tensor")
+        return self.shape[0]
+
+    def __getitem__(self, key: Any) -> "EncryptedTensor":
+        """
+        Index or slice encrypted tensor items without decryption
+        Args:
+            key (int, slice or tuple of them): index per leading dimension
+        Returns:
+            encrypted tensor: integer indices drop their dimensions
+        """
+        offsets, shape = select(self.shape, key)
+        return self.__like([self.fractions[offset] for offset in offsets], shape)
+
+    def reshape(self, *shape: Union[int, Sequence[int]]) -> "EncryptedTensor":
+        """
+        Change dimensions of the tensor while keeping its items in row-major order
+        Args:
+            shape (int or tuple): new dimensions, one of them can be -1
+        Returns:
+            encrypted tensor sharing items with this one
+        """
+        if len(shape) == 1 and not isinstance(shape[0], int):
+            shape = tuple(shape[0])
+        dimensions = list(shape)
+
+        if dimensions.count(-1) > 1:
+            raise ValueError("Only one dimension can be -1 in reshape")
+        if -1 in dimensions:
+            known = math.prod(d for d in dimensions if d != -1)
+            if known == 0 or len(self.fractions) % known != 0:
+                raise ValueError(
+                    f"Tensor of shape {self.shape} cannot be reshaped into {shape}"
+                )
+            dimensions[dimensions.index(-1)] = len(self.fractions) // known
+
+        return self.__like(self.fractions, dimensions)
+
+    def sum(self, axis: Optional[int] = None) -> "EncryptedTensor":
+        """
+        Perform homomorphic sum of tensor items
+        Args:
+            axis (int): dimension to sum over. all items are summed if not given.
+        Returns:
+            encrypted tensor: without the summed dimension, 0-d if axis is None
+        """
+        if len(self.fractions) == 0:
+            raise ValueError("Sum cannot be calculated for empty tensor")
+
+        if axis is None:
+            groups = [self.fractions]
+            shape: Tuple[int, ...] = ()
+        else:
+            if not -self.ndim <= axis < self.ndim:
+                raise ValueError(
+                    f"axis {axis} is out of bounds for {self.ndim}-d tensor"
+                )
+            axis = axis % self.ndim
+            shape = self.shape[:axis] + self.shape[axis + 1 :]
+
+            strides = get_strides(self.shape)
+            outer = itertools.product(*(range(d) for d in shape))
+            groups = []
+            for position in outer:
+                index = position[:axis] + (0,) + position[axis:]
+                base = sum(i * stride for i, stride in zip(index, strides))
+                groups.append(
+                    [
+                        self.fractions[base + k * strides[axis]]
+                        for k in range(self.shape[axis])
+                    ]
+                )
+
+        fractions = []
+        for group in groups:
+            total = group[0]
+            for fraction in group[1:]:
+                total = self.__add_fractions(total, fraction)
+            fractions.append(total)
+
+        return self.__like(fractions, shape)
+
+    def __like(
+        self, fractions: List[Fraction], shape: Optional[Sequence[int]] = None
+    ) -> "EncryptedTensor":
+        """
+        Build a tensor having the same cryptosystem, precision and encoding
+        """
+        return EncryptedTensor(
+            fractions=fractions,
+            cs=self.cs,
+            precision=self.precision,
+            shape=self.shape if shape is None else shape,
+            signed=self.signed,
+        )
 
     def __str__(self):
         """
@@ -89,6 +209,8 @@ class EncryptedTensor:
         """
         Perform dot product of two encrypted tensors
         """
+        other = phe_utils.to_builtin(other)
+
         if not (
             (isinstance(other, EncryptedTensor) and isinstance(self, list))
             or (isinstance(other, list) and isinstance(self, EncryptedTensor))
@@ -97,6 +219,8 @@ class EncryptedTensor:
                 "Dot product can be run for EncryptedTensor and List of float / int"
             )
 
+        tic = instrumentation.start(self.cs.metrics)
+
         encrypted_tensor = self.__mul__(other=other)
 
         if len(encrypted_tensor.fractions) == 0:
@@ -107,33 +231,28 @@ class EncryptedTensor:
         )
 
         if len(encrypted_tensor.fractions) > 10000:
+            # pylint: disable=import-outside-toplevel
+            import multiprocessing
+
             # parallelize the sum operation
             num_workers = min(
                 len(encrypted_tensor.fractions), multiprocessing.cpu_count()
             )
 
-            chunks = chunkify(encrypted_tensor.fractions, num_workers)
-
-            with closing(multiprocessing.Pool(num_workers)) as pool:
-                funclist = []
-
-                for chunk in chunks:
-                    f = pool.apply_async(sum_fractions_chunk, (chunk, self.cs))
-                    funclist.append(f)
-
-                partial_sums = []
-                for f in tqdm(funclist, desc="Summing up fractions", disable=True):
-                    result = f.get(timeout=10)
-                    partial_sums.append(result)
-
-            # map reduce
-            total_sum = partial_sums[0]
-            for partial in partial_sums[1:]:
-                total_sum += partial
+            pool_tic = instrumentation.start(self.cs.metrics)
+            total_sum = parallel_sum(
+                values=[
+                    fraction.abs_dividend for fraction in encrypted_tensor.fractions
+                ],
+                cs=self.cs,
+                num_workers=num_workers,
+            )
+            instrumentation.stop("pool_dispatch", pool_tic, self.cs.metrics)
+            instrumentation.count("pool_tasks", num_workers, self.cs.metrics)
 
             fraction = Fraction(
-                dividend=total_sum.value,
-                abs_dividend=total_sum.value,
+                dividend=total_sum,
+                abs_dividend=total_sum,
                 divisor=divisor.value,
                 sign=1,
             )
@@ -159,7 +278,9 @@ class EncryptedTensor:
                 sign=1,
             )
 
-        return EncryptedTensor(fractions=[fraction], cs=self.cs)
+        instrumentation.stop("dot", tic, self.cs.metrics)
+
+        return self.__like([fraction], shape=(1,))
 
     def __mul__(
         self, other: Union["EncryptedTensor", int, float, list]
@@ -168,10 +289,12 @@ class EncryptedTensor:
         Perform homomorphic element-wise multipliction on tensors
         or multiplication of an encrypted tensor with a constant
         Args:
-            other: encrypted tensor or constant
+            other: encrypted tensor, plain tensor (list or numpy array) or constant
         Returns:
             encrypted tensor
         """
+        other = phe_utils.to_builtin(other)
+
         if isinstance(other, EncryptedTensor):
             if isinstance(other, EncryptedTensor) and len(self.fractions) != len(
                 other.fractions
@@ -179,6 +302,7 @@ class EncryptedTensor:
                 raise ValueError(
                     "Tensor sizes must be equal in homomorphic multiplication"
                 )
+            self.__check_encoding(other)
 
             fractions = []
             for i, alpha_tensor in enumerate(self.fractions):
@@ -188,9 +312,13 @@ class EncryptedTensor:
                     ciphertext1=alpha_tensor.dividend, ciphertext2=beta_tensor.dividend
                 )
 
-                current_abs_dividend = self.cs.multiply(
-                    ciphertext1=alpha_tensor.abs_dividend,
-                    ciphertext2=beta_tensor.abs_dividend,
+                current_abs_dividend = (
+                    current_dividend
+                    if self.signed
+                    else self.cs.multiply(
+                        ciphertext1=alpha_tensor.abs_dividend,
+                        ciphertext2=beta_tensor.abs_dividend,
+                    )
                 )
 
                 current_divisor = self.cs.multiply(
@@ -206,7 +334,7 @@ class EncryptedTensor:
 
                 fractions.append(fraction)
 
-            return EncryptedTensor(fractions=fractions, cs=self.cs)
+            return self.__like(fractions)
 
         elif isinstance(other, list):
             # perform element-wise multiplication of encrypted tensor with plain tensor
@@ -215,25 +343,28 @@ class EncryptedTensor:
                     "Tensor sizes must be equal in homomorphic multiplication"
                 )
 
-            if any(i < 0 for i in other) or any(
-                fraction.sign < 0 for fraction in self.fractions
+            if not self.signed and (
+                any(i < 0 for i in other)
+                or any(fraction.sign < 0 for fraction in self.fractions)
             ):
                 raise ValueError(
                     "all items in the plain and encrypted tensor must be positive"
                     " to perform element wise multiplication"
                 )
 
+            encoder = FixedPointEncoder(
+                modulo=self.cs.plaintext_modulo, precision=self.precision
+            )
+            c_divisor = encoder.scale
+
             dividends = []
             divisor = None
             for alpha, beta in zip(self.fractions, other):
-                c_abs_dividend, c_divisor = phe_utils.fractionize(
-                    value=(
-                        abs(beta) % self.cs.plaintext_modulo
-                        if abs(beta) > self.cs.plaintext_modulo
-                        else abs(beta)
-                    ),
-                    modulo=self.cs.plaintext_modulo,
-                    precision=self.precision,
+                # negative constants are encoded into upper half of plaintext space
+                c_abs_dividend = (
+                    encoder.encode(beta)
+                    if self.signed
+                    else encoder.encode_magnitude(beta)
                 )
 
                 dividend = (
@@ -256,7 +387,7 @@ class EncryptedTensor:
                     )
                 )
 
-            return EncryptedTensor(fractions=dividends, cs=self.cs)
+            return self.__like(dividends)
 
         elif isinstance(other, (int, float)):
             constant_sign = 1 if other >= 0 else -1
@@ -266,13 +397,22 @@ class EncryptedTensor:
                     value=other, modulo=self.cs.plaintext_modulo
                 )
 
+            if self.signed and constant_sign < 0:
+                # sign of signed tensors is carried by the plaintext itself
+                other = (self.cs.plaintext_modulo - other) % self.cs.plaintext_modulo
+                constant_sign = 1
+
             fractions = []
             for alpha_tensor in self.fractions:
                 dividend = self.cs.multiply_by_constant(
                     ciphertext=alpha_tensor.dividend, constant=other
                 )
-                abs_dividend = self.cs.multiply_by_constant(
-                    ciphertext=alpha_tensor.abs_dividend, constant=other
+                abs_dividend = (
+                    dividend
+                    if self.signed
+                    else self.cs.multiply_by_constant(
+                        ciphertext=alpha_tensor.abs_dividend, constant=other
+                    )
                 )
                 # notice that divisor is alpha tensor's divisor instead of addition
                 fraction = Fraction(
@@ -282,7 +422,7 @@ class EncryptedTensor:
                     sign=constant_sign * alpha_tensor.sign,
                 )
                 fractions.append(fraction)
-            return EncryptedTensor(fractions=fractions, cs=self.cs)
+            return self.__like(fractions)
         else:
             raise ValueError(
                 "Encrypted tensor can be multiplied by an encrypted tensor or constant"
@@ -310,45 +450,67 @@ class EncryptedTensor:
         """
         if len(self.fractions) != len(other.fractions):
             raise ValueError("Fraction sizes must be equal")
+        self.__check_encoding(other)
 
         current_tensors = []
         for i, alpha_tensor in enumerate(self.fractions):
             beta_tensor = other.fractions[i]
+            current_tensors.append(
+                self.__add_fractions(alpha_tensor, beta_tensor, position=i)
+            )
+
+        return self.__like(current_tensors)
 
-            current_dividend = self.cs.add(
-                ciphertext1=alpha_tensor.dividend, ciphertext2=beta_tensor.dividend
+    def __check_encoding(self, other: "EncryptedTensor") -> None:
+        if self.signed != other.signed:
+            raise ValueError(
+                "Signed and unsigned encrypted tensors cannot be used together"
             )
-            current_abs_dividend = self.cs.add(
-                ciphertext1=alpha_tensor.abs_dividend,
-                ciphertext2=beta_tensor.abs_dividend,
+
+    def __add_fractions(
+        self, alpha_tensor: Fraction, beta_tensor: Fraction, position: int = 0
+    ) -> Fraction:
+        current_dividend = self.cs.add(
+            ciphertext1=alpha_tensor.dividend, ciphertext2=beta_tensor.dividend
+        )
+
+        if self.signed:
+            # modular addition keeps signs of signed tensors
+            return Fraction(
+                dividend=current_dividend,
+                abs_dividend=current_dividend,
+                divisor=alpha_tensor.divisor,
+                sign=1,
             )
-            # notice that divisor is alpha tensor's divisor instead of addition
-            if alpha_tensor.sign == -1 and beta_tensor.sign == -1:
-                current_tensor = Fraction(
-                    dividend=current_dividend,
-                    abs_dividend=current_abs_dividend,
-                    divisor=alpha_tensor.divisor,
-                    sign=-1,
-                )
-            else:
-                # if one is positive and one is negative, then i cannot know
-                # the result is positive or negative. trust mod calculations.
-                if alpha_tensor.sign != beta_tensor.sign:
-                    logger.warn(
-                        f"{i}-th items of the vectors have different signs, and result's sign "
-                        "cannot be determined in PHE. Result will be shown for positive for this anyway."
-                    )
 
-                current_tensor = Fraction(
-                    dividend=current_dividend,
-                    abs_dividend=current_dividend,
-                    divisor=alpha_tensor.divisor,
-                    sign=1,
-                )
+        current_abs_dividend = self.cs.add(
+            ciphertext1=alpha_tensor.abs_dividend,
+            ciphertext2=beta_tensor.abs_dividend,
+        )
+        # notice that divisor is alpha tensor's divisor instead of addition
+        if alpha_tensor.sign == -1 and beta_tensor.sign == -1:
+            return Fraction(
+                dividend=current_dividend,
+                abs_dividend=current_abs_dividend,
+                divisor=alpha_tensor.divisor,
+                sign=-1,
+            )
 
-            current_tensors.append(current_tensor)
+        # if one is positive and one is negative, then i cannot know
+        # the result is positive or negative. trust mod calculations.
+        if alpha_tensor.sign != beta_tensor.sign:
+            logger.warn(
+                "%s-th items of the vectors have different signs, and result's sign "
+                "cannot be determined in PHE. Result will be shown for positive for this anyway.",
+                position,
+            )
 
-        return EncryptedTensor(fractions=current_tensors, cs=self.cs)
+        return Fraction(
+            dividend=current_dividend,
+            abs_dividend=current_dividend,
+            divisor=alpha_tensor.divisor,
+            sign=1,
+        )
 
 
 def cast_ciphertext(cs: Homomorphic, value: int) -> Ciphertext:
@@ -359,13 +521,66 @@ def cast_ciphertext(cs: Homomorphic, value: int) -> Ciphertext:
 
     assert algorithm_name is not None, f"Algorithm name not found for {class_name}"
 
-    return Ciphertext(
-        algorithm_name=algorithm_name,
-        keys=cs.keys,
-        value=value,
-        form=cs.keys.get("form"),
-        curve=cs.keys.get("curve"),
-    )
+    return Ciphertext(algorithm_name=algorithm_name, value=value, cs=cs)
+
+
+def get_strides(shape: Sequence[int]) -> Tuple[int, ...]:
+    """
+    Number of items to skip to move one step in each dimension of row-major items
+    """
+    strides = []
+    step = 1
+    for dimension in reversed(shape):
+        strides.append(step)
+        step *= dimension
+    return tuple(reversed(strides))
+
+
+def select(shape: Sequence[int], key: Any) -> Tuple[List[int], Tuple[int, ...]]:
+    """
+    Find row-major offsets of items selected by an index or slice
+    Args:
+        shape (tuple): dimensions of the tensor
+        key (int, slice or tuple of them): index per leading dimension
+    Returns:
+        offsets (list of int): positions of selected items
+        shape (tuple): dimensions of the selection
+    """
+    keys = key if isinstance(key, tuple) else (key,)
+    if len(keys) > len(shape):
+        raise IndexError(
+            f"too many indices for tensor: tensor is {len(shape)}-d, "
+            f"but {len(keys)} were indexed"
+        )
+
+    ranges = []
+    new_shape = []
+    for axis, dimension in enumerate(shape):
+        current = keys[axis] if axis < len(keys) else slice(None)
+        if isinstance(current, slice):
+            indices = range(*current.indices(dimension))
+            ranges.append(indices)
+            new_shape.append(len(indices))
+            continue
+
+        try:
+            index = operator.index(current)
+        except TypeError as err:
+            raise TypeError(
+                f"tensor indices must be integers or slices, not {type(current)}"
+            ) from err
+        if not -dimension <= index < dimension:
+            raise IndexError(
+                f"index {index} is out of bounds for axis {axis} with size {dimension}"
+            )
+        ranges.append((index % dimension,))
+
+    strides = get_strides(shape)
+    offsets = [
+        sum(i * stride for i, stride in zip(position, strides))
+        for position in itertools.product(*ranges)
+    ]
+    return offsets, tuple(new_shape)
 
 
 def chunkify(lst: list, n: int):
@@ -381,9 +596,121 @@ def chunkify(lst: list, n: int):
     return chunks
 
 
-def sum_fractions_chunk(fractions_chunk: list, cs: Homomorphic):
-    """Compute the sum of a chunk of fractions in parallel."""
-    result = cast_ciphertext(cs=cs, value=fractions_chunk[0].abs_dividend)
-    for fraction in fractions_chunk[1:]:
-        result += cast_ciphertext(cs=cs, value=fraction.abs_dividend)
+def parallel_sum(
+    values: list, cs: Homomorphic, num_workers: int
+) -> Union[int, tuple, list]:
+    """
+    Homomorphically sum ciphertexts in a process pool
+    Args:
+        values (list): ciphertexts
+        cs (Homomorphic): cryptosystem of ciphertexts
+        num_workers (int): number of processes
+    Returns:
+        sum (int, tuple or list): ciphertext of the sum
+    """
+    # pylint: disable=import-outside-toplevel
+    import multiprocessing
+    from contextlib import closing
+    from lightphe.commons import shared_buffers
+
+    shared = all(isinstance(value, int) for value in values)
+    if shared:
+        shared_buffers.prepare()
+
+    # cryptosystem is sent once per process instead of once per task
+    with closing(
+        multiprocessing.Pool(
+            num_workers, initializer=install_cryptosystem, initargs=(cs,)
+        )
+    ) as pool:
+        if shared:
+            partial_sums = sum_in_shared_memory(values, cs, pool, num_workers)
+        else:
+            # ciphertexts cannot be encoded in fixed width, e.g. ElGamal pairs
+            funclist = [
+                pool.apply_async(sum_chunk, (chunk,))
+                for chunk in chunkify(values, num_workers)
+            ]
+            partial_sums = [f.get(timeout=10) for f in funclist]
+
+    # map reduce
+    total_sum = partial_sums[0]
+    for partial in partial_sums[1:]:
+        total_sum = cs.add(ciphertext1=total_sum, ciphertext2=partial)
+    return total_sum
+
+
+def sum_in_shared_memory(
+    values: List[int], cs: Homomorphic, pool: Any, num_workers: int
+) -> List[int]:
+    """
+    Calculate partial sums of integer ciphertexts in a pool. Workers read chunks
+        from and write partial sums into shared memory, so large integers are
+        not pickled.
+    Args:
+        values (list of int): ciphertexts
+        cs (Homomorphic): cryptosystem of ciphertexts
+        pool (multiprocessing.Pool): pool whose processes have the cryptosystem installed
+        num_workers (int): number of chunks
+    Returns:
+        partial sums (list of int)
+    """
+    # pylint: disable=import-outside-toplevel
+    from lightphe.commons import shared_buffers
+
+    width = fixed_width.byte_width(cs.ciphertext_modulo)
+    bounds = [chunk for chunk in chunkify(range(len(values)), num_workers) if chunk]
+
+    inputs = shared_buffers.share_integers(values, width)
+    try:
+        outputs = shared_buffers.allocate(width=width, count=len(bounds))
+        try:
+            funclist = [
+                pool.apply_async(
+                    sum_shared_chunk,
+                    (inputs.name, outputs.name, width, chunk.start, chunk.stop, i),
+                )
+                for i, chunk in enumerate(bounds)
+            ]
+            for f in funclist:
+                f.get(timeout=10)
+            return list(
+                fixed_width.FixedWidthArray(outputs.buf, width=width, count=len(bounds))
+            )
+        finally:
+            shared_buffers.release(outputs)
+    finally:
+        shared_buffers.release(inputs)
+
+
+# cryptosystem installed into processes of a pool
+_WORKER: dict = {"cs": None}
+
+
+def install_cryptosystem(cs: Homomorphic) -> None:
+    """Install the cryptosystem used by tasks of a pool process."""
+    _WORKER["cs"] = cs
+
+
+def sum_shared_chunk(
+    input_name: str, output_name: str, width: int, start: int, stop: int, index: int
+) -> None:
+    """Sum a chunk of ciphertexts in shared memory and write it back."""
+    # pylint: disable=import-outside-toplevel
+    from lightphe.commons import shared_buffers
+
+    cs: Homomorphic = _WORKER["cs"]
+    values = shared_buffers.read_integers(input_name, width, start, stop)
+    result = values[0]
+    for value in values[1:]:
+        result = cs.add(ciphertext1=result, ciphertext2=value)
+    shared_buffers.write_integer(output_name, width, index, result)
+
+
+def sum_chunk(values: list) -> Union[int, tuple, list]:
+    """Compute the sum of a chunk of ciphertexts in a pool process."""
+    cs: Homomorphic = _WORKER["cs"]
+    result = values[0]
+    for value in values[1:]:
+        result = cs.add(ciphertext1=result, ciphertext2=value)
     return result
@@ -0,0 +1,104 @@
+import time
+import asyncio
+
+import pytest
+
+from lightphe import LightPHE
+from lightphe.aio import AsyncLightPHE
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="tests/test_aio.py")
+
+
+def test_encrypt_and_decrypt_many():
+    async def scenario():
+        acs = await AsyncLightPHE.create("Paillier", key_size=128, max_concurrency=3)
+
+        plaintexts = list(range(20))
+        ciphertexts = await acs.encrypt_many(plaintexts)
+        assert await acs.decrypt_many(ciphertexts) == plaintexts
+
+        total = await acs.aggregate(ciphertexts)
+        assert await acs.decrypt(total) == sum(plaintexts)
+
+        regenerated = await acs.regenerate_ciphertext(ciphertexts[5])
+        assert regenerated.value != ciphertexts[5].value
+        assert await acs.decrypt(regenerated) == 5
+
+        # tensors and keyword arguments are passed through
+        tensor = await acs.encrypt([1.5, 2.5], silent=True)
+        assert await acs.decrypt(tensor) == pytest.approx([1.5, 2.5])
+
+    asyncio.run(scenario())
+
+    logger.info("✅ Async encrypt and decrypt many test succeeded")
+
+
+def test_streams_with_back_pressure():
+    async def scenario():
+        cs = LightPHE(algorithm_name="Paillier", key_size=128)
+        acs = AsyncLightPHE(cs, max_concurrency=2)
+
+        pulled = []
+
+        async def source():
+            for i in range(10):
+                pulled.append(i)
+                yield i
+
+        restored = []
+        stream = acs.decrypt_stream(acs.encrypt_stream(source()))
+        async for plaintext in stream:
+            restored.append(plaintext)
+            # at most max_concurrency items are in flight per stage
+            assert len(pulled) - len(restored) <= 2 * acs.max_concurrency
+        assert restored == list(range(10))
+
+        # consumer may stop early
+        async for ciphertext in acs.encrypt_stream(range(100)):
+            assert cs.decrypt(ciphertext) == 0
+            break
+
+    asyncio.run(scenario())
+
+    logger.info("✅ Async streams test succeeded")
+
+
+def test_event_loop_is_not_blocked():
+    async def scenario():
+        acs = AsyncLightPHE(
+            LightPHE(algorithm_name="Exponential-ElGamal", key_size=128)
+        )
+        ciphertext = await acs.encrypt(5000)
+
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        # exponential elgamal decryption solves a discrete logarithm
+        plaintext, _ = await asyncio.gather(acs.decrypt(ciphertext), ticker())
+        assert plaintext == 5000
+        assert len(ticks) == 5
+
+    asyncio.run(scenario())
+
+    logger.info("✅ Event loop test succeeded")
+
+
+def test_process_pool():
+    async def scenario():
+        cs = LightPHE(algorithm_name="Paillier", key_size=128)
+        async with AsyncLightPHE(cs, processes=2) as acs:
+            ciphertexts = await acs.encrypt_many([1, 2, 3])
+            assert [cs.decrypt(c) for c in ciphertexts] == [1, 2, 3]
+            assert await acs.decrypt(await acs.aggregate(ciphertexts)) == 6
+
+        with pytest.raises(ValueError, match="not both"):
+            AsyncLightPHE(cs, executor=object(), processes=2)
+
+    asyncio.run(scenario())
+
+    logger.info("✅ Async process pool test succeeded")
@@ -0,0 +1,67 @@
+import pytest
+
+from lightphe import LightPHE
+from lightphe.commons import backend
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="tests/test_backend.py")
+
+
+def run_operations():
+    p = 2**127 - 1
+    assert backend.powmod(3, 2**100, p) == pow(3, 2**100, p)
+    assert backend.powmod(3, -5, p) == pow(3, -5, p)
+    assert backend.invert(3, p) * 3 % p == 1
+    assert backend.gcd(12, 18) == 6
+    assert backend.is_prime(p) is True
+    assert backend.is_prime(p + 2) is False
+    assert backend.next_prime(14) == 17
+    assert [backend.jacobi(a, 15) for a in range(1, 8)] == [1, 1, 0, 1, 0, 0, -1]
+
+    # results are python integers whatever the backend is
+    assert type(backend.powmod(3, 5, 7)) is int
+
+    with pytest.raises(ValueError):
+        backend.invert(3, 9)
+    with pytest.raises(ValueError):
+        backend.jacobi(3, 10)
+
+    for algorithm_name in ["Paillier", "Okamoto-Uchiyama", "Goldwasser-Micali"]:
+        cs = LightPHE(algorithm_name=algorithm_name, key_size=100)
+        c1 = cs.encrypt(17)
+        c2 = cs.encrypt(4)
+        assert cs.decrypt(c1) == 17
+        if algorithm_name == "Goldwasser-Micali":
+            assert cs.decrypt(c1 ^ c2) == 17 ^ 4
+        else:
+            assert cs.decrypt(c1 + c2) == 21
+
+
+def test_python_backend():
+    selected = backend.get_backend()
+    try:
+        assert backend.set_backend("python") == "python"
+        run_operations()
+    finally:
+        backend.set_backend(selected)
+
+    logger.info("✅ python backend test succeeded")
+
+
+def test_gmpy2_backend():
+    pytest.importorskip("gmpy2")
+    selected = backend.get_backend()
+    try:
+        assert backend.set_backend("gmpy2") == "gmpy2"
+        run_operations()
+    finally:
+        backend.set_backend(selected)
+
+    logger.info("✅ gmpy2 backend test succeeded")
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown backend"):
+        backend.set_backend("flint")
+
+    logger.info("✅ unknown backend test succeeded")
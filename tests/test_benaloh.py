@@ -37,3 +37,35 @@ def test_api():
         _ = c1 ^ c2
 
     logger.info(f"✅ Benaloh api test succeeded ({security_level}-bit security level)")
+
+
+def test_decryption_with_large_plaintext_space():
+    from lightphe import LightPHE
+
+    cs = LightPHE(algorithm_name="Benaloh", key_size=128, plaintext_limit=10**6)
+    r = cs.cs.keys["public_key"]["r"]
+    assert r > 10**6
+
+    for m in [0, 1, 999, 10**6 - 1, r - 1]:
+        assert cs.decrypt(cs.encrypt(plaintext=m)) == m
+
+    # baby steps only, not all powers of x
+    assert len(cs.cs.dlp_table) <= 1001
+
+    logger.info("✅ Benaloh large plaintext space test succeeded")
+
+
+def test_decryption_with_table_of_all_powers():
+    from lightphe import LightPHE
+
+    cs = LightPHE(algorithm_name="Benaloh", key_size=50)
+    n = cs.cs.keys["public_key"]["n"]
+    r = cs.cs.keys["public_key"]["r"]
+    x = cs.cs.keys["private_key"]["x"]
+
+    # key files exported by former versions have all powers of x
+    restored = LightPHE(algorithm_name="Benaloh", keys=cs.cs.keys)
+    restored.cs.set_precomputations({"dlp_table": [pow(x, i, n) for i in range(r)]})
+    assert restored.decrypt(cs.encrypt(plaintext=r - 2)) == r - 2
+
+    logger.info("✅ Benaloh table of all powers test succeeded")
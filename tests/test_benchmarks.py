@@ -0,0 +1,67 @@
+import os
+import json
+
+from benchmarks import suite
+from benchmarks.cli import main
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="tests/test_benchmarks.py")
+
+
+def test_run_and_compare(tmp_path):
+    baseline_file = os.path.join(tmp_path, "baseline.json")
+
+    exit_code = main(
+        [
+            "--algorithms",
+            "Paillier",
+            "Goldwasser-Micali",
+            "--key-sizes",
+            "128",
+            "--operations",
+            "keygen",
+            "encrypt",
+            "add",
+            "xor",
+            "decrypt",
+            "--iterations",
+            "3",
+            "--output",
+            baseline_file,
+        ]
+    )
+    assert exit_code == 0
+
+    with open(baseline_file, "r", encoding="UTF-8") as file:
+        report = json.load(file)
+
+    operations = {(r["algorithm"], r["operation"]) for r in report["results"]}
+    # operations an algorithm is not homomorphic for are skipped
+    assert ("Paillier", "add") in operations
+    assert ("Paillier", "xor") not in operations
+    assert ("Goldwasser-Micali", "xor") in operations
+    assert ("Goldwasser-Micali", "add") not in operations
+
+    for result in report["results"]:
+        assert result["key_size"] == 128
+        assert result["ops_per_sec"] > 0
+        assert result["p99_ms"] >= result["p50_ms"] > 0
+        assert result["peak_memory_kb"] > 0
+
+    # a run slower than baseline is reported
+    slower = json.loads(json.dumps(report))
+    for result in slower["results"]:
+        result["p50_ms"] *= 2
+    regressions = suite.compare(slower, report, threshold=0.5)
+    assert len(regressions) == len(report["results"])
+    assert suite.compare(report, report) == []
+
+    logger.info("✅ Benchmark test succeeded")
+
+
+def test_percentile():
+    assert suite.percentile([1.0], 99) == 1.0
+    assert suite.percentile([1.0, 2.0, 3.0], 50) == 2.0
+    assert suite.percentile([0.0, 10.0], 99) == 9.9
+
+    logger.info("✅ Percentile test succeeded")
@@ -0,0 +1,100 @@
+import pytest
+
+from lightphe import LightPHE
+from lightphe.models.EncryptedBitset import EncryptedBitset
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="tests/test_bitsets.py")
+
+
+def test_xor_of_goldwasser_micali_bitsets():
+    cs = LightPHE(algorithm_name="Goldwasser-Micali", key_size=100)
+
+    x = [0, 5, 13, 255, 128]
+    y = [7, 5, 2, 1, 127]
+
+    c1 = cs.encrypt_bitset(x, bit_width=8)
+    c2 = cs.encrypt_bitset(y, bit_width=8)
+    assert len(c1) == len(x)
+    assert isinstance(c1, EncryptedBitset)
+
+    c3 = c1 ^ c2
+    assert cs.decrypt(c3) == [a ^ b for a, b in zip(x, y)]
+    assert cs.decrypt(c1[1]) == x[1]
+    assert cs.decrypt(c1[1:3]) == x[1:3]
+
+    # and is homomorphic in Sander-Young-Yung only
+    with pytest.raises(ValueError, match="not homomorphic"):
+        _ = c1 & c2
+
+    # shapes must match
+    with pytest.raises(ValueError, match="same shape"):
+        _ = c1 ^ cs.encrypt_bitset(y, bit_width=9)
+    with pytest.raises(ValueError, match="same shape"):
+        _ = c1 ^ c2[1:]
+
+    logger.info("✅ Goldwasser-Micali bitsets xor test succeeded")
+
+
+def test_and_of_sander_young_yung_bitsets():
+    cs = LightPHE(algorithm_name="Sander-Young-Yung", key_size=50)
+
+    x = [0, 5, 13, 15, 8]
+    y = [7, 5, 6, 1, 12]
+
+    c1 = cs.encrypt_bitset(x, bit_width=4)
+    c2 = cs.encrypt_bitset(y, bit_width=4)
+
+    assert cs.decrypt(c1) == x
+    assert cs.decrypt(c1 & c2) == [a & b for a, b in zip(x, y)]
+
+    with pytest.raises(ValueError, match="not homomorphic"):
+        _ = c1 ^ c2
+
+    logger.info("✅ Sander-Young-Yung bitsets and test succeeded")
+
+
+def test_bitset_width():
+    cs = LightPHE(algorithm_name="Goldwasser-Micali", key_size=100)
+
+    # default width is bit length of the largest item
+    bitset = cs.encrypt_bitset([1, 2, 9])
+    assert bitset.bit_width == 4
+    assert cs.decrypt(bitset) == [1, 2, 9]
+
+    with pytest.raises(ValueError, match="does not fit"):
+        cs.encrypt_bitset([1, 16], bit_width=4)
+
+    with pytest.raises(ValueError, match="unsigned"):
+        cs.encrypt_bitset([1, -1])
+
+    with pytest.raises(ValueError, match="Encrypted bitsets require"):
+        LightPHE(algorithm_name="Paillier", key_size=100).encrypt_bitset([1])
+
+    logger.info("✅ bitset width test succeeded")
+
+
+def test_bitsets_in_many_processes():
+    cs = LightPHE(algorithm_name="Goldwasser-Micali", key_size=100)
+
+    x = list(range(40))
+    y = list(reversed(x))
+
+    c1 = cs.encrypt_bitset(x, bit_width=6, workers=2)
+    c2 = cs.encrypt_bitset(y, bit_width=6, workers=2)
+    assert cs.decrypt(c1 ^ c2) == [a ^ b for a, b in zip(x, y)]
+
+    logger.info("✅ bitsets in many processes test succeeded")
+
+
+def test_bitsets_of_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    cs = LightPHE(algorithm_name="Sander-Young-Yung", key_size=50)
+
+    x = np.array([3, 6, 1], dtype=np.uint8)
+    y = np.array([5, 4, 1], dtype=np.uint8)
+
+    restored = cs.decrypt(cs.encrypt_bitset(x) & cs.encrypt_bitset(y), as_numpy=True)
+    assert np.array_equal(restored, x & y)
+
+    logger.info("✅ bitsets of numpy arrays test succeeded")
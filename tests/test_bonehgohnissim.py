@@ -249,3 +249,23 @@ def test_api_with_predefined_keys():
     logger.info(
         f"✅ Boneh-God-Nissim test succeeded ({security_level} bit ECC security level)"
     )
+
+
+def test_regenerate_many_with_public_key(caplog):
+    import logging
+    from lightphe.commons import logger as logger_module
+
+    ciphertexts = [cs.encrypt(plaintext=m) for m in [1, 2, 3]]
+
+    logger_module.use_stdlib_logging()
+    try:
+        with caplog.at_level(logging.WARNING, logger="lightphe"):
+            regenerated = cs.regenerate_many(ciphertexts)
+    finally:
+        logger_module.use_stdlib_logging(False)
+
+    # public cryptosystem re-encrypts without warning about the missing private key
+    assert caplog.records == []
+    assert [cs.decrypt(c) for c in regenerated] == [1, 2, 3]
+
+    logger.info("✅ Boneh-Goh-Nissim regenerate many test succeeded")
@@ -1,4 +1,9 @@
+# built-in dependencies
+import pickle
+
 # 3rd party dependencies
+import pytest
+
 from lightphe import LightPHE
 
 # project dependencies
@@ -29,3 +34,79 @@ def test_private_key_not_available_in_encrypted_tensor():
     assert onprem_cs.cs.keys.get("private_key") is not None
 
     logger.info("✅ Private key not available in encrypted tensor tests done")
+
+
+@pytest.mark.parametrize(
+    "algorithm_name",
+    ["Paillier", "Damgard-Jurik", "Okamoto-Uchiyama", "Benaloh", "Naccache-Stern"],
+)
+def test_precomputations_not_available_in_ciphertext(algorithm_name):
+    cs = LightPHE(algorithm_name=algorithm_name, key_size=64)
+
+    # values derived from private key are cached before the first ciphertext
+    precomputations = cs.cs.get_precomputations()
+    assert precomputations
+
+    c = cs.encrypt(17)
+    assert cs.decrypt(c) == 17
+
+    assert c.cs.keys.get("private_key") is None
+    assert all(getattr(c.cs, name) is None for name in precomputations)
+
+    restored = pickle.loads(pickle.dumps(c))
+    assert restored.cs.keys.get("private_key") is None
+    assert all(getattr(restored.cs, name) is None for name in precomputations)
+
+    tensor = pickle.loads(pickle.dumps(cs.encrypt([1, 2, 3], silent=True)))
+    assert all(getattr(tensor.cs, name) is None for name in precomputations)
+
+    # the cryptosystem having private key keeps them
+    assert cs.cs.get_precomputations() == precomputations
+
+    logger.info(f"✅ {algorithm_name} precomputations not available in ciphertext")
+
+
+def test_ciphertexts_share_public_cryptosystem():
+    c1 = onprem_cs.encrypt(17)
+    c2 = onprem_cs.encrypt(23)
+    c3 = c1 + c2
+    c4 = c3 * 2
+
+    # one public cryptosystem is shared instead of copying keys per ciphertext
+    assert c1.cs is c2.cs is c3.cs is c4.cs
+    assert c1.keys is c1.cs.keys
+    assert c1.keys.get("private_key") is None
+    assert not hasattr(c1, "__dict__")
+
+    tensor = onprem_cs.encrypt([1.5, 2.5], silent=True)
+    assert tensor.cs is c1.cs
+    assert not hasattr(tensor.fractions[0], "__dict__")
+
+    restored = pickle.loads(pickle.dumps(c4))
+    assert onprem_cs.decrypt(restored) == 80
+
+    logger.info("✅ Shared public cryptosystem tests done")
+
+
+def test_regenerate_many():
+    for algorithm_name, key_size, plaintexts in [
+        ("Paillier", 50, [1, 2, 3]),
+        ("Exponential-ElGamal", 50, [1, 2, 3]),
+        ("EllipticCurve-ElGamal", None, [1, 2, 3]),
+        ("Boneh-Goh-Nissim", 50, [1, 2, 3]),
+        ("Goldwasser-Micali", 50, [0, 1, 5]),
+        ("Sander-Young-Yung", 50, [0, 1, 5]),
+    ]:
+        cs = LightPHE(algorithm_name=algorithm_name, key_size=key_size)
+        ciphertexts = [cs.encrypt(plaintext) for plaintext in plaintexts]
+
+        for workers in [None, 2]:
+            regenerated = cs.regenerate_many(ciphertexts, workers=workers)
+            assert [cs.decrypt(c) for c in regenerated] == plaintexts
+            assert all(a.value != b.value for a, b in zip(ciphertexts, regenerated))
+            # regenerated ciphertexts do not carry private key
+            assert all(c.cs.keys.get("private_key") is None for c in regenerated)
+
+    assert cs.regenerate_many([]) == []
+
+    logger.info("✅ regenerate many test succeeded")
@@ -62,3 +62,122 @@ def test_api_for_additive():
         _ = c1 ^ c2
 
     logger.info("✅ Exponential ElGamal api test succeeded")
+
+
+def test_product():
+    from lightphe import LightPHE
+
+    cs = LightPHE(algorithm_name="ElGamal", key_size=256)
+
+    plaintexts = [2, 3, 5, 7, 11, 13, 17]
+    ciphertexts = [cs.encrypt(m) for m in plaintexts]
+
+    expected = 1
+    for m in plaintexts:
+        expected *= m
+
+    assert cs.decrypt(cs.product(ciphertexts)) == expected
+    assert cs.decrypt(cs.product(ciphertexts, workers=2)) == expected
+    assert cs.decrypt(cs.product(ciphertexts[:1])) == 2
+
+    with pytest.raises(ValueError, match="no ciphertexts"):
+        cs.product([])
+
+    additive = LightPHE(algorithm_name="Exponential-ElGamal", key_size=50)
+    with pytest.raises(ValueError, match="not homomorphic"):
+        additive.product([additive.encrypt(1), additive.encrypt(2)])
+
+    logger.info("✅ ElGamal product test succeeded")
+
+
+def test_well_known_groups():
+    from lightphe import LightPHE
+    from lightphe.commons import groups
+
+    for name in groups.names():
+        p, q, g = groups.get_group(name)
+        assert p == 2 * q + 1
+        # generator is in the subgroup of order q
+        assert pow(g, q, p) == 1
+
+    cs = LightPHE(algorithm_name="ElGamal", group="ffdhe2048")
+    assert cs.cs.keys["public_key"]["p"].bit_length() == 2048
+    assert cs.cs.keys["private_key"]["x"].bit_length() <= 225
+
+    c1 = cs.encrypt(plaintext=17)
+    c2 = cs.encrypt(plaintext=21)
+    assert cs.decrypt(c1 * c2) == 17 * 21
+    assert cs.decrypt(cs.regenerate_ciphertext(c1)) == 17
+
+    with pytest.raises(ValueError, match="Unknown group"):
+        LightPHE(algorithm_name="ElGamal", group="modp1024")
+
+    logger.info("✅ ElGamal well-known groups test succeeded")
+
+
+def test_safe_prime_subgroup():
+    from lightphe import LightPHE
+
+    cs = LightPHE(
+        algorithm_name="Exponential-ElGamal", key_size=128, group="safe-prime"
+    )
+    p = cs.cs.keys["public_key"]["p"]
+    q = cs.cs.keys["public_key"]["q"]
+    g = cs.cs.keys["public_key"]["g"]
+    assert p.bit_length() == 128
+    assert p == 2 * q + 1
+    assert g != 1 and pow(g, q, p) == 1
+
+    c1 = cs.encrypt(plaintext=17)
+    c2 = cs.encrypt(plaintext=23)
+    assert cs.decrypt(c1 + c2) == 40
+    assert cs.decrypt(c1 * 3) == 51
+
+    # subgroup is restored with the keys
+    restored = LightPHE(algorithm_name="Exponential-ElGamal", keys=cs.cs.keys)
+    assert restored.cs.keys["public_key"]["q"] == q
+    assert restored.decrypt(restored.encrypt(plaintext=5) + c1) == 22
+
+    logger.info("✅ ElGamal safe prime subgroup test succeeded")
+
+
+def test_subgroup_hides_legendre_symbol():
+    from lightphe import LightPHE
+    from lightphe.commons.number_theory import jacobi
+
+    cs = LightPHE(algorithm_name="ElGamal", group="modp2048")
+    p = cs.cs.keys["public_key"]["p"]
+    q = cs.cs.keys["public_key"]["q"]
+
+    plaintexts = [2, 3, 5, 7, 11, 17, 21, 1000, q - 1, q]
+    # both residues and non-residues are tried
+    assert {jacobi(m, p) for m in plaintexts} == {1, -1}
+
+    for m in plaintexts:
+        c = cs.encrypt(plaintext=m)
+        # c2 is always in the subgroup of order q, so it does not leak the symbol of m
+        assert jacobi(c.value[1], p) == 1
+        assert cs.decrypt(c) == m
+
+    assert cs.decrypt(cs.encrypt(plaintext=17) * cs.encrypt(plaintext=21)) == 17 * 21
+    assert cs.decrypt(cs.encrypt(plaintext=3) * cs.encrypt(plaintext=7)) == 21
+
+    with pytest.raises(ValueError, match="subgroup"):
+        cs.cs.encrypt(plaintext=q + 1)
+
+    logger.info("✅ ElGamal subgroup hides Legendre symbol test succeeded")
+
+
+def test_regenerate_many_with_fixed_base_tables():
+    from lightphe import LightPHE
+
+    for kwargs in [{"key_size": 256}, {"group": "modp2048"}]:
+        cs = LightPHE(algorithm_name="ElGamal", **kwargs)
+        plaintexts = list(range(1, 41))
+        ciphertexts = [cs.encrypt(plaintext) for plaintext in plaintexts]
+
+        regenerated = cs.regenerate_many(ciphertexts)
+        assert [cs.decrypt(c) for c in regenerated] == plaintexts
+        assert all(a.value != b.value for a, b in zip(ciphertexts, regenerated))
+
+    logger.info("✅ ElGamal regenerate many test succeeded")
@@ -0,0 +1,97 @@
+import os
+
+import pytest
+
+from lightphe import LightPHE
+from lightphe.models.Ciphertext import Ciphertext
+from lightphe.models.EncryptedArray import EncryptedArray
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="tests/test_encrypted_array.py")
+
+cs = LightPHE(algorithm_name="Paillier", key_size=50)
+
+
+def test_store_and_reduce(tmp_path):
+    target_file = os.path.join(tmp_path, "salaries.lphe")
+    plaintexts = list(range(1, 101))
+
+    # generator is consumed lazily
+    encrypted_array = cs.encrypt_to_file((m for m in plaintexts), target_file)
+    assert isinstance(encrypted_array, EncryptedArray)
+    assert len(encrypted_array) == len(plaintexts)
+
+    # random access and lazy iteration
+    assert isinstance(encrypted_array[7], Ciphertext)
+    assert cs.decrypt(encrypted_array[7]) == plaintexts[7]
+    assert cs.decrypt(encrypted_array[-1]) == plaintexts[-1]
+    assert [cs.decrypt(c) for c in encrypted_array] == plaintexts
+
+    # neither the store nor its ciphertexts carry private key
+    assert encrypted_array.cs.keys.get("private_key") is None
+    assert encrypted_array[0].cs.keys.get("private_key") is None
+    assert cs.cs.keys.get("private_key") is not None
+
+    # streaming reductions with a chunk size not dividing the length
+    assert cs.decrypt(encrypted_array.sum(chunk_size=7)) == sum(plaintexts)
+
+    weights = [i % 3 for i in range(len(plaintexts))]
+    assert cs.decrypt(encrypted_array.weighted_sum(weights, chunk_size=9)) == sum(
+        w * m for w, m in zip(weights, plaintexts)
+    )
+
+    # slicing returns views sharing the same memory map
+    view = encrypted_array[10:50:3]
+    assert len(view) == len(plaintexts[10:50:3])
+    assert cs.decrypt(view.sum()) == sum(plaintexts[10:50:3])
+    assert cs.decrypt(encrypted_array[20:30].sum(chunk_size=4)) == sum(
+        plaintexts[20:30]
+    )
+
+    with pytest.raises(ValueError, match="same length"):
+        encrypted_array.weighted_sum([1, 2, 3])
+
+    with pytest.raises(ValueError, match="empty"):
+        encrypted_array[5:5].sum()
+
+    encrypted_array.close()
+
+    # reopen on cloud side with public key only
+    public_cs = LightPHE(
+        algorithm_name="Paillier", keys={"public_key": cs.cs.keys["public_key"]}
+    )
+    with EncryptedArray(target_file=target_file, cs=public_cs.cs) as reopened:
+        assert len(reopened) == len(plaintexts)
+        encrypted_sum = reopened.sum()
+
+    assert cs.decrypt(encrypted_sum) == sum(plaintexts)
+
+    logger.info("✅ Encrypted array tests succeeded")
+
+
+def test_mismatched_cryptosystem(tmp_path):
+    target_file = os.path.join(tmp_path, "mismatched.lphe")
+    encrypted_array = cs.encrypt_to_file([1, 2, 3], target_file)
+    encrypted_array.close()
+
+    other_cs = LightPHE(algorithm_name="Paillier", key_size=100)
+    with pytest.raises(ValueError, match="byte items"):
+        EncryptedArray(target_file=target_file, cs=other_cs.cs)
+
+    with open(target_file, "wb") as file:
+        file.write(b"not an encrypted array")
+
+    with pytest.raises(ValueError, match="not a valid"):
+        EncryptedArray(target_file=target_file, cs=cs.cs)
+
+    logger.info("✅ Encrypted array validation tests succeeded")
+
+
+def test_non_integer_ciphertexts_rejected(tmp_path):
+    target_file = os.path.join(tmp_path, "elgamal.lphe")
+    elgamal = LightPHE(algorithm_name="Exponential-ElGamal", key_size=50)
+
+    with pytest.raises(ValueError):
+        elgamal.encrypt_to_file([1, 2, 3], target_file)
+
+    logger.info("✅ Encrypted array rejects non-integer ciphertexts as expected")
@@ -0,0 +1,71 @@
+import pytest
+
+from lightphe.commons import phe_utils
+from lightphe.models.FixedPointEncoder import FixedPointEncoder
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="tests/test_fixed_point_encoder.py")
+
+MODULO = 2**127 - 1
+
+
+def test_encode_matches_fractionize():
+    encoder = FixedPointEncoder(modulo=MODULO, precision=5)
+    assert encoder.scale == 10**5
+
+    for value in [0.5, 1.005, 2.05, 3.14159265, 7.003005, -3.5 * 7.002, -0.1, 12, -7]:
+        expected, divisor = phe_utils.fractionize(
+            value=value, modulo=MODULO, precision=5
+        )
+        assert divisor == encoder.scale
+        assert encoder.encode(value) == expected
+        assert encoder.encode_magnitude(value) == encoder.encode(abs(value))
+
+    # negative values are encoded like two's complement
+    assert encoder.encode(-2.5) == MODULO - 250000
+    assert encoder.encode(0.0) == encoder.encode(-0.0) == 0
+
+    logger.info("✅ Fixed-point encoding test succeeded")
+
+
+def test_batches():
+    encoder = FixedPointEncoder(modulo=MODULO, precision=3)
+
+    values = [1.25, -2.5, 0, 4, -6]
+    encoded, magnitudes, signs = encoder.encode_batch(values)
+    assert encoded == [encoder.encode(value) for value in values]
+    assert magnitudes == [1250, 2500, 0, 4000, 6000]
+    assert signs == [1, -1, 1, 1, -1]
+
+    assert encoder.decode_batch(magnitudes, signs) == pytest.approx(values)
+    # products of two fixed-point values are scaled twice
+    assert encoder.decode(2500 * 1000, -1, divisor=10**6) == -2.5
+
+    logger.info("✅ Fixed-point batch test succeeded")
+
+
+def test_numpy_batches():
+    np = pytest.importorskip("numpy")
+
+    for modulo in [MODULO, 2**31 - 1]:
+        encoder = FixedPointEncoder(modulo=modulo, precision=4)
+        values = [1.25, -2.5, 0.0, 4.0, -6.0625, 1e-9]
+        encoded, magnitudes, signs = encoder.encode_batch(np.array(values))
+        assert (encoded, magnitudes, signs) == encoder.encode_batch(values)
+
+        integers = np.array([[1, -2], [3, -4]], dtype=np.int64)
+        assert encoder.encode_batch(integers) == encoder.encode_batch([1, -2, 3, -4])
+
+        restored = encoder.decode_batch(magnitudes, signs, as_numpy=True, shape=(2, 3))
+        assert restored.shape == (2, 3)
+        assert np.allclose(restored.ravel(), values)
+
+    # values beyond int64 are scaled with python integers
+    encoder = FixedPointEncoder(modulo=MODULO, precision=5)
+    large = np.array([2**60, -(2**60)], dtype=np.int64)
+    assert encoder.encode_batch(large) == encoder.encode_batch([2**60, -(2**60)])
+
+    with pytest.raises(ValueError, match="NaN"):
+        encoder.encode_batch(np.array([np.inf]))
+
+    logger.info("✅ Fixed-point numpy batch test succeeded")
@@ -38,3 +38,77 @@ def test_api():
             f"✅ Goldwasser-Micali api test succeeded for {m1.bit_length()}&{m2.bit_length()} bit plaintexts "
             f"({security_level} bit security level)"
         )
+
+
+def test_packed_ciphertexts():
+    from lightphe import LightPHE
+    from lightphe.models.PackedCiphertext import PackedCiphertext
+
+    cs = LightPHE(algorithm_name="Goldwasser-Micali", key_size=128).cs
+
+    bitmaps = [0b1011, 0b0110_1001, 0b1, 0]
+    packed = [cs.encrypt_packed(bitmap, bit_length=8) for bitmap in bitmaps]
+    assert all(len(c) == 8 for c in packed)
+    assert [cs.decrypt(c) for c in packed] == bitmaps
+
+    # buffers round trip
+    restored = PackedCiphertext(packed[1].buffer, packed[1].width, packed[1].length)
+    assert restored == packed[1]
+    assert cs.decrypt(restored.unpack()) == bitmaps[1]
+    assert restored[0] == packed[1].unpack()[0]
+
+    expected = 0
+    for bitmap in bitmaps:
+        expected ^= bitmap
+
+    result = cs.xor_many(packed)
+    assert isinstance(result, PackedCiphertext)
+    assert cs.decrypt(result) == expected
+
+    # mixed lengths and representations
+    lists = [cs.encrypt(0b111), cs.encrypt(0b1_0000_0001)]
+    assert cs.decrypt(cs.xor_many(lists)) == 0b111 ^ 0b1_0000_0001
+    assert cs.decrypt(cs.xor(packed[0], lists[0])) == 0b1011 ^ 0b111
+    assert cs.decrypt(cs.reencrypt(packed[0])) == 0b1011
+
+    with pytest.raises(ValueError, match="does not fit"):
+        cs.encrypt_packed(0b1_0000_0000, bit_length=8)
+
+    logger.info("✅ Goldwasser-Micali packed ciphertexts test succeeded")
+
+
+def test_randomness_pool():
+    from concurrent.futures import ThreadPoolExecutor
+    from lightphe import LightPHE
+
+    cs = LightPHE(algorithm_name="Goldwasser-Micali", key_size=128)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pool = cs.cs.use_randomness_pool(capacity=64, executor=executor)
+        assert pool.wait(timeout=10) is True
+        assert len(pool) == 64
+
+        n = cs.cs.keys["public_key"]["n"]
+        p = cs.cs.keys["private_key"]["p"]
+        squares = [pool.take() for _ in range(64)]
+        # squares are quadratic residues and handed out once
+        assert all(pow(square, (p - 1) // 2, p) == 1 for square in squares)
+        assert all(0 < square < n for square in squares)
+        assert len(set(squares)) == 64
+
+        c1 = cs.encrypt(plaintext=17)
+        c2 = cs.encrypt(plaintext=23)
+        assert cs.decrypt(c1 ^ c2) == 17 ^ 23
+
+        # pool set before is closed when it is replaced
+        assert pool.wait(timeout=10) is True and len(pool) > 0
+        replaced = cs.cs.use_randomness_pool(capacity=64, executor=executor)
+        assert replaced is not pool and len(pool) == 0
+        assert replaced.wait(timeout=10) is True
+
+        cs.cs.close()
+        assert cs.cs.randomness is None and len(replaced) == 0
+        # squares are calculated on demand after closing
+        assert cs.decrypt(cs.encrypt(plaintext=5)) == 5
+
+    logger.info("✅ Goldwasser-Micali randomness pool test succeeded")
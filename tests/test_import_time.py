@@ -0,0 +1,73 @@
+import sys
+import json
+import subprocess
+
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="tests/test_import_time.py")
+
+# dependencies which must not be loaded by a plain import lightphe. Import time
+# is asserted through them instead of a wall-clock bound depending on the machine.
+HEAVY_MODULES = ["sympy", "numpy", "tqdm", "multiprocessing", "lightecc", "gmpy2"]
+
+
+def __run(code: str) -> dict:
+    # run in a fresh interpreter, modules of this process are already imported
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_import_is_lazy():
+    result = __run(
+        "import sys, time, json\n"
+        "tic = time.perf_counter()\n"
+        "import lightphe\n"
+        "toc = time.perf_counter()\n"
+        "print(json.dumps({'seconds': toc - tic, 'modules': list(sys.modules)}))\n"
+    )
+
+    logger.info(f"import lightphe took {result['seconds']:.3f} seconds")
+
+    loaded = [
+        module
+        for module in result["modules"]
+        if module.split(".")[0] in HEAVY_MODULES
+        or module.startswith("lightphe.cryptosystems.")
+    ]
+    assert loaded == [], f"{loaded} loaded on import"
+
+    logger.info("✅ Import time test succeeded")
+
+
+def test_cryptosystems_loaded_on_first_use():
+    result = __run(
+        "import sys, json\n"
+        "from lightphe import LightPHE\n"
+        "cs = LightPHE(algorithm_name='Paillier', key_size=64)\n"
+        "c = cs.encrypt(17) + cs.encrypt(23)\n"
+        "assert cs.decrypt(c) == 40\n"
+        "print(json.dumps({'modules': list(sys.modules)}))\n"
+    )
+
+    cryptosystems = [
+        module
+        for module in result["modules"]
+        if module.startswith("lightphe.cryptosystems.")
+    ]
+    assert cryptosystems == ["lightphe.cryptosystems.Paillier"]
+    assert "lightecc" not in result["modules"]
+
+    logger.info("✅ Only used cryptosystem is loaded as expected")
+
+
+def test_cryptosystem_classes_still_exposed():
+    # pylint: disable=import-outside-toplevel
+    import lightphe
+    from lightphe import Paillier, EllipticCurveElGamal
+    from lightphe.cryptosystems.Paillier import Paillier as PaillierClass
+
+    assert Paillier is PaillierClass
+    assert EllipticCurveElGamal.__name__ == "EllipticCurveElGamal"
+    assert getattr(lightphe, "NotACryptosystem", None) is None
+
+    logger.info("✅ Cryptosystem classes are still available in lightphe")
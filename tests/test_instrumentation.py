@@ -0,0 +1,128 @@
+from lightphe import LightPHE
+from lightphe.commons import instrumentation
+from lightphe.commons.instrumentation import Metrics
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="tests/test_instrumentation.py")
+
+
+def test_per_instance_metrics():
+    metrics = Metrics()
+    cs = LightPHE(algorithm_name="Paillier", key_size=128, metrics=metrics)
+
+    c1 = cs.encrypt(17)
+    c2 = cs.encrypt(23)
+    c3 = c1 + c2
+    c4 = c3 * 2
+    c5 = cs.regenerate_ciphertext(c4)
+    assert cs.decrypt(c5) == 80
+
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"]["encrypt"] == 2
+    assert snapshot["counters"]["add"] == 1
+    assert snapshot["counters"]["scalar_multiply"] == 1
+    assert snapshot["counters"]["reencrypt"] == 1
+    assert snapshot["counters"]["decrypt"] == 1
+
+    histogram = snapshot["histograms"]["encrypt"]
+    assert histogram["count"] == 2
+    assert 0 < histogram["min"] <= histogram["p50"] <= histogram["p99"]
+    assert histogram["p99"] <= histogram["max"]
+
+    # other instances do not record into these metrics
+    other = LightPHE(algorithm_name="Paillier", key_size=128)
+    other.encrypt(17)
+    assert metrics.snapshot()["counters"]["encrypt"] == 2
+
+    metrics.reset()
+    assert metrics.snapshot() == {"counters": {}, "histograms": {}}
+
+    logger.info("✅ Per instance metrics test succeeded")
+
+
+def test_dlp_iterations():
+    metrics = Metrics()
+    cs = LightPHE(algorithm_name="Exponential-ElGamal", key_size=128, metrics=metrics)
+
+    assert cs.decrypt(cs.encrypt(17) + cs.encrypt(23)) == 40
+    # m = 0 is checked first
+    assert metrics.snapshot()["counters"]["dlp_iterations"] == 41
+
+    logger.info("✅ DLP iterations test succeeded")
+
+
+def test_tensor_metrics():
+    metrics = Metrics()
+    cs = LightPHE(algorithm_name="Paillier", key_size=128, metrics=metrics)
+
+    encrypted = cs.encrypt([1.5, 2.5, 3.5], silent=True)
+    dot = encrypted @ [1, 2, 3]
+    assert abs(cs.decrypt(dot)[0] - 17) < 1e-2
+
+    counters = metrics.snapshot()["counters"]
+    assert counters["tensor_encrypt"] == 1
+    assert counters["pool_dispatch"] == 1
+    assert counters["pool_tasks"] == 3
+    assert counters["dot"] == 1
+    assert counters["tensor_decrypt"] == 1
+
+    histograms = metrics.snapshot()["histograms"]
+    assert 0 < histograms["pool_dispatch"]["max"] <= histograms["tensor_encrypt"]["max"]
+
+    logger.info("✅ Tensor metrics test succeeded")
+
+
+def test_global_metrics_and_listener():
+    recordings = []
+
+    def listener(name, kind, value):
+        recordings.append((name, kind, value))
+
+    cs = LightPHE(algorithm_name="RSA", key_size=128)
+    instrumentation.GLOBAL_METRICS.reset()
+    instrumentation.GLOBAL_METRICS.add_listener(listener)
+
+    try:
+        # disabled by default
+        cs.encrypt(17)
+        assert instrumentation.GLOBAL_METRICS.snapshot()["counters"] == {}
+        assert recordings == []
+
+        instrumentation.enable()
+        assert instrumentation.is_enabled() is True
+        c1 = cs.encrypt(3)
+        c2 = cs.encrypt(5)
+        assert cs.decrypt(c1 * c2) == 15
+    finally:
+        instrumentation.disable()
+        instrumentation.GLOBAL_METRICS.remove_listener(listener)
+
+    counters = instrumentation.GLOBAL_METRICS.snapshot()["counters"]
+    assert counters == {"encrypt": 2, "multiply": 1, "decrypt": 1}
+    assert [(name, kind) for name, kind, _ in recordings] == [
+        ("encrypt", instrumentation.TIMER),
+        ("encrypt", instrumentation.TIMER),
+        ("multiply", instrumentation.TIMER),
+        ("decrypt", instrumentation.TIMER),
+    ]
+    assert all(seconds >= 0 for _, _, seconds in recordings)
+
+    instrumentation.GLOBAL_METRICS.reset()
+
+    logger.info("✅ Global metrics and listener test succeeded")
+
+
+def test_histogram_percentiles():
+    metrics = Metrics()
+    for _ in range(99):
+        metrics.observe("op", 1e-5)
+    metrics.observe("op", 1.0)
+
+    histogram = metrics.snapshot()["histograms"]["op"]
+    assert histogram["count"] == 100
+    assert 1e-5 <= histogram["p50"] < 1e-4
+    assert 1e-5 <= histogram["p99"] < 1e-4
+    assert histogram["max"] == 1.0
+    assert abs(histogram["total"] - (99 * 1e-5 + 1.0)) < 1e-9
+
+    logger.info("✅ Histogram percentiles test succeeded")
@@ -0,0 +1,138 @@
+import os
+import copy
+import json
+import pickle
+
+import pytest
+
+from lightphe import LightPHE
+from lightphe.commons import key_store
+from lightphe.commons.fixed_width import FixedWidthArray
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="tests/test_key_formats.py")
+
+
+@pytest.mark.parametrize("binary", [False, True])
+@pytest.mark.parametrize(
+    "algorithm_name",
+    ["Paillier", "Benaloh", "Naccache-Stern", "EllipticCurve-ElGamal"],
+)
+def test_round_trip(tmp_path, algorithm_name, binary):
+    private_key_file = os.path.join(tmp_path, "secret.lphe")
+    public_key_file = os.path.join(tmp_path, "public.lphe")
+
+    onprem_cs = LightPHE(algorithm_name=algorithm_name, key_size=40)
+    onprem_cs.export_keys(private_key_file, binary=binary, precomputations=True)
+    onprem_cs.export_keys(
+        public_key_file, public=True, binary=binary, precomputations=True
+    )
+
+    # keys are restored exactly, tuples (e.g. elliptic curve points) included
+    restored_keys, precomputations, algorithm_name_restored = key_store.load(
+        private_key_file
+    )
+    assert restored_keys == onprem_cs.cs.keys
+    assert algorithm_name_restored == algorithm_name
+
+    _, public_precomputations, _ = key_store.load(public_key_file)
+    assert public_precomputations == {}
+    assert list(precomputations.keys()) == list(
+        onprem_cs.cs.get_precomputations().keys()
+    )
+
+    cloud_cs = LightPHE(algorithm_name=algorithm_name, key_file=public_key_file)
+    assert cloud_cs.cs.keys.get("private_key") is None
+
+    c1 = cloud_cs.encrypt(17)
+    c2 = cloud_cs.encrypt(23)
+
+    restored_cs = LightPHE(algorithm_name=algorithm_name, key_file=private_key_file)
+    assert restored_cs.decrypt(c1 + c2) == 40
+
+    logger.info(f"✅ Key round trip test succeeded for {algorithm_name} ({binary=})")
+
+
+@pytest.mark.parametrize(
+    "algorithm_name",
+    ["Paillier", "Damgard-Jurik", "Okamoto-Uchiyama", "Benaloh", "Naccache-Stern"],
+)
+def test_precomputations_dropped_without_private_key(algorithm_name):
+    onprem_cs = LightPHE(algorithm_name=algorithm_name, key_size=64)
+    precomputations = onprem_cs.cs.get_precomputations()
+    assert precomputations
+
+    public_cs = copy.deepcopy(onprem_cs.cs)
+    del public_cs.keys["private_key"]
+    restored_cs = pickle.loads(pickle.dumps(public_cs))
+
+    for name in precomputations:
+        assert getattr(restored_cs, name) is None
+        assert getattr(public_cs, name) is None
+
+    # the cryptosystem having private key keeps them
+    assert onprem_cs.cs.get_precomputations() == precomputations
+
+    logger.info(f"✅ {algorithm_name} precomputations dropped without private key")
+
+
+def test_tables_memory_mapped_in_binary_form(tmp_path):
+    target_file = os.path.join(tmp_path, "benaloh.lphe")
+    onprem_cs = LightPHE(algorithm_name="Benaloh", key_size=50)
+    onprem_cs.export_keys(target_file, binary=True, precomputations=True)
+
+    restored_cs = LightPHE(algorithm_name="Benaloh", key_file=target_file)
+    dlp_table = restored_cs.cs.dlp_table
+    assert isinstance(dlp_table, FixedWidthArray)
+    assert list(dlp_table) == onprem_cs.cs.dlp_table
+
+    c = onprem_cs.encrypt(123)
+    assert restored_cs.decrypt(c) == 123
+
+    logger.info("✅ Precomputed tables are memory-mapped as expected")
+
+
+def test_huge_integers(tmp_path):
+    target_file = os.path.join(tmp_path, "huge.lphe")
+
+    # more than 4300 decimal digits cannot be parsed from decimal strings by default
+    n = 7**6000
+    keys = {"public_key": {"n": n, "e": 65537}, "private_key": {"d": n - 2}}
+    key_store.dump(target_file=target_file, keys=keys, algorithm_name="RSA")
+
+    restored_keys, _, _ = key_store.load(target_file)
+    assert restored_keys == keys
+
+    logger.info("✅ Huge integers restored as expected")
+
+
+def test_legacy_key_files(tmp_path):
+    keys = {"private_key": {"d": 30365}, "public_key": {"n": 175501, "e": 101753}}
+
+    json_file = os.path.join(tmp_path, "legacy.json")
+    with open(json_file, "w", encoding="UTF-8") as file:
+        file.write(json.dumps(keys))
+
+    literal_file = os.path.join(tmp_path, "legacy.txt")
+    with open(literal_file, "w", encoding="UTF-8") as file:
+        file.write(str(keys))
+
+    for target_file in [json_file, literal_file]:
+        cs = LightPHE(algorithm_name="RSA", key_file=target_file)
+        assert cs.cs.keys == keys
+
+    logger.info("✅ Legacy key files restored as expected")
+
+
+def test_code_in_key_file_not_executed(tmp_path):
+    target_file = os.path.join(tmp_path, "malicious.txt")
+    marker_file = os.path.join(tmp_path, "marker")
+    with open(target_file, "w", encoding="UTF-8") as file:
+        file.write(f"open({marker_file!r}, 'w') and {{'public_key': {{}}}}")
+
+    with pytest.raises(ValueError):
+        LightPHE(algorithm_name="RSA", key_file=target_file)
+
+    assert os.path.exists(marker_file) is False
+
+    logger.info("✅ Key files are parsed without evaluating code")
@@ -0,0 +1,128 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from lightphe import LightPHE, KeyPool
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="tests/test_key_pool.py")
+
+
+def test_draw_keys_from_pool():
+    with KeyPool(size=2, workers=2) as pool:
+        pool.register("Paillier", key_size=128)
+        pool.register("EllipticCurve-ElGamal", curve="secp256k1")
+
+        tenants = [
+            LightPHE(algorithm_name="Paillier", key_size=128, key_source=pool)
+            for _ in range(5)
+        ]
+
+        # every tenant gets its own key pair
+        moduli = {tenant.cs.keys["public_key"]["n"] for tenant in tenants}
+        assert len(moduli) == len(tenants)
+
+        for tenant in tenants:
+            assert tenant.decrypt(tenant.encrypt(17) + tenant.encrypt(23)) == 40
+
+        # options are part of the spec
+        cs = LightPHE(
+            algorithm_name="EllipticCurve-ElGamal", curve="secp256k1", key_source=pool
+        )
+        assert cs.decrypt(cs.encrypt(17) + cs.encrypt(23)) == 40
+
+        # consumed keys are replaced in background
+        deadline = time.time() + 60
+        while pool.available("Paillier", key_size=128) < 2 and time.time() < deadline:
+            time.sleep(0.05)
+        assert pool.available("Paillier", key_size=128) == 2
+
+    logger.info("✅ Key pool test succeeded")
+
+
+def test_pool_with_custom_executor():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pool = KeyPool(size=1, executor=executor)
+
+        # not registered specs are registered on first use
+        cs = LightPHE(algorithm_name="RSA", key_size=128, key_source=pool)
+        assert cs.decrypt(cs.encrypt(17) * cs.encrypt(23)) == 17 * 23
+
+        # failures of key generation are raised to the caller
+        with pytest.raises(ValueError, match="unimplemented algorithm"):
+            pool.acquire("unknown-algorithm", timeout=60)
+
+        pool.close()
+        with pytest.raises(ValueError, match="closed"):
+            pool.acquire("RSA", key_size=128)
+
+    with pytest.raises(ValueError):
+        KeyPool(size=0)
+
+    logger.info("✅ Key pool with custom executor test succeeded")
+
+
+def test_acquire_after_failure(monkeypatch):
+    from lightphe.models import KeyPool as key_pool_module
+
+    generate_keys = key_pool_module._generate_keys
+    calls = []
+
+    def fail_once(algorithm_name, key_size, options):
+        calls.append(algorithm_name)
+        if len(calls) == 1:
+            raise ValueError("transient failure")
+        return generate_keys(algorithm_name, key_size, options)
+
+    monkeypatch.setattr(key_pool_module, "_generate_keys", fail_once)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with KeyPool(size=1, executor=executor) as pool:
+            with pytest.raises(ValueError, match="transient failure"):
+                pool.acquire("RSA", key_size=128, timeout=10)
+
+            # generation is retried once the failure is raised
+            keys = pool.acquire("RSA", key_size=128, timeout=10)
+            cs = LightPHE(algorithm_name="RSA", keys=keys)
+            assert cs.decrypt(cs.encrypt(17)) == 17
+
+    logger.info("✅ Key pool acquire after failure test succeeded")
+
+
+def test_acquire_timeout_is_a_deadline(monkeypatch):
+    from lightphe.models import KeyPool as key_pool_module
+
+    generate_keys = key_pool_module._generate_keys
+    release = threading.Event()
+
+    def block_paillier(algorithm_name, key_size, options):
+        if algorithm_name == "Paillier":
+            release.wait()
+            raise ValueError("released")
+        return generate_keys(algorithm_name, key_size, options)
+
+    monkeypatch.setattr(key_pool_module, "_generate_keys", block_paillier)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with KeyPool(size=1, executor=executor) as pool:
+            stop = time.time() + 3
+
+            def consume_rsa_keys():
+                # every generated key notifies waiters of all specs
+                while time.time() < stop:
+                    pool.acquire("RSA", key_size=128, timeout=10)
+
+            consumer = threading.Thread(target=consume_rsa_keys)
+            consumer.start()
+
+            tic = time.time()
+            with pytest.raises(TimeoutError):
+                pool.acquire("Paillier", timeout=0.5)
+            assert time.time() - tic < 2
+
+            consumer.join()
+            release.set()
+
+    logger.info("✅ Key pool timeout test succeeded")
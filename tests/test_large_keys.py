@@ -19,11 +19,11 @@ def test_large_keys():
     Goldwasser-Micali | 3072 | 0.45 | 0.00 | 0.00 |0.08
     Goldwasser-Micali | 7680 | 11.30 | 0.00 | 0.00 |1.21
 
-    Benaloh | 1024 | 4.91 | 0.00 | 0.00 |0.01
-    Benaloh | 2048 | 140.54 | 0.00 | 0.00 |0.03
-    Benaloh | 3072 | 439.46 | 0.00 | 0.00 |0.08
+    Benaloh | 1024 | 0.07 | 0.00 | 0.00 |0.01
+    Benaloh | 2048 | 0.17 | 0.00 | 0.00 |0.03
+    Benaloh | 3072 | 4.86 | 0.00 | 0.00 |0.08
 
-    Naccache-Stern | 1024 | 19.97 | 0.00 | 0.00 |0.06
+    Naccache-Stern | 1024 | 0.65 | 0.00 | 0.00 |0.06
     """
     algorithms = [
         "Naccache-Stern",
@@ -0,0 +1,67 @@
+import logging
+
+from lightphe.commons import logger as logger_module
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="tests/test_logger.py")
+
+
+class Costly:
+    """
+    Argument counting how many times it is formatted
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return "costly"
+
+
+def test_lazy_formatting(capsys):
+    custom_logger = Logger(module="tests/test_logger.py")
+    custom_logger.log_level = logging.INFO
+
+    argument = Costly()
+    custom_logger.debug("value is %s", argument)
+    assert argument.calls == 0
+    assert custom_logger.is_enabled(logging.DEBUG) is False
+    assert custom_logger.is_enabled(logging.INFO) is True
+
+    custom_logger.info("value is %s", argument)
+    assert argument.calls == 1
+    assert "value is costly" in capsys.readouterr().out
+
+    # messages without args are not formatted, so percent signs are kept
+    custom_logger.info("100% done")
+    assert "100% done" in capsys.readouterr().out
+
+    custom_logger.log_level = logging.DEBUG
+    custom_logger.debug("value is %s", argument)
+    assert argument.calls == 2
+    assert "🕷️ value is costly" in capsys.readouterr().out
+
+    logger.info("✅ Lazy formatting test succeeded")
+
+
+def test_stdlib_logging(caplog, capsys):
+    custom_logger = Logger(module="lightphe/commons/phe_utils.py")
+    assert custom_logger.stdlib_logger.name == "lightphe.commons.phe_utils"
+
+    argument = Costly()
+    logger_module.use_stdlib_logging()
+    try:
+        with caplog.at_level(logging.INFO, logger="lightphe"):
+            custom_logger.debug("value is %s", argument)
+            custom_logger.warn("value is %s", argument)
+    finally:
+        logger_module.use_stdlib_logging(False)
+
+    # levels of standard logging decide what is emitted
+    assert [(r.levelno, r.getMessage()) for r in caplog.records] == [
+        (logging.WARNING, "value is costly")
+    ]
+    assert capsys.readouterr().out == ""
+
+    logger.info("✅ Standard logging integration test succeeded")
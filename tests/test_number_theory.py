@@ -0,0 +1,58 @@
+# built-in dependencies
+import random
+
+# 3rd party dependencies
+import pytest
+from sympy import jacobi_symbol
+
+# project dependencies
+from lightphe.commons import primes
+from lightphe.commons.number_theory import jacobi, fixed_base_table, fixed_base_pow
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="tests/test_number_theory.py")
+
+
+def test_jacobi_matches_sympy():
+    for n in [1, 3, 9, 15, 21, 45, 1001, 2**61 - 1]:
+        for a in list(range(-5, 50)) + [random.randint(0, 2**64) for _ in range(50)]:
+            assert jacobi(a, n) == jacobi_symbol(a, n), (a, n)
+
+    logger.info("✅ Jacobi symbol test succeeded")
+
+
+def test_legendre_symbol_of_large_prime():
+    p = primes.random_prime(2**255, 2**256)
+    for _ in range(50):
+        a = random.randint(1, p - 1)
+        euler = 1 if pow(a, (p - 1) // 2, p) == 1 else -1
+        assert jacobi(a, p) == euler
+        assert jacobi(a * a, p) == 1
+    assert jacobi(p, p) == 0
+
+    logger.info("✅ Legendre symbol test succeeded")
+
+
+def test_jacobi_requires_odd_modulo():
+    for n in [0, -3, 10]:
+        with pytest.raises(ValueError, match="odd positive"):
+            jacobi(5, n)
+
+    logger.info("✅ Jacobi symbol modulo test succeeded")
+
+
+def test_fixed_base_pow():
+    modulus = 2**127 - 1
+    base = random.randint(2, modulus - 1)
+
+    for window in [1, 4, 6]:
+        table = fixed_base_table(base, modulus, 100, window=window)
+        for exponent in [0, 1, 2**100 - 1, random.getrandbits(100)]:
+            assert fixed_base_pow(table, exponent, modulus) == pow(
+                base, exponent, modulus
+            )
+
+    with pytest.raises(ValueError, match="exceeds"):
+        fixed_base_pow(table, 2**200, modulus)
+
+    logger.info("✅ fixed base exponentiation test succeeded")
@@ -0,0 +1,97 @@
+import sympy
+import pytest
+
+from lightphe.commons import primes
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="tests/test_primes.py")
+
+
+def test_random_prime():
+    for _ in range(100):
+        p = primes.random_prime(200, 2**20)
+        assert sympy.isprime(p) and 200 <= p < 2**20
+
+        # primes in an arithmetic progression, e.g. p = 1 mod r in Benaloh
+        p = primes.random_prime(0, 2**24, modulus=1009, residue=1)
+        assert sympy.isprime(p) and p % 1009 == 1
+
+        # companions, e.g. 2au + 1 in Naccache-Stern
+        a = primes.random_prime(0, 2**18, companions=[(2 * 105, 1)])
+        assert sympy.isprime(a) and sympy.isprime(2 * 105 * a + 1)
+
+    # small primes must not be sieved out
+    assert primes.random_prime(2, 4) in [2, 3]
+    assert primes.random_prime(1000, 2000) < 2000
+
+    logger.info("✅ Random prime test succeeded")
+
+
+def test_next_prime():
+    assert primes.next_prime(13) == 17
+    assert primes.next_prime(1) == 2
+    assert primes.next_prime(10**6) == sympy.nextprime(10**6)
+
+    # p = -1 mod 4n as in Boneh-Goh-Nissim
+    n = 1009 * 1013
+    p = primes.next_prime(4 * n - 2, modulus=4 * n, residue=-1)
+    assert sympy.isprime(p) and (p + 1) % (4 * n) == 0
+    assert all(
+        sympy.isprime(4 * n * l - 1) is False for l in range(1, (p + 1) // (4 * n))
+    )
+
+    # no prime below limit
+    assert primes.next_prime(24, limit=29) is None
+
+    logger.info("✅ Next prime test succeeded")
+
+
+def test_no_candidate():
+    with pytest.raises(ValueError, match="no candidate"):
+        primes.random_prime(10, 12, modulus=7, residue=5)
+
+    with pytest.raises(ValueError, match="no prime"):
+        primes.random_prime(24, 29)
+
+    logger.info("✅ Prime search fails for empty ranges as expected")
+
+
+def test_parallel_search():
+    # parallel search is opt-in
+    p = primes.random_prime(2**255, 2**256, workers=2)
+    assert sympy.isprime(p) and 2**255 <= p < 2**256
+
+    p = primes.random_prime(2**255, 2**256, companions=[(2 * 15, 1)], workers=2)
+    assert sympy.isprime(p) and sympy.isprime(30 * p + 1)
+
+    logger.info("✅ Parallel prime search test succeeded")
+
+
+def test_serial_search_by_default():
+    # no processes are spawned for large primes unless workers are requested
+    assert primes._resolve_workers(None, count=2**1024) == 1
+    assert primes._resolve_workers(1, count=2**1024) == 1
+    assert primes._resolve_workers(4, count=2**1024) == 4
+
+    logger.info("✅ Prime search is serial by default as expected")
+
+
+def test_workers_passed_through_key_generation(monkeypatch):
+    from lightphe import LightPHE
+
+    requested = []
+
+    def resolve_workers(workers, count):
+        requested.append(workers)
+        return 1
+
+    monkeypatch.setattr(primes, "_resolve_workers", resolve_workers)
+
+    LightPHE(algorithm_name="Paillier", key_size=256)
+    assert requested and set(requested) == {None}
+
+    requested.clear()
+    LightPHE(algorithm_name="Paillier", key_size=256, workers=2)
+    assert requested and set(requested) == {2}
+
+    logger.info("✅ Workers are passed through key generation as expected")
@@ -1,3 +1,5 @@
+import math
+
 import pytest
 
 from lightphe.commons.logger import Logger
@@ -47,3 +49,67 @@ def test_float_multiplication():
     assert cs.decrypt(c1 * c2) == m1 * m2
 
     logger.info("✅ RSA float multiplication test succeeded")
+
+
+def test_crt_decryption():
+    cs = LightPHE(algorithm_name="RSA", key_size=512)
+    private_key = cs.cs.keys["private_key"]
+    assert {"d", "p", "q", "dp", "dq", "qinv"} <= set(private_key.keys())
+
+    c = cs.encrypt(plaintext=17)
+    n = cs.cs.keys["public_key"]["n"]
+    assert pow(c.value, private_key["d"], n) == cs.cs.private_power(c.value) == 17
+
+    # keys having d only fall back to exponentiation modulo n
+    legacy = LightPHE(
+        algorithm_name="RSA",
+        keys={
+            "public_key": cs.cs.keys["public_key"],
+            "private_key": {"d": private_key["d"]},
+        },
+    )
+    assert legacy.decrypt(c) == 17
+
+    # keys having factors only derive crt exponents
+    factors = LightPHE(
+        algorithm_name="RSA",
+        keys={
+            "public_key": cs.cs.keys["public_key"],
+            "private_key": {k: private_key[k] for k in ["d", "p", "q"]},
+        },
+    )
+    assert factors.decrypt(c) == 17
+
+    wrong = {k: private_key[k] for k in ["d", "p", "q"]}
+    wrong["p"] += 2
+    with pytest.raises(ValueError, match="do not match"):
+        LightPHE(
+            algorithm_name="RSA",
+            keys={"public_key": cs.cs.keys["public_key"], "private_key": wrong},
+        ).decrypt(c)
+
+    logger.info("✅ RSA CRT decryption test succeeded")
+
+
+def test_crt_signing():
+    cs = LightPHE(algorithm_name="RSA", key_size=512)
+    cs.cs.encrypt_with_public = False
+
+    signature = cs.cs.encrypt(plaintext=17)
+    n = cs.cs.keys["public_key"]["n"]
+    assert signature == pow(17, cs.cs.keys["private_key"]["d"], n)
+    assert cs.cs.decrypt(signature) == 17
+
+    logger.info("✅ RSA CRT signing test succeeded")
+
+
+def test_product():
+    cs = LightPHE(algorithm_name="RSA", key_size=512)
+
+    plaintexts = list(range(1, 21))
+    ciphertexts = [cs.encrypt(plaintext=m) for m in plaintexts]
+
+    assert cs.decrypt(cs.product(ciphertexts)) == math.factorial(20)
+    assert cs.decrypt(cs.product(ciphertexts, workers=3)) == math.factorial(20)
+
+    logger.info("✅ RSA product test succeeded")
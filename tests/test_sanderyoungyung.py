@@ -69,3 +69,106 @@ def run_api(plaintext_limit: Optional[int] = None):
         f"✅ Sander-Young-Yung test ({plaintext_limit=}) succeeded ({security_level} bit"
         f" security level) in {toc - tic:.2f} seconds"
     )
+
+
+def test_randomness_pool():
+    from lightphe import LightPHE
+    from lightphe.commons.number_theory import jacobi
+
+    cs = LightPHE(algorithm_name="Sander-Young-Yung", key_size=128)
+    p = cs.cs.keys["private_key"]["p"]
+
+    residues, non_residues = cs.cs.use_randomness_pool(capacity=256, workers=2)
+    try:
+        assert residues.wait(timeout=30) and non_residues.wait(timeout=30)
+        assert len(residues) == 256 and len(non_residues) == 256
+
+        assert all(jacobi(residues.take(), p) == 1 for _ in range(10))
+        assert all(jacobi(non_residues.take(), p) == -1 for _ in range(10))
+
+        for m1, m2 in [(17, 21), (2**63 + 5, 2**40 - 1)]:
+            c1 = cs.encrypt(plaintext=m1 % cs.cs.plaintext_modulo)
+            c2 = cs.encrypt(plaintext=m2 % cs.cs.plaintext_modulo)
+            expected = (m1 % cs.cs.plaintext_modulo) & (m2 % cs.cs.plaintext_modulo)
+            assert cs.decrypt(c1 & c2) == expected
+            assert cs.decrypt(cs.regenerate_ciphertext(c1)) == m1 % cs.cs.plaintext_modulo
+    finally:
+        cs.cs.close()
+
+    assert cs.cs.residues is None and cs.cs.non_residues is None
+    assert cs.decrypt(cs.encrypt(plaintext=5)) == 5
+
+    logger.info("✅ Sander-Young-Yung randomness pool test succeeded")
+
+
+def test_randomness_pool_fallback_is_logged(caplog):
+    import logging
+    from lightphe import LightPHE
+    from lightphe.commons import logger as logger_module
+
+    cs = LightPHE(algorithm_name="Sander-Young-Yung", key_size=128)
+    residues, non_residues = cs.cs.use_randomness_pool(capacity=8, workers=1)
+    assert non_residues.wait(timeout=30)
+
+    logger_module.use_stdlib_logging()
+    try:
+        with caplog.at_level(logging.WARNING, logger="lightphe"):
+            # closing the pool owning the processes first strands the other one
+            residues.close()
+            # draining the pool makes it refill in the shut down processes
+            for _ in range(8):
+                non_residues.take()
+    finally:
+        logger_module.use_stdlib_logging(False)
+        cs.cs.close()
+
+    assert any("on demand" in record.getMessage() for record in caplog.records)
+
+    logger.info("✅ Sander-Young-Yung randomness pool fallback test succeeded")
+
+
+def test_packed_ciphertexts():
+    import pickle
+    from lightphe import LightPHE
+    from lightphe.models.PackedCiphertext import PackedBlockCiphertext
+
+    cs = LightPHE(algorithm_name="Sander-Young-Yung", key_size=128).cs
+    l = cs.keys["public_key"]["l"]
+
+    values = [0b1011_0110, 0b0110_1101, 0b11, 0b111_1111]
+    values = [value % l for value in values]
+    packed = [cs.encrypt_packed(value) for value in values]
+    assert all(c.block_size == l for c in packed)
+    assert [cs.decrypt(c) for c in packed] == values
+
+    expected = values[0]
+    for value in values[1:]:
+        expected &= value
+
+    result = cs.and_many(packed)
+    assert isinstance(result, PackedBlockCiphertext)
+    assert cs.decrypt(result) == expected
+
+    # shorter ciphertext decides the length, nothing is padded
+    c1, c2 = cs.encrypt_packed(values[0]), cs.encrypt(plaintext=1)
+    result = cs.homomorphic_and(c1, c2)
+    assert len(result) == 1
+    assert cs.decrypt(result) == values[0] & 1
+    assert cs.decrypt(cs.homomorphic_and(c1.unpack(), c2)) == values[0] & 1
+
+    reencrypted = cs.reencrypt(packed[0])
+    assert reencrypted != packed[0]
+    assert cs.decrypt(reencrypted) == values[0]
+
+    # buffers are restored without copying
+    view = memoryview(bytearray(packed[1].buffer))
+    restored = PackedBlockCiphertext(view, packed[1].width, len(packed[1]), l)
+    assert restored.buffer.obj is view.obj
+    assert restored == packed[1]
+    assert restored[-1] == packed[1].unpack()[-1]
+    assert cs.decrypt(pickle.loads(pickle.dumps(restored))) == values[1]
+
+    with pytest.raises(ValueError, match="must have"):
+        cs.homomorphic_and(packed[0], [[1, 2]])
+
+    logger.info("✅ Sander-Young-Yung packed ciphertexts test succeeded")
@@ -0,0 +1,116 @@
+import os
+
+import pytest
+
+from lightphe import LightPHE
+from lightphe.models.Tensor import EncryptedTensor
+from lightphe.commons.logger import Logger
+
+logger = Logger(module="tests/test_stream.py")
+
+
+def test_stream_generator_with_back_pressure():
+    cs = LightPHE(algorithm_name="Paillier", key_size=128, precision=2)
+
+    pulled = []
+
+    def source():
+        for i in range(25):
+            pulled.append(i)
+            yield i * 1.5 if i % 2 == 0 else -i
+
+    stream = cs.encrypt_stream(source(), chunk_size=10, workers=1)
+    # nothing is read before the consumer asks for a chunk
+    assert pulled == []
+
+    first = next(stream)
+    assert isinstance(first, EncryptedTensor)
+    assert len(first.fractions) == 10
+    assert len(pulled) == 10
+
+    chunks = [first] + list(stream)
+    assert [len(chunk.fractions) for chunk in chunks] == [10, 10, 5]
+
+    restored = [m for chunk in chunks for m in cs.decrypt(chunk)]
+    expected = [i * 1.5 if i % 2 == 0 else -i for i in range(25)]
+    assert restored == pytest.approx(expected, abs=1e-2)
+
+    # private key is not shared with encrypted chunks
+    assert first.cs.keys.get("private_key") is None
+
+    logger.info("✅ Stream generator test succeeded")
+
+
+def test_stream_in_parallel():
+    cs = LightPHE(algorithm_name="Paillier", key_size=128, precision=2)
+
+    plaintexts = list(range(40))
+    pulled = []
+
+    def source():
+        for m in plaintexts:
+            pulled.append(m)
+            yield m
+
+    stream = cs.encrypt_stream(source(), chunk_size=4, workers=2, max_pending=3)
+    first = next(stream)
+    # at most max_pending chunks are read ahead
+    assert len(pulled) == 12
+
+    chunks = [first] + list(stream)
+    assert len(chunks) == 10
+    restored = [m for chunk in chunks for m in cs.decrypt(chunk)]
+    assert restored == pytest.approx(plaintexts)
+
+    logger.info("✅ Parallel stream test succeeded")
+
+
+def test_stream_files(tmp_path):
+    cs = LightPHE(algorithm_name="Paillier", key_size=128, precision=2)
+
+    csv_file = os.path.join(tmp_path, "features.csv")
+    with open(csv_file, "w", encoding="UTF-8") as file:
+        file.write("1,2.5,3\n4,5,-6.25\n")
+
+    restored = [
+        m
+        for chunk in cs.encrypt_stream(csv_file, chunk_size=4, workers=1)
+        for m in cs.decrypt(chunk)
+    ]
+    assert restored == pytest.approx([1, 2.5, 3, 4, 5, -6.25])
+
+    with pytest.raises(ValueError, match="csv or .npy"):
+        cs.encrypt_stream(os.path.join(tmp_path, "features.txt"))
+
+    with pytest.raises(ValueError, match="Chunk size"):
+        cs.encrypt_stream([1, 2, 3], chunk_size=0)
+
+    logger.info("✅ Stream files test succeeded")
+
+
+def test_stream_numpy(tmp_path):
+    np = pytest.importorskip("numpy")
+
+    cs = LightPHE(algorithm_name="Paillier", key_size=128, precision=2)
+
+    matrix = np.array([[1.25, 2.0, 3.5], [4.0, 5.75, 6.0]])
+    restored = [
+        m
+        for chunk in cs.encrypt_stream(matrix, chunk_size=4, workers=1)
+        for m in cs.decrypt(chunk)
+    ]
+    assert restored == pytest.approx(matrix.flatten().tolist())
+
+    npy_file = os.path.join(tmp_path, "features.npy")
+    np.save(npy_file, np.arange(6, dtype=np.int64).reshape(2, 3))
+    restored = [
+        m
+        for chunk in cs.encrypt_stream(npy_file, chunk_size=5, workers=1)
+        for m in cs.decrypt(chunk)
+    ]
+    assert restored == pytest.approx([0, 1, 2, 3, 4, 5])
+
+    with pytest.raises(ValueError, match="Numeric arrays"):
+        next(cs.encrypt_stream(np.array(["a", "b"]), workers=1))
+
+    logger.info("✅ Numpy stream test succeeded")
@@ -7,7 +7,8 @@ import pytest
 
 # project dependencies
 from lightphe.commons import phe_utils
-from lightphe.models.Tensor import EncryptedTensor
+from lightphe.models.Tensor import EncryptedTensor, parallel_sum
+from lightphe.models.FixedPointEncoder import FixedPointEncoder
 from lightphe import LightPHE
 from lightphe.commons.logger import Logger
 
@@ -349,3 +350,139 @@ def __test_real_world_embedding(algorithm_name):
     logger.info(
         f"✅ Real world embedding test succeeded with {algorithm_name} in {duration} seconds"
     )
+
+
+def test_tensor_shape_indexing_and_sum():
+    cs = build_cryptosystem("Paillier")
+
+    encrypted = cs.encrypt([1.5, 2, 3.25, 4, 5, 6.75], silent=True).reshape(2, 3)
+    assert encrypted.shape == (2, 3)
+    assert encrypted.ndim == 2
+    assert len(encrypted) == 2
+    restored = cs.decrypt(encrypted)
+    assert len(restored) == 2
+    assert restored[0] == pytest.approx([1.5, 2, 3.25])
+    assert restored[1] == pytest.approx([4, 5, 6.75])
+
+    assert encrypted.reshape(-1, 2).shape == (3, 2)
+    with pytest.raises(ValueError):
+        encrypted.reshape(4, -1)
+
+    # indexing and slicing do not decrypt anything
+    assert cs.decrypt(encrypted[1]) == pytest.approx([4, 5, 6.75])
+    assert cs.decrypt(encrypted[:, 1]) == pytest.approx([2, 5])
+    assert cs.decrypt(encrypted[-1, ::2]) == pytest.approx([4, 6.75])
+    assert cs.decrypt(encrypted[0, 2]) == pytest.approx(3.25)
+    with pytest.raises(IndexError):
+        _ = encrypted[2]
+    with pytest.raises(IndexError):
+        _ = encrypted[0, 0, 0]
+
+    assert cs.decrypt(encrypted.sum()) == pytest.approx(22.5)
+    assert cs.decrypt(encrypted.sum(axis=0)) == pytest.approx([5.5, 7, 10])
+    assert cs.decrypt(encrypted.sum(axis=-1)) == pytest.approx([6.75, 15.75])
+
+    # element-wise operations keep the shape
+    assert (encrypted * 2).shape == (2, 3)
+    assert cs.decrypt(encrypted + encrypted)[1] == pytest.approx([8, 10, 13.5])
+
+    logger.info("✅ Tensor shape, indexing and sum test succeeded")
+
+
+def test_numpy_tensors():
+    np = pytest.importorskip("numpy")
+
+    cs = build_cryptosystem("Paillier")
+
+    array = np.array([[1.005, -2.5, 0.0], [4, 5.25, -6.125]])
+    encrypted = cs.encrypt(array)
+    assert encrypted.shape == (2, 3)
+
+    restored = cs.decrypt(encrypted, as_numpy=True)
+    assert isinstance(restored, np.ndarray)
+    assert restored.shape == (2, 3)
+    assert np.allclose(restored, array, atol=1e-4)
+    assert cs.decrypt(encrypted)[1] == pytest.approx([4, 5.25, -6.125])
+
+    integers = np.arange(6, dtype=np.int32).reshape(3, 2)
+    assert np.allclose(cs.decrypt(cs.encrypt(integers), as_numpy=True), integers)
+    assert cs.decrypt(cs.encrypt(np.int64(7))) == 7
+
+    # dot product with a plain numpy vector
+    vector = cs.encrypt(np.array([1.5, 2.5, 3.5]))
+    assert cs.decrypt(vector @ np.array([1, 2, 3]))[0] == pytest.approx(17, abs=1e-2)
+
+    # vectorized encoding matches fractionize
+    modulo = cs.cs.plaintext_modulo
+    values = [1.005, 2.05, 0.5, 7.003005, 12.0]
+    encoder = FixedPointEncoder(modulo=modulo, precision=5)
+    dividends, abs_dividends, signs = encoder.encode_batch(np.array(values + [-2.5]))
+    for value, dividend in zip(values, dividends):
+        assert dividend == phe_utils.fractionize(value, modulo, precision=5)[0]
+    assert dividends[-1] == (-250000) % modulo
+    assert abs_dividends[-1] == 250000
+    assert signs == [1, 1, 1, 1, 1, -1]
+
+    with pytest.raises(ValueError, match="NaN"):
+        cs.encrypt(np.array([1.0, np.nan]))
+
+    logger.info("✅ Numpy tensors test succeeded")
+
+
+def test_signed_tensors(capsys):
+    cs = LightPHE(algorithm_name="Paillier", key_size=128, precision=3, signed=True)
+
+    t1 = [1.5, -2.25, 3, -4, 0]
+    t2 = [-2.5, 1.25, -3, 1, -1]
+
+    c1 = cs.encrypt(t1, silent=True)
+    c2 = cs.encrypt(t2, silent=True)
+    assert c1.signed is True
+
+    # negative items cost one ciphertext
+    assert all(f.dividend == f.abs_dividend and f.sign == 1 for f in c1.fractions)
+
+    capsys.readouterr()
+    assert cs.decrypt(c1) == pytest.approx(t1)
+    assert cs.decrypt(c1 + c2) == pytest.approx([a + b for a, b in zip(t1, t2)])
+    # mixed sign sums are exact, so no warnings are logged
+    assert "different signs" not in capsys.readouterr().out
+
+    assert cs.decrypt(c1 * -2) == pytest.approx([a * -2 for a in t1])
+    assert cs.decrypt(c1 * t2) == pytest.approx([a * b for a, b in zip(t1, t2)])
+    assert cs.decrypt(c1 @ t2)[0] == pytest.approx(sum(a * b for a, b in zip(t1, t2)))
+    assert cs.decrypt(c1.sum()) == pytest.approx(sum(t1))
+
+    unsigned = LightPHE(algorithm_name="Paillier", keys=cs.cs.keys, precision=3)
+    with pytest.raises(ValueError, match="Signed and unsigned"):
+        _ = c1 + unsigned.encrypt(t2, silent=True)
+
+    logger.info("✅ Signed tensors test succeeded")
+
+
+def test_signed_multiplicative_tensors():
+    cs = LightPHE(algorithm_name="RSA", key_size=128, precision=2, signed=True)
+
+    t1 = [1.5, -2.25, -3]
+    t2 = [-2, 1.5, -4]
+    c1 = cs.encrypt(t1, silent=True)
+    c2 = cs.encrypt(t2, silent=True)
+    assert cs.decrypt(c1 * c2) == pytest.approx([a * b for a, b in zip(t1, t2)])
+
+    logger.info("✅ Signed multiplicative tensors test succeeded")
+
+
+def test_parallel_sum():
+    # shared memory transport for integer ciphertexts
+    cs = LightPHE(algorithm_name="Paillier", key_size=128)
+    values = [cs.cs.encrypt(plaintext=i) for i in range(1, 11)]
+    total = parallel_sum(values=values, cs=cs.cs, num_workers=3)
+    assert cs.cs.decrypt(total) == 55
+
+    # pairs are pickled to workers instead
+    cs = LightPHE(algorithm_name="Exponential-ElGamal", key_size=128)
+    values = [cs.cs.encrypt(plaintext=i) for i in range(1, 6)]
+    total = parallel_sum(values=values, cs=cs.cs, num_workers=2)
+    assert cs.cs.decrypt(total) == 15
+
+    logger.info("✅ Parallel sum test succeeded")